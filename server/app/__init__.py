@@ -7,6 +7,7 @@ from flask_bcrypt import Bcrypt
 from flask_jwt_extended import JWTManager
 from sqlalchemy import MetaData
 from app.config import config
+from app.replica import RoutingSession
 
 # Metadata naming convention for database constraints
 metadata = MetaData(naming_convention={
@@ -15,34 +16,50 @@ metadata = MetaData(naming_convention={
 })
 
 # Initialize Extensions
-db = SQLAlchemy(metadata=metadata)
+db = SQLAlchemy(metadata=metadata, session_options={"class_": RoutingSession})
 migrate = Migrate()
 bcrypt = Bcrypt()
 jwt = JWTManager()
 
 def create_app(config_name='default'):
-    static_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'client', 'dist')
-
-    app = Flask(__name__,
-                static_folder=static_dir,
-                static_url_path='/')
-    app.config.from_object(config[config_name])
+    # The client build is served by app.static_assets rather than Flask's static route
+    app = Flask(__name__, static_folder=None)
+    app.config.from_object(config[config_name] if isinstance(config_name, str) else config_name)
 
+    from app.json_provider import configure_json
+    configure_json(app)
 
+    from app.database import configure_engine
+    configure_engine(app)
     db.init_app(app)
     migrate.init_app(app, db)
     bcrypt.init_app(app)
     jwt.init_app(app)
     CORS(app)
 
+    from app.instrumentation import instrumentation
+    instrumentation.init_app(app)
+    from app.database import database
+    database.init_app(app)
+    from app.replica import replica_routing
+    replica_routing.init_app(app)
+    from app.cache import cache
+    cache.init_app(app)
+    from app.images import images
+    images.init_app(app)
+    from app.static_assets import static_assets
+    static_assets.init_app(app)
+    from app.passwords import passwords
+    passwords.init_app(app)
+
     with app.app_context():
         # JWT Blocklist Configuration
-        from app.models.token_blocklist import TokenBlocklist
+        from app.revocation import revocations
+        revocations.init_app(app)
+
         @jwt.token_in_blocklist_loader
         def check_if_token_in_blocklist(jwt_header, jwt_payload):
-            jti = jwt_payload["jti"]
-            token = db.session.query(TokenBlocklist.id).filter_by(jti=jti).scalar()
-            return token is not None
+            return revocations.is_revoked(jwt_payload["jti"])
 
         # API Blueprint Registration
         from app.routes.event_routes import event_bp
@@ -56,20 +73,29 @@ def create_app(config_name='default'):
         app.register_blueprint(auth_bp, url_prefix="/api")
         app.register_blueprint(user_bp, url_prefix="/api/users")
         app.register_blueprint(ticket_bp, url_prefix="/api/tickets")
+
+        from app.stats import stats_cli
+        from app.bulk import events_cli
+        from app.static_assets import assets_cli
+        from app.passwords import passwords_cli
+        from app.datagen import seed_cli
+        app.cli.add_command(stats_cli)
+        app.cli.add_command(events_cli)
+        app.cli.add_command(assets_cli)
+        app.cli.add_command(passwords_cli)
+        app.cli.add_command(seed_cli)
         
         # Route for serving uploaded files
         @app.route('/uploads/<path:filename>')
         def uploaded_file(filename):
             upload_dir = os.path.join(os.path.dirname(app.root_path), 'uploads')
-            return send_from_directory(upload_dir, filename)
+            # Upload names are unique and never rewritten in place
+            return send_from_directory(upload_dir, filename, max_age=31536000)
 
 
         @app.route('/', defaults={'path': ''})
         @app.route('/<path:path>')
         def serve(path):
-            if path != "" and os.path.exists(os.path.join(app.static_folder, path)):
-                return send_from_directory(app.static_folder, path)
-            else:
-                return send_from_directory(app.static_folder, 'index.html')
+            return static_assets.serve(path or 'index.html')
 
     return app
@@ -0,0 +1,279 @@
+"""
+Bulk import and export of events as CSV or NDJSON streams.
+
+Imports are read lazily, validated row by row and written in batches. Each
+batch costs one slug lookup, one executemany INSERT for the events, one
+SELECT mapping their (unique) slugs back to ids and one executemany for their
+categories, whatever the batch size.
+Exports walk the events table with yield_per and emit one line per event.
+"""
+import csv
+import io
+import json
+import re
+import uuid
+from datetime import datetime
+import click
+from flask.cli import with_appcontext
+from sqlalchemy import insert, select
+from app import db
+from app.models.event import Event
+from app.models.category import Category
+from app.models.associations import event_categories
+
+FORMATS = ("csv", "ndjson")
+EXPORT_FIELDS = [
+    "title", "description", "short_description", "date", "end_date", "location", "venue",
+    "price", "currency", "image_url", "is_active", "max_attendees", "slug", "organizer_id", "categories",
+]
+REQUIRED_FIELDS = ("title", "date", "location")
+MAX_REPORTED_ERRORS = 100
+# Slugs leave room for the "-xxxxxx" suffix added on a collision
+MAX_SLUG_LENGTH = Event.__table__.c.slug.type.length - 7
+
+
+class RowError(ValueError):
+    pass
+
+
+def read_rows(stream, fmt):
+    """Yields (line_number, row dict) from a text stream without reading it all into memory."""
+    if fmt == "csv":
+        reader = csv.DictReader(stream)
+        for row in reader:
+            yield reader.line_num, row
+    elif fmt == "ndjson":
+        for line_number, line in enumerate(stream, start=1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                row = json.loads(line)
+            except json.JSONDecodeError as e:
+                yield line_number, RowError(f"Invalid JSON: {e.msg}")
+                continue
+            yield line_number, row if isinstance(row, dict) else RowError("Expected a JSON object")
+    else:
+        raise ValueError(f"Unsupported format: '{fmt}'. Use one of {FORMATS}")
+
+
+def _parse_datetime(value, field):
+    try:
+        return datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except ValueError:
+        raise RowError(f"Invalid {field}: '{value}'")
+
+
+def _parse_bool(value):
+    if isinstance(value, bool):
+        return value
+    return str(value).strip().lower() not in ("false", "0", "no", "")
+
+
+def _split_categories(value):
+    if not value:
+        return []
+    if isinstance(value, list):
+        return [str(v).strip() for v in value if str(v).strip()]
+    return [v.strip() for v in re.split(r"[;|]", value) if v.strip()]
+
+
+def validate_row(row):
+    """Converts a raw CSV/NDJSON row into Event column values plus category keys."""
+    row = {k: v for k, v in row.items() if v not in (None, "")}
+    missing = [field for field in REQUIRED_FIELDS if field not in row]
+    if missing:
+        raise RowError(f"Missing required fields: {', '.join(missing)}")
+
+    try:
+        values = {
+            "title": str(row["title"])[:200],
+            "description": row.get("description"),
+            "short_description": row.get("short_description") or (row.get("description") or "")[:150],
+            "date": _parse_datetime(row["date"], "date"),
+            "end_date": _parse_datetime(row["end_date"], "end_date") if "end_date" in row else None,
+            "location": row["location"],
+            "venue": row.get("venue"),
+            "price": float(row.get("price", 0.0)),
+            "currency": row.get("currency", "KSH"),
+            "image_url": row.get("image_url"),
+            "is_active": _parse_bool(row.get("is_active", True)),
+            "max_attendees": int(row["max_attendees"]) if "max_attendees" in row else None,
+            "organizer_id": int(row["organizer_id"]) if "organizer_id" in row else None,
+        }
+    except RowError:
+        raise
+    except (TypeError, ValueError) as e:
+        raise RowError(f"Invalid value: {e}")
+    # Provided slugs are normalized like generated ones, so "Tech Summit" and "tech-summit" collide
+    slug = Event.slugify(str(row.get("slug", "")))[:MAX_SLUG_LENGTH].rstrip("-")
+    values["slug"] = slug or Event.slugify(values["title"])[:MAX_SLUG_LENGTH].rstrip("-")
+    return values, _split_categories(row.get("categories"))
+
+
+class EventImporter:
+    def __init__(self, organizer_id=None, batch_size=1000):
+        self.organizer_id = organizer_id
+        self.batch_size = batch_size
+        self.imported = 0
+        self.batches = 0
+        self.errors = []
+        self.error_count = 0
+        self._used_slugs = set()
+        self._categories = None
+
+    def _category_ids(self):
+        if self._categories is None:
+            self._categories = {}
+            for category_id, name, slug in db.session.query(Category.id, Category.name, Category.slug):
+                self._categories[slug.lower()] = category_id
+                self._categories[name.lower()] = category_id
+        return self._categories
+
+    def _record_error(self, line_number, message):
+        self.error_count += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append({"line": line_number, "error": message})
+
+    def run(self, rows):
+        batch = []
+        for line_number, row in rows:
+            if isinstance(row, RowError):
+                self._record_error(line_number, str(row))
+                continue
+            try:
+                values, category_keys = validate_row(row)
+                category_ids = []
+                for key in category_keys:
+                    category_id = self._category_ids().get(key.lower())
+                    if category_id is None:
+                        raise RowError(f"Unknown category: '{key}'")
+                    category_ids.append(category_id)
+            except RowError as e:
+                self._record_error(line_number, str(e))
+                continue
+
+            if self.organizer_id is not None:
+                values["organizer_id"] = self.organizer_id
+            batch.append((values, category_ids))
+            if len(batch) >= self.batch_size:
+                self._flush(batch)
+                batch = []
+        if batch:
+            self._flush(batch)
+        return self.summary()
+
+    def _flush(self, batch):
+        # Resolve slug collisions against the table and earlier rows with one query
+        wanted = {values["slug"] for values, _ in batch}
+        taken = {slug for (slug,) in db.session.query(Event.slug).filter(Event.slug.in_(wanted))}
+        taken |= self._used_slugs
+        for values, _ in batch:
+            if values["slug"] in taken:
+                values["slug"] = f"{values['slug']}-{uuid.uuid4().hex[:6]}"
+            taken.add(values["slug"])
+            self._used_slugs.add(values["slug"])
+
+        # Ordered RETURNING forces row-at-a-time inserts on some drivers, so
+        # insert in bulk and map the unique slugs back to their new ids instead
+        db.session.execute(insert(Event), [values for values, _ in batch])
+        slugs = [values["slug"] for values, _ in batch]
+        ids = dict(db.session.query(Event.slug, Event.id).filter(Event.slug.in_(slugs)))
+
+        links = [
+            {"event_id": ids[values["slug"]], "category_id": category_id}
+            for values, category_ids in batch
+            for category_id in dict.fromkeys(category_ids)
+        ]
+        if links:
+            db.session.execute(insert(event_categories), links)
+        db.session.commit()
+
+        self.imported += len(batch)
+        self.batches += 1
+
+    def summary(self):
+        return {
+            "imported": self.imported,
+            "batches": self.batches,
+            "failed": self.error_count,
+            "errors": self.errors,
+        }
+
+
+def export_events(fmt, query=None, chunk_size=1000):
+    """Yields the events selected by `query` as CSV or NDJSON lines."""
+    if fmt not in FORMATS:
+        raise ValueError(f"Unsupported format: '{fmt}'. Use one of {FORMATS}")
+    query = query if query is not None else select(Event).order_by(Event.id)
+
+    if fmt == "csv":
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=EXPORT_FIELDS)
+        writer.writeheader()
+        yield buffer.getvalue()
+
+    result = db.session.execute(query.execution_options(yield_per=chunk_size))
+    for events in result.scalars().partitions():
+        ids = [event.id for event in events]
+        categories = {}
+        for event_id, slug in db.session.execute(
+            select(event_categories.c.event_id, Category.slug)
+            .join(Category, Category.id == event_categories.c.category_id)
+            .where(event_categories.c.event_id.in_(ids))
+        ):
+            categories.setdefault(event_id, []).append(slug)
+
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=EXPORT_FIELDS) if fmt == "csv" else None
+        for event in events:
+            row = {field: getattr(event, field) for field in EXPORT_FIELDS if field != "categories"}
+            for field in ("date", "end_date"):
+                row[field] = row[field].isoformat() if row[field] else None
+            if writer:
+                row["categories"] = ";".join(categories.get(event.id, []))
+                writer.writerow(row)
+            else:
+                row["categories"] = categories.get(event.id, [])
+                buffer.write(json.dumps(row) + "\n")
+        yield buffer.getvalue()
+
+
+def format_from_filename(filename):
+    return "csv" if filename.lower().endswith(".csv") else "ndjson"
+
+
+@click.group("events")
+def events_cli():
+    """Bulk event operations."""
+
+
+@events_cli.command("import")
+@click.argument("file", type=click.File("r", encoding="utf-8"))
+@click.option("--format", "fmt", type=click.Choice(FORMATS), default=None, help="Defaults to the file extension.")
+@click.option("--organizer-id", type=int, default=None, help="Owner for every imported event.")
+@click.option("--batch-size", type=int, default=1000, show_default=True)
+@with_appcontext
+def import_command(file, fmt, organizer_id, batch_size):
+    """Import events from a CSV or NDJSON file ('-' for stdin)."""
+    fmt = fmt or format_from_filename(file.name)
+    summary = EventImporter(organizer_id=organizer_id, batch_size=batch_size).run(read_rows(file, fmt))
+
+    from app.cache import cache
+    cache.invalidate()
+    click.echo(f"Imported {summary['imported']} events in {summary['batches']} batches.")
+    for error in summary["errors"]:
+        click.echo(f"  line {error['line']}: {error['error']}", err=True)
+    if summary["failed"]:
+        click.echo(f"{summary['failed']} rows failed validation.", err=True)
+
+
+@events_cli.command("export")
+@click.argument("file", type=click.File("w", encoding="utf-8"), default="-")
+@click.option("--format", "fmt", type=click.Choice(FORMATS), default=None, help="Defaults to the file extension.")
+@with_appcontext
+def export_command(file, fmt):
+    """Export every event to a CSV or NDJSON file (stdout by default)."""
+    fmt = fmt or format_from_filename(file.name)
+    for chunk in export_events(fmt):
+        file.write(chunk)
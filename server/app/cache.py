@@ -0,0 +1,230 @@
+"""
+Response cache for hot public endpoints.
+
+Entries are keyed by host, request path and query args and expire after a TTL.
+The host is part of the key because bodies embed absolute image URLs. Any
+write that can change cached listings must call `cache.invalidate()` after
+committing. Each invalidation starts a new generation; a response is stored
+under the generation read before its view ran, so one computed before an
+invalidation is never served after it.
+
+Cached views run on the primary when they miss. A replica read could predate
+the last invalidation, and storing it would keep serving that stale response
+to every client until the TTL ran out. Misses are rare, so this costs the
+primary little.
+
+The in-memory backend is per process: an invalidation only reaches the worker
+that handled the write. It is meant for development and single-worker
+deployments. CACHE_TYPE defaults to "redis" whenever CACHE_REDIS_URL is set.
+"""
+import json
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+from urllib.parse import urlencode
+from flask import current_app, g, request
+from app.replica import primary_sticky
+
+
+class CacheBackend:
+    """Base class for cache backends; tracks hit and miss counters."""
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self._counter_lock = threading.Lock()
+
+    def get(self, key):
+        value = self._get(key)
+        with self._counter_lock:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return value
+
+    def stats(self):
+        with self._counter_lock:
+            return {"backend": type(self).__name__, "hits": self.hits, "misses": self.misses}
+
+    def _get(self, key):
+        raise NotImplementedError
+
+    def generation(self):
+        """The current generation; clear() moves to the next one."""
+        raise NotImplementedError
+
+    def set(self, key, value, timeout, generation=None):
+        """Stores `value`, unless `generation` was given and has since been cleared."""
+        raise NotImplementedError
+
+    def clear(self):
+        raise NotImplementedError
+
+
+class NullBackend(CacheBackend):
+    """Never stores anything; used when caching is disabled."""
+
+    def _get(self, key):
+        return None
+
+    def generation(self):
+        return 0
+
+    def set(self, key, value, timeout, generation=None):
+        pass
+
+    def clear(self):
+        pass
+
+
+class MemoryBackend(CacheBackend):
+    """
+    Thread-safe in-process LRU cache with per-entry expiry. Invalidations are not
+    shared between processes, so use it with a single worker only.
+    """
+
+    def __init__(self, max_entries=512):
+        super().__init__()
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def _get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def generation(self):
+        with self._lock:
+            return self._generation
+
+    def set(self, key, value, timeout, generation=None):
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+            self._entries[key] = (time.monotonic() + timeout, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class RedisBackend(CacheBackend):
+    """
+    Shares entries across workers through Redis. Keys carry a generation number,
+    so clear() is a single INCR; superseded entries age out through their TTL.
+    Eviction is left to the server's maxmemory-policy.
+    """
+
+    def __init__(self, url=None, client=None, prefix="response-cache:"):
+        super().__init__()
+        if client is None:
+            import redis  # optional dependency, only needed for this backend
+            client = redis.Redis.from_url(url)
+        self._client = client
+        self._prefix = prefix
+
+    def generation(self):
+        return int(self._client.get(f"{self._prefix}generation") or 0)
+
+    def _key(self, key, generation=None):
+        if generation is None:
+            generation = self.generation()
+        return f"{self._prefix}{generation}:{key}"
+
+    def _get(self, key):
+        raw = self._client.get(self._key(key))
+        return json.loads(raw) if raw is not None else None
+
+    def set(self, key, value, timeout, generation=None):
+        # A superseded generation's key is never read again, so a stale value just expires
+        self._client.set(self._key(key, generation), json.dumps(value), ex=int(timeout))
+
+    def clear(self):
+        self._client.incr(f"{self._prefix}generation")
+
+
+def create_backend(config):
+    cache_type = config.get("CACHE_TYPE") or ("redis" if config.get("CACHE_REDIS_URL") else "memory")
+    if cache_type == "null":
+        return NullBackend()
+    if cache_type == "redis":
+        return RedisBackend(url=config["CACHE_REDIS_URL"])
+    if cache_type == "memory":
+        return MemoryBackend(max_entries=config.get("CACHE_MAX_ENTRIES", 512))
+    raise ValueError(f"Unknown CACHE_TYPE: '{cache_type}'")
+
+
+class ResponseCache:
+    def __init__(self, app=None):
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.extensions["response_cache"] = create_backend(app.config)
+
+    @property
+    def backend(self):
+        return current_app.extensions["response_cache"]
+
+    def invalidate(self):
+        """Drops every cached response; call after committing a write to cached data."""
+        self.backend.clear()
+
+    def stats(self):
+        return self.backend.stats()
+
+    def cached(self, timeout=None):
+        """Caches successful JSON responses of a view, keyed by host, path and query args."""
+        def decorator(fn):
+            @wraps(fn)
+            def wrapper(*args, **kwargs):
+                if primary_sticky():
+                    # This client just wrote; cached entries may predate the write
+                    return fn(*args, **kwargs)
+                backend = self.backend
+                key = f"{request.host_url}{request.path.lstrip('/')}?{urlencode(sorted(request.args.items(multi=True)))}"
+
+                entry = backend.get(key)
+                if entry is not None:
+                    response = current_app.response_class(
+                        entry["body"], status=entry["status"], mimetype=entry["mimetype"]
+                    )
+                    response.headers["X-Cache"] = "HIT"
+                    return response
+
+                # Read before the view runs: a write committed meanwhile makes this response stale
+                generation = backend.generation()
+                # What is stored is shared by every client, so it must not lag behind the primary
+                g.read_replica = False
+                response = current_app.make_response(fn(*args, **kwargs))
+                if response.status_code == 200:
+                    backend.set(key, {
+                        "body": response.get_data(as_text=True),
+                        "status": response.status_code,
+                        "mimetype": response.mimetype,
+                    }, timeout or current_app.config.get("CACHE_DEFAULT_TIMEOUT", 60), generation)
+                response.headers["X-Cache"] = "MISS"
+                return response
+            return wrapper
+        return decorator
+
+
+cache = ResponseCache()
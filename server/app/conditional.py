@@ -0,0 +1,83 @@
+"""
+HTTP validators and Cache-Control policies for public reads.
+
+Routes compute a cheap validator first (an aggregate over `updated_at`, or the
+ids and timestamps of one page) and pass the expensive part of the response to
+`conditional_response` as a callable. If the client's If-None-Match or
+If-Modified-Since still matches, the answer is 304 Not Modified and the callable
+never runs, so nothing else is loaded or serialized.
+"""
+import hashlib
+from datetime import timezone
+from functools import wraps
+from flask import current_app, make_response, request
+
+
+def make_etag(*parts):
+    """
+    Hashes `parts` together with the host, path and sorted query args. The host
+    is included because response bodies embed absolute image URLs.
+    """
+    key = (request.host_url, request.path, sorted(request.args.items(multi=True))) + parts
+    return hashlib.sha1(repr(key).encode("utf-8")).hexdigest()[:32]
+
+
+def http_time(value):
+    """Normalizes a (naive UTC) timestamp to the whole-second precision of HTTP dates."""
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc).replace(microsecond=0)
+
+
+def is_not_modified(etag, last_modified=None):
+    # If-None-Match takes precedence over If-Modified-Since (RFC 9110, 13.2.2)
+    if request.if_none_match:
+        return request.if_none_match.contains_weak(etag)
+    if last_modified is not None and request.if_modified_since is not None:
+        return last_modified <= request.if_modified_since
+    return False
+
+
+def apply_cache_policy(response, policy):
+    header = current_app.config.get("HTTP_CACHE_CONTROL", {}).get(policy)
+    if header:
+        response.headers["Cache-Control"] = header
+    return response
+
+
+def conditional_response(build, etag, last_modified=None, weak=False, policy=None):
+    """
+    Returns 304 if the request's validators match `etag`/`last_modified`, otherwise
+    the response produced by calling `build()`. Both carry the validators and the
+    Cache-Control header of `policy`.
+    """
+    last_modified = http_time(last_modified)
+    if is_not_modified(etag, last_modified):
+        response = current_app.response_class(status=304)
+    else:
+        response = make_response(build())
+    response.set_etag(etag, weak=weak)
+    if last_modified is not None:
+        response.last_modified = last_modified
+    return apply_cache_policy(response, policy)
+
+
+def cache_control(policy):
+    """
+    Applies `policy` to successful responses of a view and answers conditional
+    requests with a weak ETag of the body. Meant for views that are already
+    served from the response cache, where hashing the body is cheap.
+    """
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            response = make_response(fn(*args, **kwargs))
+            if response.status_code == 200:
+                response.add_etag(overwrite=False, weak=True)
+                apply_cache_policy(response, policy)
+                response.make_conditional(request)
+            return response
+        return wrapper
+    return decorator
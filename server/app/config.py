@@ -10,16 +10,42 @@ class Config:
     BASE_DIR = os.path.abspath(os.path.dirname(__file__))
 
     UPLOAD_FOLDER = os.path.join(BASE_DIR, '..', 'uploads')
+    # Built client (npm run build); indexed once at startup
+    CLIENT_DIST_FOLDER = os.environ.get("CLIENT_DIST_FOLDER") or os.path.join(BASE_DIR, '..', '..', 'client', 'dist')
 
     uri = os.environ.get("DATABASE_URL")
     if uri and uri.startswith("postgres://"):
         uri = uri.replace("postgres://", "postgresql://", 1)
+    replica_uri = os.environ.get("REPLICA_DATABASE_URL")
+    if replica_uri and replica_uri.startswith("postgres://"):
+        replica_uri = replica_uri.replace("postgres://", "postgresql://", 1)
 
     SQLALCHEMY_DATABASE_URI = uri or (
         "sqlite:///" + os.path.join(BASE_DIR, "..", "instance", "app.db")
     )
     SQLALCHEMY_TRACK_MODIFICATIONS = False
 
+    # Engine and pool settings (see app.database); the pool applies to PostgreSQL and file-backed SQLite
+    DB_POOL_SIZE = int(os.environ.get("DB_POOL_SIZE", 5))
+    DB_MAX_OVERFLOW = int(os.environ.get("DB_MAX_OVERFLOW", 10))
+    DB_POOL_TIMEOUT = 30
+    DB_POOL_RECYCLE = 1800
+    DB_POOL_PRE_PING = True
+    # PostgreSQL only; None leaves statements unbounded
+    DB_STATEMENT_TIMEOUT_MS = None
+    # Optional read replica for GET requests to these blueprints (see app.replica)
+    REPLICA_DATABASE_URI = replica_uri
+    REPLICA_READ_BLUEPRINTS = ("events", "category_bp", "user_bp")
+    # How long a client keeps reading from the primary after it writes; should exceed replica lag
+    REPLICA_STICKY_SECONDS = 5
+    SQLITE_PRAGMAS = {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "busy_timeout": 5000,
+        "mmap_size": 256 * 1024 * 1024,
+        "cache_size": -64000,  # KiB
+    }
+
     # Flask secret key
     SECRET_KEY = os.environ.get("SECRET_KEY") or "dev-secret-key-change-me"
 
@@ -29,9 +55,48 @@ class Config:
     JWT_REFRESH_TOKEN_EXPIRES = timedelta(days=30)
     JWT_BLACKLIST_ENABLED = True
     JWT_BLACKLIST_TOKEN_CHECKS = ["access", "refresh"]
-
-    # JSON response settings
+    # How often each worker pulls revocations made by other workers, and how far each pull
+    # re-reads before the previous one (longer than any logout transaction takes to commit)
+    JWT_REVOCATION_SYNC_SECONDS = 5
+    JWT_REVOCATION_SYNC_OVERLAP_SECONDS = 60
+
+    # Password hashing (see app.passwords); BCRYPT_LOG_ROUNDS is the bcrypt cost factor
+    BCRYPT_LOG_ROUNDS = int(os.environ.get("BCRYPT_LOG_ROUNDS", 12))
+    PASSWORD_HASH_WORKERS = 2
+    PASSWORD_HASH_MAX_PENDING = 16
+    PASSWORD_HASH_TIMEOUT = 10
+
+    # Request/SQL instrumentation served on /metrics (see app.instrumentation)
+    INSTRUMENTATION_ENABLED = True
+    SLOW_QUERY_SECONDS = 0.1
+    N_PLUS_ONE_THRESHOLD = 5
+    METRICS_TOKEN = os.environ.get("METRICS_TOKEN")
+    PROFILER_ENABLED = os.environ.get("PROFILER_ENABLED", "").lower() in ("1", "true")
+    PROFILER_TOKEN = os.environ.get("PROFILER_TOKEN")
+
+    # JSON response settings (see app.json_provider): "auto", "orjson" or "stdlib"
+    JSON_PROVIDER = os.environ.get("JSON_PROVIDER", "auto")
     JSON_SORT_KEYS = False
+    # Raise instead of logging when a serializer lazy-loads a relationship (see app.serializers)
+    SERIALIZER_RAISE_ON_LAZY_LOAD = False
+
+    # Response cache for hot public endpoints ("memory", "redis" or "null"). The memory
+    # backend is per process, so it is only the default without a Redis URL.
+    CACHE_REDIS_URL = os.environ.get("CACHE_REDIS_URL")
+    CACHE_TYPE = os.environ.get("CACHE_TYPE") or ("redis" if CACHE_REDIS_URL else "memory")
+    CACHE_DEFAULT_TIMEOUT = 60
+    CACHE_MAX_ENTRIES = 512
+
+    # Cache-Control for public reads; clients and CDNs revalidate with ETags afterwards
+    HTTP_CACHE_CONTROL = {
+        "event": "public, max-age=60, stale-while-revalidate=300",
+        "listing": "public, max-age=30, stale-while-revalidate=60",
+        "category": "public, max-age=300, stale-while-revalidate=3600",
+    }
+
+    # Background rendering of WebP image variants for uploads
+    IMAGE_WORKERS = 2
+    IMAGE_WEBP_QUALITY = 80
 
 
 class DevelopmentConfig(Config):
@@ -40,14 +105,23 @@ class DevelopmentConfig(Config):
 
 class ProductionConfig(Config):
     DEBUG = False
+    DB_POOL_SIZE = int(os.environ.get("DB_POOL_SIZE", 10))
+    DB_MAX_OVERFLOW = int(os.environ.get("DB_MAX_OVERFLOW", 20))
+    DB_POOL_TIMEOUT = 10
+    DB_STATEMENT_TIMEOUT_MS = int(os.environ.get("DB_STATEMENT_TIMEOUT_MS", 15000))
 
 
 class TestConfig(Config):
     TESTING = True
     SQLALCHEMY_DATABASE_URI = "sqlite:///:memory:"
+    REPLICA_DATABASE_URI = None
     WTF_CSRF_ENABLED = False
     SECRET_KEY = "test-secret-key"
     JWT_SECRET_KEY = "test-jwt-secret-key"
+    CACHE_TYPE = "null"
+    BCRYPT_LOG_ROUNDS = 4
+    PASSWORD_HASH_WORKERS = 0
+    SERIALIZER_RAISE_ON_LAZY_LOAD = True
 
 
 
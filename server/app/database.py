@@ -0,0 +1,137 @@
+"""
+Engine and connection-pool configuration.
+
+`configure_engine(app)` runs before `db.init_app`. It turns the DB_* settings
+into SQLALCHEMY_ENGINE_OPTIONS for the configured backend; anything already set
+in SQLALCHEMY_ENGINE_OPTIONS takes precedence.
+
+- PostgreSQL and file-backed SQLite get a sized, recycled and pre-pinged queue
+  pool.
+- PostgreSQL connections also get a per-statement timeout.
+- In-memory SQLite keeps Flask-SQLAlchemy's single static connection.
+
+`database.init_app(app)` runs after it. It applies SQLITE_PRAGMAS to every new
+SQLite connection: WAL lets gunicorn workers read while one of them writes,
+and busy_timeout makes writers queue for the lock instead of failing. It also
+publishes pool metrics: how long each checkout waited for a connection, and
+the pool's current size, checked-out count and overflow.
+"""
+import time
+from functools import partial
+from flask import current_app, has_app_context
+from sqlalchemy import event as sa_event
+from sqlalchemy.engine import make_url
+from sqlalchemy.pool import QueuePool
+from app import db
+from app.replica import REPLICA_BIND
+
+CHECKOUT_WAIT_BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0)
+
+
+class TimedQueuePool(QueuePool):
+    """QueuePool that records how long each checkout waited for a connection."""
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            _observe_checkout_wait(time.perf_counter() - started)
+
+
+def _observe_checkout_wait(seconds):
+    if not has_app_context():
+        return
+    registry = current_app.extensions.get("metrics")
+    histogram = registry.get("db_pool_checkout_wait_seconds") if registry else None
+    if histogram is not None:
+        histogram.observe(seconds)
+
+
+def _is_memory_sqlite(url):
+    return url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:")
+
+
+def engine_options(config):
+    """SQLAlchemy engine options for the configured database URI."""
+    url = make_url(config["SQLALCHEMY_DATABASE_URI"])
+    options = {}
+    if not _is_memory_sqlite(url):
+        options.update(
+            poolclass=TimedQueuePool,
+            pool_size=config.get("DB_POOL_SIZE", 5),
+            max_overflow=config.get("DB_MAX_OVERFLOW", 10),
+            pool_timeout=config.get("DB_POOL_TIMEOUT", 30),
+            pool_recycle=config.get("DB_POOL_RECYCLE", 1800),
+            pool_pre_ping=config.get("DB_POOL_PRE_PING", True),
+        )
+    timeout = config.get("DB_STATEMENT_TIMEOUT_MS")
+    if url.get_backend_name() == "postgresql" and timeout:
+        options["connect_args"] = {"options": f"-c statement_timeout={int(timeout)}"}
+    return options
+
+
+def configure_engine(app):
+    """
+    Fills SQLALCHEMY_ENGINE_OPTIONS from the DB_* settings and registers
+    REPLICA_DATABASE_URI as the "replica" bind. Call before db.init_app.
+    """
+    options = engine_options(app.config)
+    options.update(app.config.get("SQLALCHEMY_ENGINE_OPTIONS") or {})
+    app.config["SQLALCHEMY_ENGINE_OPTIONS"] = options
+
+    replica_uri = app.config.get("REPLICA_DATABASE_URI")
+    if replica_uri:
+        binds = dict(app.config.get("SQLALCHEMY_BINDS") or {})
+        binds.setdefault(REPLICA_BIND, {
+            "url": replica_uri,
+            **engine_options({**app.config, "SQLALCHEMY_DATABASE_URI": replica_uri}),
+        })
+        app.config["SQLALCHEMY_BINDS"] = binds
+
+
+def _apply_pragmas(pragmas, dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    try:
+        for name, value in pragmas.items():
+            cursor.execute(f"PRAGMA {name}={value}")
+    finally:
+        cursor.close()
+
+
+def _pool_gauges():
+    pool = db.engine.pool
+    if not isinstance(pool, QueuePool):
+        return []
+    return [
+        ("db_pool_size", "gauge", "Connections the pool keeps open.", {(): pool.size()}),
+        ("db_pool_checked_out", "gauge", "Connections currently in use.", {(): pool.checkedout()}),
+        ("db_pool_overflow", "gauge", "Connections open beyond the pool size.", {(): max(0, pool.overflow())}),
+    ]
+
+
+class Database:
+    def __init__(self, app=None):
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        with app.app_context():
+            engines = list(db.engines.values())
+        # The replica mirrors the primary's schema; keep create_all/drop_all (and later
+        # apps without a replica) from visiting the empty metadata db.init_app made for it
+        if REPLICA_BIND in db.metadatas and not db.metadatas[REPLICA_BIND].tables:
+            del db.metadatas[REPLICA_BIND]
+        pragmas = app.config.get("SQLITE_PRAGMAS")
+        for engine in engines:
+            if engine.dialect.name == "sqlite" and pragmas:
+                sa_event.listen(engine, "connect", partial(_apply_pragmas, dict(pragmas)))
+
+        registry = app.extensions.get("metrics")
+        if registry is not None:
+            registry.histogram("db_pool_checkout_wait_seconds", "Time spent waiting for a pooled connection.",
+                               buckets=CHECKOUT_WAIT_BUCKETS)
+            registry.add_collector(_pool_gauges)
+
+
+database = Database()
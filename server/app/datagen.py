@@ -0,0 +1,341 @@
+"""
+Synthetic data generator for staging and performance testing.
+
+`flask seed generate --scale full` fills an empty schema with users, events,
+category links, tickets and the organizer rollups built from them. Everything
+is drawn from one seeded RNG, so the same seed and scale always produce the
+same rows. Rows are streamed in batches: COPY on PostgreSQL, executemany
+INSERTs elsewhere. The ORM is bypassed, and every user shares one password
+hash, so bcrypt runs once rather than once per user.
+
+The distributions are shaped after real ticketing data:
+
+- a few prolific organizers host most events
+- categories and cities differ in popularity
+- most events are upcoming, clustered in the next two months on weekend evenings
+- prices are log-normal around a per-category median, and some events are free
+- ticket sales follow a heavy-tailed popularity curve, so a handful of events
+  sell out while most sell a few tickets
+- purchases bunch up as the event approaches
+"""
+import csv
+import io
+import math
+import random
+import time
+from datetime import datetime, timedelta
+import click
+from flask.cli import with_appcontext
+from sqlalchemy import delete, func, insert, select, text
+from app import db
+from app.models.associations import event_categories
+from app.models.category import Category
+from app.models.event import Event
+from app.models.ticket import Ticket
+from app.models.user import User
+from app.passwords import passwords
+from app.seed import CATEGORIES
+from app.stats import rebuild_organizer_stats
+
+SCALES = {
+    "tiny": {"users": 60, "events": 200, "tickets": 1_000},
+    "small": {"users": 2_000, "events": 5_000, "tickets": 50_000},
+    "medium": {"users": 10_000, "events": 25_000, "tickets": 250_000},
+    "full": {"users": 50_000, "events": 100_000, "tickets": 1_000_000},
+}
+DEFAULT_PASSWORD = "password123"
+ORGANIZER_SHARE = 0.02
+BATCH_SIZE = 5_000
+
+FIRST_NAMES = [
+    "Wanjiku", "Achieng", "Njeri", "Akinyi", "Wambui", "Nafula", "Chebet", "Moraa", "Zawadi", "Amani",
+    "Kamau", "Otieno", "Mwangi", "Odhiambo", "Kiprop", "Mutua", "Baraka", "Juma", "Omondi", "Kibet",
+]
+LAST_NAMES = [
+    "Kamau", "Otieno", "Mwangi", "Wanjiru", "Ochieng", "Kiptoo", "Mutiso", "Njoroge", "Onyango", "Cheruiyot",
+    "Wafula", "Kariuki", "Muthoni", "Barasa", "Nyambura", "Korir", "Achola", "Gitau", "Were", "Ndungu",
+]
+# city -> (weight, venues)
+LOCATIONS = {
+    "Nairobi": (45, ["KICC", "Uhuru Gardens", "Carnivore Grounds", "Nyayo Stadium", "Sarit Expo Centre"]),
+    "Mombasa": (15, ["Fort Jesus", "Mombasa Sports Club", "Nyali Beach Grounds"]),
+    "Kisumu": (10, ["Jomo Kenyatta Sports Ground", "Kisumu Yacht Club"]),
+    "Nakuru": (10, ["Afraha Stadium", "Nakuru Athletic Club"]),
+    "Eldoret": (7, ["Kipchoge Keino Stadium", "Eldoret Sports Club"]),
+    "Naivasha": (5, ["Lake Naivasha Resort", "Camp Carnelleys"]),
+    "Malindi": (4, ["Malindi Beach Grounds"]),
+    "Thika": (4, ["Thika Stadium"]),
+}
+# slug -> (popularity weight, median price, share of free events, start hours, title nouns)
+CATEGORY_PROFILES = {
+    "music-concerts": (25, 2000, 0.05, (18, 19, 20, 21), ["Jazz Festival", "Live Concert", "Gospel Night", "Afrobeats Party", "Acoustic Session"]),
+    "technology": (15, 3000, 0.25, (9, 10, 14), ["Tech Summit", "Hackathon", "Developer Meetup", "AI Workshop", "Startup Pitch"]),
+    "sports-fitness": (12, 1000, 0.15, (7, 8, 15), ["Marathon", "Rugby Sevens", "Fun Run", "Football Derby", "Cycling Challenge"]),
+    "business-networking": (10, 5000, 0.1, (8, 9, 17), ["Business Forum", "Networking Breakfast", "Investor Summit", "Leadership Expo"]),
+    "arts-culture": (12, 1000, 0.2, (10, 14, 19), ["Art Exhibition", "Theatre Night", "Cultural Festival", "Film Screening", "Poetry Slam"]),
+    "food-drink": (12, 2500, 0.05, (12, 13, 18), ["Food Festival", "Wine Tasting", "Nyama Choma Fest", "Coffee Expo"]),
+    "education-workshops": (8, 1500, 0.3, (9, 10, 14), ["Masterclass", "Training Workshop", "Career Fair", "Coding Bootcamp"]),
+    "community-social": (6, 500, 0.4, (10, 15, 18), ["Charity Walk", "Community Fair", "Comedy Night", "Book Club Meetup"]),
+}
+TITLE_PREFIXES = ["Annual", "Grand", "Summer", "Weekend", "Premier", "International", "Sunset", "Coastal", "Highland", "Capital"]
+# tickets bought per order -> weight
+QUANTITY_WEIGHTS = {1: 55, 2: 28, 3: 8, 4: 6, 5: 2, 6: 1}
+
+
+def search_terms():
+    """Words that appear in generated titles, for search workloads."""
+    words = set(LOCATIONS) | set(TITLE_PREFIXES)
+    for *_, nouns in CATEGORY_PROFILES.values():
+        words.update(word for noun in nouns for word in noun.split())
+    return sorted(word for word in words if len(word) >= 3)
+
+
+class BatchWriter:
+    """Writes lists of row dicts to a table: COPY on PostgreSQL, executemany elsewhere."""
+
+    def __init__(self, batch_size=BATCH_SIZE):
+        self.batch_size = batch_size
+        self.connection = db.session.connection()
+        self.copy = self.connection.dialect.name == "postgresql"
+        self.rows_written = 0
+
+    def write(self, table, rows):
+        for start in range(0, len(rows), self.batch_size):
+            batch = rows[start:start + self.batch_size]
+            if self.copy:
+                self._copy(table, batch)
+            else:
+                self.connection.execute(insert(table), batch)
+            self.rows_written += len(batch)
+
+    def _copy(self, table, rows):
+        columns = list(rows[0])
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for row in rows:
+            writer.writerow([row[column] for column in columns])
+        buffer.seek(0)
+        cursor = self.connection.connection.cursor()
+        try:
+            cursor.copy_expert(f"COPY {table.name} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)", buffer)
+        finally:
+            cursor.close()
+
+
+class Generator:
+    def __init__(self, users, events, tickets, seed=0, now=None, password=DEFAULT_PASSWORD, batch_size=BATCH_SIZE):
+        if users < 2 or events < 1 or tickets < 0:
+            raise ValueError("Need at least two users and one event")
+        self.users = users
+        self.events = events
+        self.tickets = tickets
+        self.rng = random.Random(seed)
+        self.now = (now or datetime.utcnow()).replace(microsecond=0)
+        self.password = password
+        self.batch_size = batch_size
+        self.organizer_count = max(1, int(users * ORGANIZER_SHARE))
+        self.first_attendee = self.organizer_count + 1
+
+    def run(self):
+        """Writes every table and the organizer rollups. Does not commit."""
+        writer = BatchWriter(self.batch_size)
+        category_ids = self._category_ids()
+        self._write_users(writer)
+        ticket_count = self._write_events(writer, category_ids)
+        self._reset_sequences()
+        rebuild_organizer_stats()
+        return {"users": self.users, "events": self.events, "tickets": ticket_count, "rows": writer.rows_written}
+
+    def _category_ids(self):
+        existing = dict(db.session.execute(select(Category.slug, Category.id)).all())
+        missing = [category for category in CATEGORIES if category["slug"] not in existing]
+        if missing:
+            db.session.execute(insert(Category), missing)
+            existing = dict(db.session.execute(select(Category.slug, Category.id)).all())
+        return {slug: existing[slug] for slug in CATEGORY_PROFILES if slug in existing}
+
+    def _write_users(self, writer):
+        rng = self.rng
+        password_hash = passwords.hash(self.password)
+        batch = []
+        for user_id in range(1, self.users + 1):
+            first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+            username = f"{first}.{last}{user_id}".lower()
+            batch.append({
+                "id": user_id, "first_name": first, "last_name": last,
+                "phone_number": f"07{rng.randint(10_000_000, 99_999_999)}",
+                "username": username, "email": f"{username}@example.com", "password_hash": password_hash,
+                "role": "organizer" if user_id <= self.organizer_count else "attendee",
+                "created_at": self.now - timedelta(days=rng.randint(0, 730), seconds=rng.randint(0, 86_399)),
+            })
+            if len(batch) >= self.batch_size:
+                writer.write(User.__table__, batch)
+                batch = []
+        if batch:
+            writer.write(User.__table__, batch)
+
+    def _ticket_orders(self):
+        """Number of ticket rows per event: a log-normal popularity curve scaled to the requested total."""
+        rng = self.rng
+        popularity = [rng.lognormvariate(0, 1.2) for _ in range(self.events)]
+        scale = self.tickets / sum(popularity)
+        attendees = self.users - self.organizer_count
+        orders = []
+        for weight in popularity:
+            share = weight * scale
+            count = int(share) + (rng.random() < share - int(share))
+            orders.append(min(count, attendees))
+        return orders
+
+    def _write_events(self, writer, category_ids):
+        rng = self.rng
+        slugs = list(category_ids)
+        category_weights = [CATEGORY_PROFILES[slug][0] for slug in slugs]
+        cities = list(LOCATIONS)
+        city_weights = [LOCATIONS[city][0] for city in cities]
+        # Zipf-like: organizer n hosts about 1/n as many events as the busiest one
+        organizer_weights = list(_cumulative(1 / rank ** 1.1 for rank in range(1, self.organizer_count + 1)))
+        quantities, quantity_weights = list(QUANTITY_WEIGHTS), list(_cumulative(QUANTITY_WEIGHTS.values()))
+        orders = self._ticket_orders()
+
+        events, links, tickets = [], [], []
+        ticket_count = 0
+        for event_id in range(1, self.events + 1):
+            slug = rng.choices(slugs, weights=category_weights)[0]
+            _, median_price, free_share, hours, nouns = CATEGORY_PROFILES[slug]
+            city = rng.choices(cities, weights=city_weights)[0]
+            title = f"{rng.choice([city, *TITLE_PREFIXES])} {rng.choice(nouns)} {self._year(rng)}"
+            date, end_date = self._schedule(rng, hours)
+            created_at = min(self.now, date - timedelta(days=rng.randint(14, 120)))
+
+            sold, event_tickets = 0, []
+            sales_end = min(date, self.now)
+            window = max((sales_end - created_at).total_seconds(), 1)
+            for user_id in rng.sample(range(self.first_attendee, self.users + 1), orders[event_id - 1]):
+                quantity = rng.choices(quantities, cum_weights=quantity_weights)[0]
+                sold += quantity
+                event_tickets.append({
+                    "user_id": user_id, "event_id": event_id, "quantity": quantity,
+                    # sqrt skews purchases towards the end of the sales window
+                    "purchase_date": created_at + timedelta(seconds=int(window * math.sqrt(rng.random()))),
+                })
+            ticket_count += orders[event_id - 1]
+
+            if rng.random() < free_share:
+                price = 0.0
+            else:
+                price = float(max(100, round(rng.lognormvariate(math.log(median_price), 0.6), -2)))
+            for ticket in event_tickets:
+                ticket["unit_price"] = price
+            tickets.extend(event_tickets)
+            # Roughly one in ten events with sales sells out; the rest are 20-95% full
+            if sold and rng.random() < 0.1:
+                max_attendees = sold
+            else:
+                max_attendees = int(math.ceil(max(sold, rng.randint(20, 200)) / rng.uniform(0.2, 0.95)))
+
+            events.append({
+                "id": event_id, "title": title, "slug": f"{Event.slugify(title)}-{event_id}",
+                "description": f"{title} at {rng.choice(LOCATIONS[city][1])}, {city}. "
+                               f"Join us for a {rng.choice(nouns).lower()} experience.",
+                "short_description": f"{rng.choice(nouns)} in {city}",
+                "date": date, "end_date": end_date, "location": city, "venue": rng.choice(LOCATIONS[city][1]),
+                "price": price, "currency": "KSH", "is_active": rng.random() > 0.03,
+                "max_attendees": max_attendees, "tickets_sold": sold,
+                "organizer_id": rng.choices(range(1, self.organizer_count + 1), cum_weights=organizer_weights)[0],
+                "created_at": created_at, "updated_at": created_at,
+            })
+            links.append({"event_id": event_id, "category_id": category_ids[slug]})
+            if rng.random() < 0.3:
+                extra = rng.choice(slugs)
+                if extra != slug:
+                    links.append({"event_id": event_id, "category_id": category_ids[extra]})
+
+            if len(events) >= self.batch_size or event_id == self.events:
+                writer.write(Event.__table__, events)
+                writer.write(event_categories, links)
+                writer.write(Ticket.__table__, tickets)
+                events, links, tickets = [], [], []
+        return ticket_count
+
+    def _year(self, rng):
+        return self.now.year + (rng.random() < 0.3)
+
+    def _schedule(self, rng, hours):
+        """Start and end of an event: three quarters upcoming, biased to soon and to weekends."""
+        if rng.random() < 0.25:
+            day = self.now - timedelta(days=rng.randint(1, 365))
+        else:
+            day = self.now + timedelta(days=min(365, 1 + int(rng.expovariate(1 / 45))))
+        if rng.random() < 0.6:
+            # Move to the following Friday-Sunday
+            day += timedelta(days=(rng.choice((4, 5, 6)) - day.weekday()) % 7)
+        date = day.replace(hour=rng.choice(hours), minute=rng.choice((0, 0, 30)), second=0)
+        if rng.random() < 0.1:
+            return date, date + timedelta(days=rng.randint(1, 3))
+        return date, date + timedelta(hours=rng.randint(2, 6))
+
+    def _reset_sequences(self):
+        if db.session.get_bind().dialect.name != "postgresql":
+            return
+        # Explicit ids leave the sequences behind
+        for table in ("users", "events", "tickets"):
+            db.session.execute(text(
+                f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), (SELECT COALESCE(MAX(id), 1) FROM {table}))"
+            ))
+
+
+def _cumulative(weights):
+    total = 0
+    for weight in weights:
+        total += weight
+        yield total
+
+
+def generate(users, events, tickets, seed=0, **options):
+    """Fills an empty schema with synthetic data. Does not commit."""
+    return Generator(users, events, tickets, seed=seed, **options).run()
+
+
+def clear_data():
+    """Deletes every row, children first, leaving the schema (and search triggers) in place."""
+    for table in reversed(db.metadata.sorted_tables):
+        db.session.execute(delete(table))
+
+
+def is_empty():
+    return not db.session.execute(select(func.count()).select_from(User)).scalar() and \
+        not db.session.execute(select(func.count()).select_from(Event)).scalar()
+
+
+@click.group("seed")
+def seed_cli():
+    """Generate synthetic data."""
+
+
+@seed_cli.command("generate")
+@click.option("--scale", type=click.Choice(list(SCALES)), default="small", show_default=True,
+              help="Preset row counts; --users, --events and --tickets override it.")
+@click.option("--users", type=int, default=None)
+@click.option("--events", type=int, default=None)
+@click.option("--tickets", type=int, default=None)
+@click.option("--seed", type=int, default=0, show_default=True, help="Same seed and scale give the same data.")
+@click.option("--password", default=DEFAULT_PASSWORD, show_default=True, help="Shared by every generated user.")
+@click.option("--batch-size", type=int, default=BATCH_SIZE, show_default=True)
+@click.option("--reset", is_flag=True, help="Delete all existing rows first.")
+@with_appcontext
+def generate_command(scale, users, events, tickets, seed, password, batch_size, reset):
+    """Populate the database with synthetic users, events and tickets."""
+    counts = {**SCALES[scale]}
+    counts.update({key: value for key, value in
+                   (("users", users), ("events", events), ("tickets", tickets)) if value is not None})
+    if reset:
+        clear_data()
+    elif not is_empty():
+        raise click.ClickException("The database already has users or events; pass --reset to replace them.")
+
+    started = time.perf_counter()
+    summary = generate(**counts, seed=seed, password=password, batch_size=batch_size)
+    db.session.commit()
+    click.echo(f"Generated {summary['users']} users, {summary['events']} events and {summary['tickets']} tickets "
+               f"({summary['rows']} rows) in {time.perf_counter() - started:.1f}s.")
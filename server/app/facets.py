@@ -0,0 +1,84 @@
+"""
+Facet counts for the event browser.
+
+`facet_counts(query)` takes the filtered Event query that get_events pages
+through and counts its events per category, location, price band and
+upcoming/past. The matching events become one CTE, each facet is a GROUP BY
+over it, and the groups are combined with UNION ALL. All facets together cost
+a single statement, however many filters the query carries.
+"""
+from datetime import datetime
+from sqlalchemy import String, and_, case, cast, literal, select, union_all
+from app import db
+from app.models.associations import event_categories
+from app.models.category import Category
+from app.models.event import Event
+
+# (band, ceiling): a band holds the prices below its ceiling that are not in an
+# earlier band. Only a price of 0 is free.
+PRICE_BANDS = (
+    ("free", 0),
+    ("under-1000", 1000),
+    ("1000-2999", 3000),
+    ("3000-4999", 5000),
+    ("5000-plus", None),
+)
+BAND_NAMES = tuple(name for name, _ in PRICE_BANDS)
+
+
+def price_band(price):
+    """SQL expression naming the band of a price column."""
+    whens = [(price <= 0, "free")] + [(price < ceiling, name) for name, ceiling in PRICE_BANDS[1:-1]]
+    return case(*whens, else_=PRICE_BANDS[-1][0])
+
+
+def in_price_band(price, band):
+    """Condition matching a price column to `band`, as ranges so the price indexes apply."""
+    index = BAND_NAMES.index(band)
+    if index == 0:
+        return price <= 0
+    floor, ceiling = PRICE_BANDS[index - 1][1], PRICE_BANDS[index][1]
+    condition = price > 0 if floor == 0 else price >= floor
+    return condition if ceiling is None else and_(condition, price < ceiling)
+
+
+def facet_counts(query, now=None):
+    """Counts the events matched by an Event `query` per category, location, price band and date."""
+    now = now or datetime.utcnow()
+    matches = query.order_by(None).with_entities(
+        Event.id, Event.location, Event.price, Event.date
+    ).distinct().cte("facet_matches")
+
+    def facet(name, key, label, source=matches):
+        return select(
+            literal(name).label("facet"), cast(key, String).label("key"), cast(label, String).label("label"),
+            db.func.count().label("count"),
+        ).select_from(source).group_by(key, label)
+
+    categories = matches.join(event_categories, event_categories.c.event_id == matches.c.id) \
+        .join(Category, Category.id == event_categories.c.category_id)
+    band = price_band(matches.c.price)
+    when = case((matches.c.date > now, "upcoming"), else_="past")
+    statement = union_all(
+        facet("category", Category.slug, Category.name, categories),
+        facet("location", matches.c.location, matches.c.location),
+        facet("price", band, band),
+        facet("when", when, when),
+    )
+
+    grouped = {"category": [], "location": [], "price": {}, "when": {}}
+    for row in db.session.execute(statement):
+        if row.facet in ("category", "location"):
+            grouped[row.facet].append((row.key, row.label, row.count))
+        else:
+            grouped[row.facet][row.key] = row.count
+
+    by_count = lambda item: (-item[2], item[1])
+    return {
+        "categories": [{"slug": slug, "name": name, "count": count}
+                       for slug, name, count in sorted(grouped["category"], key=by_count)],
+        "locations": [{"location": location, "count": count}
+                      for location, _, count in sorted(grouped["location"], key=by_count)],
+        "price_bands": [{"band": name, "count": grouped["price"].get(name, 0)} for name in BAND_NAMES],
+        "dates": {"upcoming": grouped["when"].get("upcoming", 0), "past": grouped["when"].get("past", 0)},
+    }
@@ -0,0 +1,118 @@
+"""
+Upload storage and background image derivatives.
+
+Uploads are copied to UPLOAD_FOLDER in fixed-size chunks and renamed into
+place. Once the owning event is committed, a worker pool renders WebP
+variants (thumb, card, hero) next to the original and records them in
+Event.image_variants, which the serializers use to pick the right URL.
+Pillow is optional: without it, uploads are stored and served as-is.
+"""
+import logging
+import os
+import shutil
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from flask import current_app
+from werkzeug.utils import secure_filename
+
+try:
+    from PIL import Image
+except ImportError:  # pragma: no cover - Pillow is an optional dependency
+    Image = None
+
+logger = logging.getLogger(__name__)
+
+# Variant name -> maximum width in pixels
+IMAGE_SIZES = {
+    "thumb": 320,
+    "card": 640,
+    "hero": 1600,
+}
+COPY_CHUNK_SIZE = 64 * 1024
+
+
+def variant_filename(filename, variant):
+    return f"{os.path.splitext(filename)[0]}_{variant}.webp"
+
+
+def store_upload(file, upload_folder):
+    """Copies an uploaded file to disk chunk by chunk and returns its stored filename."""
+    os.makedirs(upload_folder, exist_ok=True)
+    filename = secure_filename(f"{uuid.uuid4()}_{file.filename}")
+    path = os.path.join(upload_folder, filename)
+    partial_path = f"{path}.part"
+    with open(partial_path, "wb") as out:
+        shutil.copyfileobj(file.stream, out, COPY_CHUNK_SIZE)
+    os.replace(partial_path, path)
+    return filename
+
+
+def render_variants(source_path, sizes=IMAGE_SIZES, quality=80):
+    """Writes a downscaled WebP copy of the image for each size; returns the variant names written."""
+    written = []
+    with Image.open(source_path) as original:
+        original.load()
+        image = original if original.mode in ("RGB", "RGBA") else original.convert("RGBA")
+        for variant, width in sizes.items():
+            resized = image.copy()
+            resized.thumbnail((width, width * 4))
+            target = os.path.join(os.path.dirname(source_path), variant_filename(os.path.basename(source_path), variant))
+            partial = f"{target}.part"
+            resized.save(partial, format="WEBP", quality=quality)
+            os.replace(partial, target)
+            written.append(variant)
+    return written
+
+
+class ImagePipeline:
+    def __init__(self, app=None):
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.extensions["image_pipeline"] = ThreadPoolExecutor(
+            max_workers=app.config.get("IMAGE_WORKERS", 2),
+            thread_name_prefix="image-pipeline",
+        )
+
+    @property
+    def enabled(self):
+        return Image is not None
+
+    def submit(self, event_id, filename):
+        """
+        Queues variant rendering for an event's uploaded image. Call after the event
+        is committed. Returns a Future, or None if Pillow is unavailable.
+        """
+        if not self.enabled:
+            return None
+        app = current_app._get_current_object()
+        return app.extensions["image_pipeline"].submit(self._process, app, event_id, filename)
+
+    def _process(self, app, event_id, filename):
+        from app import db
+        from app.cache import cache
+        from app.models.event import Event
+
+        with app.app_context():
+            try:
+                source_path = os.path.join(app.config["UPLOAD_FOLDER"], filename)
+                variants = render_variants(
+                    source_path, quality=app.config.get("IMAGE_WEBP_QUALITY", 80)
+                )
+                # Skip the update if the event has since been given another image
+                Event.query.filter_by(id=event_id, image_url=f"/uploads/{filename}").update(
+                    {"image_variants": ",".join(variants)}, synchronize_session=False
+                )
+                db.session.commit()
+                cache.invalidate()
+                return variants
+            except Exception:
+                db.session.rollback()
+                logger.exception("Failed to render image variants for %s", filename)
+                raise
+            finally:
+                db.session.remove()
+
+
+images = ImagePipeline()
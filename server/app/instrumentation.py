@@ -0,0 +1,219 @@
+"""
+Request and SQL instrumentation.
+
+Every request gets a RequestStats in `g`. Engine-wide cursor hooks add each
+statement's count and duration to it, log statements slower than
+SLOW_QUERY_SECONDS, and remember the statement text so that
+N_PLUS_ONE_THRESHOLD repeats of one statement within a request can be flagged
+as a likely N+1. When the request finishes, latency, query counts and DB time
+go into per-endpoint histograms. The response gets a Server-Timing header, and
+everything is served in Prometheus format on /metrics. /metrics requires
+`Authorization: Bearer <METRICS_TOKEN>`; without a token it is only open in
+debug and testing apps.
+
+With PROFILER_ENABLED, a request carrying `X-Profile: <PROFILER_TOKEN>` is
+profiled (pyinstrument when installed, cProfile otherwise) and answered with
+the profile as plain text instead of its normal body. Without PROFILER_TOKEN
+no request is profiled.
+"""
+import cProfile
+import hmac
+import io
+import logging
+import pstats
+import time
+from collections import Counter as Tally
+from flask import Response, current_app, g, got_request_exception, has_request_context, request
+from sqlalchemy import event as sa_event
+from sqlalchemy.engine import Engine
+from app.metrics import MetricsRegistry
+
+try:
+    from pyinstrument import Profiler
+except ImportError:  # pragma: no cover - pyinstrument is an optional dependency
+    Profiler = None
+
+logger = logging.getLogger(__name__)
+
+QUERY_COUNT_BUCKETS = (1, 2, 3, 5, 8, 13, 21, 34, 55, 89)
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class RequestStats:
+    __slots__ = ("started", "queries", "db_seconds", "slow_queries", "statements", "profiler")
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.queries = 0
+        self.db_seconds = 0.0
+        self.slow_queries = 0
+        self.statements = Tally()
+        self.profiler = None
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info["query_started"] = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info.pop("query_started", None)
+    if started is None or not has_request_context():
+        return
+    stats = g.get("request_stats")
+    if stats is None:
+        return
+    elapsed = time.perf_counter() - started
+    stats.queries += 1
+    stats.db_seconds += elapsed
+    stats.statements[statement] += 1
+    if elapsed >= current_app.config.get("SLOW_QUERY_SECONDS", 0.1):
+        stats.slow_queries += 1
+        logger.warning("Slow query (%.1f ms) in %s: %s", elapsed * 1000, request.endpoint, statement)
+
+
+def _endpoint():
+    return request.endpoint or "<unmatched>"
+
+
+class Instrumentation:
+    _hooks_installed = False
+
+    def __init__(self, app=None):
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        registry = MetricsRegistry()
+        app.extensions["metrics"] = registry
+        if not app.config.get("INSTRUMENTATION_ENABLED", True):
+            return
+        if app.config.get("PROFILER_ENABLED") and not app.config.get("PROFILER_TOKEN"):
+            logger.warning("PROFILER_ENABLED is set without PROFILER_TOKEN; no request will be profiled")
+        if not app.config.get("METRICS_TOKEN") and not (app.debug or app.testing):
+            logger.warning("METRICS_TOKEN is not set; /metrics will refuse every scrape")
+
+        if not Instrumentation._hooks_installed:
+            sa_event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+            sa_event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+            Instrumentation._hooks_installed = True
+
+        registry.histogram("http_request_duration_seconds", "Request latency.", ("endpoint", "method"))
+        registry.counter("http_requests_total", "Requests served.", ("endpoint", "method", "status"))
+        registry.counter("http_request_exceptions_total", "Unhandled exceptions.", ("endpoint",))
+        registry.histogram("db_queries_per_request", "SQL statements per request.", ("endpoint",),
+                           buckets=QUERY_COUNT_BUCKETS)
+        registry.histogram("db_time_per_request_seconds", "Time spent in SQL per request.", ("endpoint",))
+        registry.counter("db_slow_queries_total", "Statements slower than SLOW_QUERY_SECONDS.", ("endpoint",))
+        registry.counter("db_n_plus_one_total", "Requests repeating one statement N_PLUS_ONE_THRESHOLD+ times.",
+                         ("endpoint",))
+        registry.add_collector(_extension_gauges)
+
+        app.before_request(self._start_request)
+        app.after_request(self._finish_request)
+        got_request_exception.connect(_record_exception, app)
+        app.add_url_rule("/metrics", "metrics", self.metrics_view)
+
+    @staticmethod
+    def registry():
+        return current_app.extensions["metrics"]
+
+    def _start_request(self):
+        stats = g.request_stats = RequestStats()
+        if self._profiling_requested():
+            stats.profiler = Profiler(interval=0.001) if Profiler else cProfile.Profile()
+            if Profiler:
+                stats.profiler.start()
+            else:
+                stats.profiler.enable()
+
+    def _profiling_requested(self):
+        header = request.headers.get("X-Profile")
+        if not header or not current_app.config.get("PROFILER_ENABLED"):
+            return False
+        token = current_app.config.get("PROFILER_TOKEN")
+        return bool(token) and hmac.compare_digest(header, token)
+
+    def _finish_request(self, response):
+        stats = g.pop("request_stats", None)
+        if stats is None:
+            return response
+        registry = self.registry()
+        endpoint = _endpoint()
+        elapsed = time.perf_counter() - stats.started
+
+        registry.get("http_request_duration_seconds").observe(elapsed, endpoint=endpoint, method=request.method)
+        registry.get("http_requests_total").inc(endpoint=endpoint, method=request.method, status=response.status_code)
+        registry.get("db_queries_per_request").observe(stats.queries, endpoint=endpoint)
+        registry.get("db_time_per_request_seconds").observe(stats.db_seconds, endpoint=endpoint)
+        if stats.slow_queries:
+            registry.get("db_slow_queries_total").inc(stats.slow_queries, endpoint=endpoint)
+
+        threshold = current_app.config.get("N_PLUS_ONE_THRESHOLD", 5)
+        repeated = [(count, sql) for sql, count in stats.statements.items() if count >= threshold]
+        if repeated:
+            registry.get("db_n_plus_one_total").inc(endpoint=endpoint)
+            for count, sql in repeated:
+                logger.warning("Possible N+1 in %s: %d x %s", endpoint, count, sql)
+
+        response.headers["Server-Timing"] = (
+            f'db;dur={stats.db_seconds * 1000:.1f};desc="{stats.queries} queries", '
+            f"app;dur={elapsed * 1000:.1f}"
+        )
+        if stats.profiler is not None:
+            return self._profile_response(stats.profiler, response)
+        return response
+
+    @staticmethod
+    def _profile_response(profiler, response):
+        if Profiler and isinstance(profiler, Profiler):
+            profiler.stop()
+            report = profiler.output_text()
+        else:
+            profiler.disable()
+            buffer = io.StringIO()
+            pstats.Stats(profiler, stream=buffer).sort_stats("cumulative").print_stats(40)
+            report = buffer.getvalue()
+        profile = Response(report, mimetype="text/plain")
+        profile.headers["X-Profiled-Status"] = str(response.status_code)
+        profile.headers["Server-Timing"] = response.headers["Server-Timing"]
+        return profile
+
+    def metrics_view(self):
+        token = current_app.config.get("METRICS_TOKEN")
+        if not token and not (current_app.debug or current_app.testing):
+            return Response("Forbidden: set METRICS_TOKEN to enable /metrics\n", status=403, mimetype="text/plain")
+        if token and not hmac.compare_digest(request.headers.get("Authorization", ""), f"Bearer {token}"):
+            return Response("Unauthorized\n", status=401, mimetype="text/plain")
+        return Response(self.registry().render(), content_type=PROMETHEUS_CONTENT_TYPE)
+
+
+def _record_exception(sender, exception, **extra):
+    current_app.extensions["metrics"].get("http_request_exceptions_total").inc(endpoint=_endpoint())
+    logger.exception("Unhandled exception in %s", _endpoint(), exc_info=exception)
+
+
+def _extension_gauges():
+    """Scrape-time view of counters kept by the response cache and password-hashing extensions."""
+    samples = []
+    pool = current_app.extensions.get("passwords")
+    if pool is not None:
+        stats = pool.stats()
+        samples.append(("password_hash_pending", "gauge", "Hashes queued or running.",
+                        {(): stats["pending"]}))
+        samples.append(("password_hash_queued", "gauge", "Hashes waiting for a worker process.",
+                        {(): stats["queued"]}))
+        samples.append(("password_hash_rejected_total", "counter", "Hashes refused by admission control.",
+                        {(): stats["rejected"]}))
+        samples.append(("password_hash_timed_out_total", "counter", "Hashes that outlasted PASSWORD_HASH_TIMEOUT.",
+                        {(): stats["timed_out"]}))
+    if "response_cache" in current_app.extensions:
+        from app.cache import cache
+        stats = cache.stats()
+        samples.append(("response_cache_requests_total", "counter", "Response cache lookups.", {
+            (("result", "hit"),): stats["hits"],
+            (("result", "miss"),): stats["misses"],
+        }))
+    return samples
+
+
+instrumentation = Instrumentation()
@@ -0,0 +1,100 @@
+"""
+JSON encoding for API responses.
+
+`configure_json(app)` installs the provider named by JSON_PROVIDER:
+
+- "orjson" encodes in C. It handles datetimes, dates, UUIDs and dataclasses
+  natively; Decimals are written as strings.
+- "stdlib" is Flask's json-module provider. Its default hook encodes
+  datetimes as ISO 8601 rather than Flask's HTTP dates, so both providers
+  produce the same output.
+- "auto" (the default) picks orjson when it is installed.
+
+Serializers therefore return raw datetime values and leave formatting to the
+provider. Anything else that encodes a response body should go through
+`current_app.json` too. JSON_SORT_KEYS controls key sorting for both.
+"""
+import dataclasses
+import decimal
+import uuid
+from datetime import date, time
+from flask.json.provider import DefaultJSONProvider, JSONProvider
+
+try:
+    import orjson
+except ImportError:  # optional dependency; the stdlib provider is used instead
+    orjson = None
+
+
+def _default(value):
+    """Encodes the types the json module does not know about."""
+    if isinstance(value, (date, time)):
+        return value.isoformat()
+    if isinstance(value, decimal.Decimal):
+        return str(value)
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return dataclasses.asdict(value)
+    if hasattr(value, "__html__"):
+        return str(value.__html__())
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _orjson_default(value):
+    if isinstance(value, decimal.Decimal):
+        return str(value)
+    if hasattr(value, "__html__"):
+        return str(value.__html__())
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class StdlibJSONProvider(DefaultJSONProvider):
+    """Flask's provider, with ISO 8601 datetimes."""
+
+    default = staticmethod(_default)
+
+    def __init__(self, app):
+        super().__init__(app)
+        self.sort_keys = app.config.get("JSON_SORT_KEYS", False)
+
+
+class OrjsonProvider(JSONProvider):
+    mimetype = "application/json"
+
+    def __init__(self, app):
+        super().__init__(app)
+        self.options = orjson.OPT_NON_STR_KEYS
+        if app.config.get("JSON_SORT_KEYS", False):
+            self.options |= orjson.OPT_SORT_KEYS
+
+    def dumps_bytes(self, obj):
+        return orjson.dumps(obj, default=_orjson_default, option=self.options)
+
+    def dumps(self, obj, **kwargs):
+        return self.dumps_bytes(obj).decode("utf-8")
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(self.dumps_bytes(obj) + b"\n", mimetype=self.mimetype)
+
+
+PROVIDERS = {"orjson": OrjsonProvider, "stdlib": StdlibJSONProvider}
+
+
+def provider_class(name):
+    if name == "auto":
+        name = "orjson" if orjson is not None else "stdlib"
+    if name not in PROVIDERS:
+        raise ValueError(f"Unknown JSON_PROVIDER: '{name}'")
+    if name == "orjson" and orjson is None:
+        raise RuntimeError("JSON_PROVIDER is 'orjson' but orjson is not installed")
+    return PROVIDERS[name]
+
+
+def configure_json(app):
+    """Installs the JSON_PROVIDER provider as app.json."""
+    app.json = provider_class(app.config.get("JSON_PROVIDER", "auto"))(app)
@@ -5,5 +5,7 @@ from app.models.associations import event_categories
 from app.models.user import User
 from app.models.ticket import Ticket
 from .token_blocklist import TokenBlocklist
+from .organizer_stats import OrganizerDailyStats, OrganizerAttendee
 
-__all__ = ['db', 'Category', 'Event', 'event_categories', 'User', 'Ticket', 'TokenBlocklist']
\ No newline at end of file
+__all__ = ['db', 'Category', 'Event', 'event_categories', 'User', 'Ticket', 'TokenBlocklist',
+           'OrganizerDailyStats', 'OrganizerAttendee']
\ No newline at end of file
@@ -1,6 +1,5 @@
 from app import db
 from datetime import datetime, timezone
-from .associations import event_categories
 
 class Category(db.Model):
     __tablename__ = 'categories'
@@ -17,19 +16,6 @@ class Category(db.Model):
     def __repr__(self):
         return f'<Category {self.name}>'
     
-    def to_dict(self, include_events=True):
-        data = {
-            'id': self.id,
-            'name': self.name,
-            'description': self.description,
-            'slug': self.slug,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None,
-        }
-        if include_events:
-            data['events'] = [event.id for event in self.events]
-        return data
-    
     @staticmethod
     def create_slug(name):
         return name.lower().replace(' ', '-').replace('&', 'and')
\ No newline at end of file
@@ -1,15 +1,25 @@
 
 from datetime import datetime, timezone
 import re
-import uuid
 from flask import request
 from app import db
+from app.images import variant_filename
 from app.models.associations import event_categories
 from app.models.user import User
 from app.models.ticket import Ticket
 
 class Event(db.Model):
     __tablename__ = 'events'
+    __table_args__ = (
+        # Keyset pagination seeks on (sort key, id) within active events
+        db.Index('ix_events_active_date_id', 'is_active', 'date', 'id'),
+        db.Index('ix_events_active_price_id', 'is_active', 'price', 'id'),
+        db.Index('ix_events_active_title_id', 'is_active', 'title', 'id'),
+        # Organizer dashboards list their events by date; unowned (seeded/imported) events are left out
+        db.Index('ix_events_organizer_id_date_id', 'organizer_id', 'date', 'id',
+                 sqlite_where=db.text('organizer_id IS NOT NULL'),
+                 postgresql_where=db.text('organizer_id IS NOT NULL')),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     title = db.Column(db.String(200), nullable=False, index=True)
@@ -22,8 +32,12 @@ class Event(db.Model):
     price = db.Column(db.Float, nullable=False, default=0.0)
     currency = db.Column(db.String(3), nullable=False, default='KSH')
     image_url = db.Column(db.String(500), nullable=True)
+    # Comma-separated WebP variants rendered for an uploaded image (see app.images)
+    image_variants = db.Column(db.String(100), nullable=True)
     is_active = db.Column(db.Boolean, nullable=False, default=True)
     max_attendees = db.Column(db.Integer, nullable=True)
+    # Running total of ticket quantities, maintained by the purchase path
+    tickets_sold = db.Column(db.Integer, nullable=False, default=0, server_default='0')
     slug = db.Column(db.String(250), nullable=False, unique=True, index=True)
     created_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc))
     updated_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc),
@@ -39,49 +53,17 @@ class Event(db.Model):
         return f'<Event {self.title}>'
         
 
-    def _get_full_image_url(self):
-        if self.image_url and self.image_url.startswith('/uploads/'):
-            return f'{request.host_url.rstrip("/")}{self.image_url}'
-        return self.image_url
+    def _get_full_image_url(self, variant=None):
+        image_url = self.image_url
+        if variant and image_url and variant in (self.image_variants or '').split(','):
+            image_url = variant_filename(image_url, variant)
+        if image_url and image_url.startswith('/uploads/'):
+            return f'{request.host_url.rstrip("/")}{image_url}'
+        return image_url
 
-
-    def to_dict(self, include_categories=True):
-        data = {
-            'id': self.id,
-            'title': self.title,
-            'description': self.description,
-            'short_description': self.short_description,
-            'date': self.date.isoformat() if self.date else None,
-            'end_date': self.end_date.isoformat() if self.end_date else None,
-            'location': self.location,
-            'venue': self.venue,
-            'price': self.price,
-            'currency': self.currency,
-            'image_url': self._get_full_image_url(), # Use the helper
-            'is_active': self.is_active,
-            'max_attendees': self.max_attendees,
-            'slug': self.slug,
-            'organizer_id': self.organizer_id,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None
-        }
-        if include_categories:
-            data['categories'] = [category.to_dict(include_events=False) for category in self.categories]
-        return data
-
-    def to_summary_dict(self):
-        return {
-            'id': self.id,
-            'title': self.title,
-            'short_description': self.short_description,
-            'date': self.date.isoformat() if self.date else None,
-            'location': self.location,
-            'price': self.price,
-            'currency': self.currency,
-            'image_url': self._get_full_image_url(),
-            'slug': self.slug,
-            'categories': [{'id': cat.id, 'name': cat.name, 'slug': cat.slug} for cat in self.categories]
-        }
+    def image_variant_urls(self):
+        variants = [v for v in (self.image_variants or '').split(',') if v]
+        return {variant: self._get_full_image_url(variant) for variant in variants}
 
     @property
     def is_upcoming(self):
@@ -94,15 +76,9 @@ class Event(db.Model):
         return f"{self.currency} {self.price:,.0f}"
 
     @staticmethod
-    def create_slug(title):
+    def slugify(title):
         slug = re.sub(r'[^\w\s-]', '', title.lower()).strip()
-        slug = re.sub(r'\s+', '-', slug)
-        
-        if Event.query.filter_by(slug=slug).first():
-            unique_id = uuid.uuid4().hex[:6]
-            return f"{slug}-{unique_id}"
-            
-        return slug
+        return re.sub(r'\s+', '-', slug)
 
     @classmethod
     def search_by_title(cls, search_term):
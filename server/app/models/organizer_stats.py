@@ -0,0 +1,29 @@
+from app import db
+
+
+class OrganizerDailyStats(db.Model):
+    """Per-organizer, per-day sales rollup, updated as tickets are purchased."""
+    __tablename__ = 'organizer_daily_stats'
+
+    organizer_id = db.Column(db.Integer, db.ForeignKey('users.id'), primary_key=True)
+    day = db.Column(db.Date, primary_key=True)
+    revenue = db.Column(db.Float, nullable=False, default=0.0)
+    tickets_sold = db.Column(db.Integer, nullable=False, default=0)
+
+    def __repr__(self):
+        return f'<OrganizerDailyStats organizer={self.organizer_id} day={self.day}>'
+
+
+class OrganizerAttendee(db.Model):
+    """Most recent purchase by each attendee from each organizer, for distinct-attendee counts."""
+    __tablename__ = 'organizer_attendees'
+    __table_args__ = (
+        db.Index('ix_organizer_attendees_organizer_last_purchase', 'organizer_id', 'last_purchase_at'),
+    )
+
+    organizer_id = db.Column(db.Integer, db.ForeignKey('users.id'), primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('users.id'), primary_key=True)
+    last_purchase_at = db.Column(db.DateTime, nullable=False)
+
+    def __repr__(self):
+        return f'<OrganizerAttendee organizer={self.organizer_id} user={self.user_id}>'
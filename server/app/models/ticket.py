@@ -3,10 +3,18 @@ from datetime import datetime, timezone
 
 class Ticket(db.Model):
     __tablename__ = 'tickets'
+    __table_args__ = (
+        # Also serves lookups by user_id, its leading column
+        db.UniqueConstraint('user_id', 'event_id', name='uq_tickets_user_id_event_id'),
+        # Per-event sales and the organizer stats rebuild, which groups by purchase day
+        db.Index('ix_tickets_event_id_purchase_date', 'event_id', 'purchase_date'),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     purchase_date = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc))
     quantity = db.Column(db.Integer, nullable=False, default=1)
+    # Price of one ticket when it was bought; the event's price may change afterwards
+    unit_price = db.Column(db.Float, nullable=True)
     
     # Foreign Keys
     user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
@@ -16,16 +24,4 @@ class Ticket(db.Model):
     user = db.relationship('User', backref='tickets')
 
     def __repr__(self):
-        return f'<{self.quantity} Ticket(s) for Event ID {self.event_id} by User ID {self.user_id}>'
-
-    def to_dict(self, include_event=False):
-        data = {
-            'id': self.id,
-            'purchase_date': self.purchase_date.isoformat(),
-            'quantity': self.quantity,
-            'user_id': self.user_id,
-            'event_id': self.event_id
-        }
-        if include_event and self.event:
-            data['event'] = self.event.to_summary_dict()
-        return data
\ No newline at end of file
+        return f'<{self.quantity} Ticket(s) for Event ID {self.event_id} by User ID {self.user_id}>'
\ No newline at end of file
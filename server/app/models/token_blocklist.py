@@ -4,4 +4,8 @@ from datetime import datetime, timezone
 class TokenBlocklist(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     jti = db.Column(db.String(36), nullable=False, index=True)
-    created_at = db.Column(db.DateTime, nullable=False, default=lambda: datetime.now(timezone.utc))
\ No newline at end of file
+    token_type = db.Column(db.String(10), nullable=True)
+    # When the revoked token would have expired (naive UTC); rows past it can be purged
+    expires_at = db.Column(db.DateTime, nullable=True, index=True)
+    # Revocation syncs read the rows created since shortly before the previous sync
+    created_at = db.Column(db.DateTime, nullable=False, default=lambda: datetime.now(timezone.utc), index=True)
\ No newline at end of file
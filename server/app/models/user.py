@@ -1,15 +1,14 @@
 from sqlalchemy import Enum
 from sqlalchemy.orm import validates
-from sqlalchemy_serializer import SerializerMixin
-from app import db, bcrypt
+from app import db
+from app.passwords import passwords
 
 ROLE_ATTENDEE = "attendee"
 ROLE_ORGANIZER = "organizer"
 VALID_ROLES = {ROLE_ATTENDEE, ROLE_ORGANIZER}
 
-class User(db.Model, SerializerMixin):
+class User(db.Model):
     __tablename__ = 'users'
-    serialize_rules = ('-password_hash',)
 
     id = db.Column(db.Integer, primary_key=True)
 
@@ -29,7 +28,7 @@ class User(db.Model, SerializerMixin):
         return value
 
     def set_password(self, password):
-        self.password_hash = bcrypt.generate_password_hash(password).decode('utf-8')
+        self.password_hash = passwords.hash(password)
 
     def check_password(self, password):
-        return bcrypt.check_password_hash(self.password_hash, password)
\ No newline at end of file
+        return passwords.verify(self.password_hash, password)
\ No newline at end of file
@@ -0,0 +1,64 @@
+import base64
+import json
+from datetime import datetime
+from sqlalchemy import tuple_
+
+
+def encode_cursor(sort_by, sort_value, item_id):
+    """Packs the sort key and id of the last row on a page into an opaque token."""
+    if isinstance(sort_value, datetime):
+        sort_value = sort_value.isoformat()
+    payload = json.dumps({"s": sort_by, "k": sort_value, "id": item_id}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor, sort_by, key_type=None):
+    """
+    Unpacks a cursor produced by encode_cursor. `key_type` is the Python type of the
+    sort column (None when the cursor carries no sort key); the key is checked against it.
+    Raises ValueError if the token is malformed or was issued for another sort order.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        if payload["s"] != sort_by:
+            raise ValueError("Cursor does not match the requested sort order")
+        sort_value, item_id = _sort_key(payload["k"], key_type), int(payload["id"])
+    except (KeyError, TypeError, ValueError, UnicodeError) as e:
+        raise ValueError(f"Invalid cursor: {e}") from e
+    return sort_value, item_id
+
+
+def _sort_key(value, key_type):
+    # JSON carries datetimes as ISO strings and floats that happen to be whole as ints
+    if key_type is None:
+        valid = value is None
+    elif key_type is datetime:
+        return datetime.fromisoformat(value)
+    elif key_type in (int, float):
+        valid = isinstance(value, (int, float)) and not isinstance(value, bool)
+    else:
+        valid = isinstance(value, key_type)
+    if not valid:
+        raise ValueError(f"unexpected sort key {value!r}")
+    return value
+
+
+def keyset_paginate(query, sort_by, sort_column, id_column, cursor, limit):
+    """
+    Seeks past the row identified by `cursor` on (sort_column, id_column) instead of
+    using OFFSET, so every page costs one index range scan regardless of its depth.
+    Returns (items, next_cursor); next_cursor is None on the last page.
+    """
+    query = query.order_by(None).order_by(sort_column.asc(), id_column.asc())
+    if cursor:
+        sort_value, item_id = decode_cursor(cursor, sort_by, sort_column.type.python_type)
+        query = query.filter(tuple_(sort_column, id_column) > tuple_(sort_value, item_id))
+
+    rows = query.limit(limit + 1).all()
+    items = rows[:limit]
+    next_cursor = None
+    if len(rows) > limit:
+        last = items[-1]
+        next_cursor = encode_cursor(sort_by, getattr(last, sort_column.key), getattr(last, id_column.key))
+    return items, next_cursor
@@ -0,0 +1,201 @@
+"""
+Password hashing off the request path.
+
+bcrypt runs in a small process pool per worker, so a burst of logins cannot pin
+the worker that serves the rest of the API. At most PASSWORD_HASH_MAX_PENDING
+hashes may be queued or running at once; past that, callers get
+PasswordHasherBusy right away and the routes answer 503 with Retry-After. A
+caller that waits longer than PASSWORD_HASH_TIMEOUT gets PasswordHasherBusy
+too, but its hash keeps its slot until the worker process finishes it.
+Hashes carry their cost factor, so after BCRYPT_LOG_ROUNDS changes a successful
+login re-hashes the password at the new cost (see `needs_rehash`).
+`flask passwords benchmark` measures each cost on the current machine and
+suggests the highest one that stays under a target latency.
+
+With PASSWORD_HASH_WORKERS = 0 hashing runs inline, which the tests use.
+"""
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import bcrypt
+import click
+from flask import current_app
+from flask.cli import with_appcontext
+
+
+class PasswordHasherBusy(Exception):
+    pass
+
+
+def _hash(password, rounds):
+    return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt(rounds)).decode("utf-8")
+
+
+def _verify(password_hash, password):
+    return bcrypt.checkpw(password.encode("utf-8"), password_hash.encode("utf-8"))
+
+
+def hash_rounds(password_hash):
+    """Returns the cost factor encoded in a bcrypt hash ("$2b$12$..."), or None if it is not one."""
+    try:
+        return int(password_hash.split("$")[2])
+    except (AttributeError, IndexError, ValueError):
+        return None
+
+
+class HashingPool:
+    def __init__(self, workers, max_pending, timeout):
+        self.workers = workers
+        self.max_pending = max_pending
+        self.timeout = timeout
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._lock = threading.Lock()
+        self._executor = None
+        self._pid = None
+        self.pending = 0
+        self.peak_pending = 0
+        self.completed = 0
+        self.rejected = 0
+        self.timed_out = 0
+        self.busy_seconds = 0.0
+
+    def _get_executor(self):
+        # Pools do not survive a fork, so a preloaded app builds one per worker process
+        if self._executor is None or self._pid != os.getpid():
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers, mp_context=multiprocessing.get_context("spawn")
+            )
+            self._pid = os.getpid()
+        return self._executor
+
+    def run(self, fn, *args):
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self.rejected += 1
+            raise PasswordHasherBusy("Password hashing queue is full")
+
+        with self._lock:
+            self.pending += 1
+            self.peak_pending = max(self.peak_pending, self.pending)
+        started = time.perf_counter()
+        if not self.workers:
+            try:
+                return fn(*args)
+            finally:
+                self._release(started)
+
+        try:
+            future = self._get_executor().submit(fn, *args)
+        except BaseException as e:
+            if isinstance(e, BrokenProcessPool):
+                self._executor = None
+            self._release(started)
+            raise
+        # The slot is freed when the worker finishes, not when this caller stops waiting
+        future.add_done_callback(lambda _: self._release(started))
+        try:
+            return future.result(timeout=self.timeout)
+        except TimeoutError:
+            with self._lock:
+                self.timed_out += 1
+            raise PasswordHasherBusy("Password hashing timed out")
+        except BrokenProcessPool:
+            self._executor = None
+            raise
+
+    def _release(self, started):
+        with self._lock:
+            self.pending -= 1
+            self.completed += 1
+            self.busy_seconds += time.perf_counter() - started
+        self._slots.release()
+
+    def stats(self):
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "max_pending": self.max_pending,
+                "pending": self.pending,
+                "queued": max(self.pending - self.workers, 0) if self.workers else 0,
+                "peak_pending": self.peak_pending,
+                "completed": self.completed,
+                "rejected": self.rejected,
+                "timed_out": self.timed_out,
+                "busy_seconds": round(self.busy_seconds, 3),
+            }
+
+
+class PasswordHasher:
+    def __init__(self, app=None):
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.extensions["passwords"] = HashingPool(
+            workers=app.config.get("PASSWORD_HASH_WORKERS", 2),
+            max_pending=app.config.get("PASSWORD_HASH_MAX_PENDING", 16),
+            timeout=app.config.get("PASSWORD_HASH_TIMEOUT", 10),
+        )
+
+    @property
+    def pool(self):
+        return current_app.extensions["passwords"]
+
+    @property
+    def rounds(self):
+        return current_app.config.get("BCRYPT_LOG_ROUNDS", 12)
+
+    def hash(self, password):
+        """Hashes `password` at the configured cost. Raises PasswordHasherBusy when saturated."""
+        return self.pool.run(_hash, password, self.rounds)
+
+    def verify(self, password_hash, password):
+        """Checks `password` against a stored hash. Raises PasswordHasherBusy when saturated."""
+        if hash_rounds(password_hash) is None:
+            return False
+        return self.pool.run(_verify, password_hash, password)
+
+    def needs_rehash(self, password_hash):
+        return hash_rounds(password_hash) != self.rounds
+
+    def stats(self):
+        return self.pool.stats()
+
+
+passwords = PasswordHasher()
+
+
+@click.group("passwords")
+def passwords_cli():
+    """Password hashing maintenance."""
+
+
+@passwords_cli.command("benchmark")
+@click.option("--target-ms", type=float, default=250.0, show_default=True, help="Latency budget for one hash.")
+@click.option("--min-rounds", type=int, default=10, show_default=True)
+@click.option("--max-rounds", type=int, default=15, show_default=True)
+@click.option("--samples", type=int, default=3, show_default=True)
+@with_appcontext
+def benchmark_command(target_ms, min_rounds, max_rounds, samples):
+    """Time bcrypt at each cost factor and suggest BCRYPT_LOG_ROUNDS for the target latency."""
+    chosen = None
+    for rounds in range(min_rounds, max_rounds + 1):
+        timings = []
+        for _ in range(samples):
+            started = time.perf_counter()
+            _hash("benchmark-password", rounds)
+            timings.append((time.perf_counter() - started) * 1000)
+        median = sorted(timings)[len(timings) // 2]
+        click.echo(f"rounds={rounds:<3} median={median:8.1f} ms")
+        if median > target_ms:
+            break
+        chosen = rounds
+
+    current = current_app.config.get("BCRYPT_LOG_ROUNDS", 12)
+    if chosen is None:
+        click.echo(f"Even {min_rounds} rounds exceed {target_ms:.0f} ms; keep BCRYPT_LOG_ROUNDS={current}.")
+    else:
+        click.echo(f"Suggested BCRYPT_LOG_ROUNDS={chosen} (currently {current}).")
@@ -0,0 +1,88 @@
+"""
+Read-replica routing.
+
+When REPLICA_DATABASE_URI is set, app.database registers it as the "replica"
+bind. RoutingSession then sends plain SELECTs to the replica during GET and
+HEAD requests to the blueprints in REPLICA_READ_BLUEPRINTS. Everything else
+uses the primary: flushes, INSERT/UPDATE/DELETE, SELECT ... FOR UPDATE, other
+methods, and code running outside a request.
+
+Reads stay consistent with the client's own writes. Once a request writes, the
+rest of that request reads from the primary. The response also sets a
+short-lived cookie, so the same client keeps reading from the primary, and
+skips the response cache, for REPLICA_STICKY_SECONDS. That should exceed the
+replica's usual lag. Responses that app.cache stores for every client are
+computed on the primary (see ResponseCache.cached).
+"""
+import time
+from flask import current_app, g, has_request_context, request
+from flask_sqlalchemy.session import Session
+from sqlalchemy.sql import Select
+
+REPLICA_BIND = "replica"
+STICKY_COOKIE = "db_primary_until"
+
+
+def _is_plain_select(clause):
+    return isinstance(clause, Select) and clause._for_update_arg is None
+
+
+def _is_write(session, clause):
+    return session._flushing or (clause is not None and getattr(clause, "is_dml", False))
+
+
+class RoutingSession(Session):
+    """Session that serves replica-eligible reads from the "replica" bind."""
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if bind is None and has_request_context():
+            if _is_write(self, clause):
+                # Read-your-writes: the rest of this request stays on the primary
+                g.db_wrote = True
+                g.read_replica = False
+            elif g.get("read_replica") and _is_plain_select(clause):
+                return self._db.engines[REPLICA_BIND]
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+
+def primary_sticky():
+    """True while the current client reads from the primary after one of its writes."""
+    return g.get("db_primary_sticky", False)
+
+
+class ReplicaRouting:
+    def __init__(self, app=None):
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.before_request(self._route_request)
+        app.after_request(self._stick_after_write)
+
+    @staticmethod
+    def enabled():
+        return REPLICA_BIND in (current_app.config.get("SQLALCHEMY_BINDS") or {})
+
+    def _route_request(self):
+        try:
+            sticky = float(request.cookies.get(STICKY_COOKIE, 0)) > time.time()
+        except ValueError:
+            sticky = False
+        g.db_primary_sticky = sticky
+        g.db_wrote = False
+        g.read_replica = (
+            self.enabled()
+            and not sticky
+            and request.method in ("GET", "HEAD")
+            and request.blueprint in current_app.config.get("REPLICA_READ_BLUEPRINTS", ())
+        )
+
+    def _stick_after_write(self, response):
+        if g.get("db_wrote") and self.enabled():
+            seconds = current_app.config.get("REPLICA_STICKY_SECONDS", 5)
+            response.set_cookie(STICKY_COOKIE, f"{time.time() + seconds:.3f}", max_age=seconds,
+                                httponly=True, samesite="Lax")
+        return response
+
+
+replica_routing = ReplicaRouting()
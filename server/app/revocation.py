@@ -0,0 +1,144 @@
+"""
+In-memory JWT revocation set.
+
+Each process keeps every still-live revoked jti in memory, so the blocklist
+check costs no database round trip. The set is loaded on first use and then
+re-synced at most once every JWT_REVOCATION_SYNC_SECONDS. A logout in another
+worker therefore takes at most that long to be seen here. A logout in this
+worker takes effect at once.
+
+A sync re-reads every row created since shortly before the previous sync.
+Rows are stamped with created_at before they commit, so a row can become
+visible after a sync that has already passed its timestamp. The window
+therefore overlaps the last sync by JWT_REVOCATION_SYNC_OVERLAP_SECONDS,
+which must exceed the longest logout transaction. Ids are not used as a
+high-water mark because they are allocated before commit as well.
+
+Entries are dropped once the revoked token would have expired anyway. Expired
+TokenBlocklist rows are deleted by `flask tokens purge`, run from a scheduler;
+the request path never writes.
+"""
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+import click
+from flask import current_app
+from flask.cli import with_appcontext
+from sqlalchemy import and_, or_
+from app import db
+from app.models.token_blocklist import TokenBlocklist
+
+
+def utcnow():
+    """Naive UTC now, matching how DateTime columns are stored."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def fallback_expiry(created_at):
+    """Latest possible expiry for rows revoked before expires_at was recorded."""
+    return created_at.replace(tzinfo=None) + current_app.config["JWT_REFRESH_TOKEN_EXPIRES"]
+
+
+def purge_expired_tokens():
+    """Deletes blocklist rows whose tokens can no longer be presented. Returns the row count."""
+    now = utcnow()
+    legacy_cutoff = now - current_app.config["JWT_REFRESH_TOKEN_EXPIRES"]
+    deleted = TokenBlocklist.query.filter(or_(
+        TokenBlocklist.expires_at < now,
+        and_(TokenBlocklist.expires_at.is_(None), TokenBlocklist.created_at < legacy_cutoff),
+    )).delete(synchronize_session=False)
+    db.session.commit()
+    return deleted
+
+
+class RevocationSet:
+    def __init__(self, sync_interval, sync_overlap):
+        self.sync_interval = sync_interval
+        self.sync_overlap = sync_overlap
+        self._entries = {}  # jti -> expiry as a UNIX timestamp
+        self._synced_at = None  # UTC time the last sync started
+        self._last_sync = None
+        self._lock = threading.Lock()
+
+    def add(self, jti, expires_at):
+        with self._lock:
+            self._entries[jti] = expires_at.replace(tzinfo=timezone.utc).timestamp()
+
+    def is_revoked(self, jti):
+        self._maybe_sync()
+        return jti in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _maybe_sync(self):
+        now = time.monotonic()
+        if self._last_sync is not None and now - self._last_sync < self.sync_interval:
+            return
+        with self._lock:
+            if self._last_sync is not None and now - self._last_sync < self.sync_interval:
+                return
+            started = utcnow()
+            # Anything revoked earlier than this has expired, so the first load skips it too
+            since = started - current_app.config["JWT_REFRESH_TOKEN_EXPIRES"]
+            if self._synced_at is not None:
+                since = max(since, self._synced_at - self.sync_overlap)
+            rows = db.session.query(
+                TokenBlocklist.jti, TokenBlocklist.expires_at, TokenBlocklist.created_at
+            ).filter(TokenBlocklist.created_at >= since).all()
+            for jti, expires_at, created_at in rows:
+                expiry = expires_at or fallback_expiry(created_at)
+                self._entries[jti] = expiry.replace(tzinfo=timezone.utc).timestamp()
+
+            cutoff = time.time()
+            for jti in [jti for jti, expiry in self._entries.items() if expiry < cutoff]:
+                del self._entries[jti]
+            self._synced_at = started
+            self._last_sync = now
+
+
+class Revocations:
+    def __init__(self, app=None):
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.extensions["revocations"] = RevocationSet(
+            sync_interval=app.config.get("JWT_REVOCATION_SYNC_SECONDS", 5),
+            sync_overlap=timedelta(seconds=app.config.get("JWT_REVOCATION_SYNC_OVERLAP_SECONDS", 60)),
+        )
+        app.cli.add_command(tokens_cli)
+
+    @property
+    def store(self):
+        return current_app.extensions["revocations"]
+
+    def revoke(self, jwt_payload):
+        """Records a token as revoked in the blocklist table and in this process's set."""
+        expires_at = datetime.fromtimestamp(jwt_payload["exp"], timezone.utc).replace(tzinfo=None)
+        db.session.add(TokenBlocklist(
+            jti=jwt_payload["jti"],
+            token_type=jwt_payload.get("type"),
+            expires_at=expires_at,
+        ))
+        db.session.commit()
+        self.store.add(jwt_payload["jti"], expires_at)
+
+    def is_revoked(self, jti):
+        return self.store.is_revoked(jti)
+
+
+@click.group("tokens")
+def tokens_cli():
+    """Manage the JWT blocklist."""
+
+
+@tokens_cli.command("purge")
+@with_appcontext
+def purge_command():
+    """Delete blocklist rows for tokens that have already expired; run it from a scheduler."""
+    deleted = purge_expired_tokens()
+    click.echo(f"Purged {deleted} expired blocklist entries.")
+
+
+revocations = Revocations()
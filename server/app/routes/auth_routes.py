@@ -1,12 +1,19 @@
 from flask import Blueprint, request, jsonify
 from app import db
 from app.models.user import User
-from app.models.token_blocklist import TokenBlocklist
+from app.passwords import PasswordHasherBusy, passwords
+from app.revocation import revocations
+from app.serializers import USER_OWNER
 from flask_jwt_extended import (create_access_token, create_refresh_token, jwt_required, get_jwt_identity,get_jwt)
 from datetime import datetime
 
 auth_bp = Blueprint('auth_bp', __name__)
 
+def hashing_busy_response():
+    response = jsonify({'error': 'Too many sign-ins in progress, please retry shortly'})
+    response.headers['Retry-After'] = '1'
+    return response, 503
+
 @auth_bp.route('/signup', methods=['POST'])
 def signup():
     data = request.get_json()
@@ -31,11 +38,14 @@ def signup():
         db.session.commit()
     except ValueError as e:
         return jsonify({'error': str(e)}), 400
+    except PasswordHasherBusy:
+        db.session.rollback()
+        return hashing_busy_response()
     
     additional_claims = {"role": new_user.role}
     access_token = create_access_token(identity=str(new_user.id), additional_claims=additional_claims)
     refresh_token = create_refresh_token(identity=str(new_user.id))
-    return jsonify(access_token=access_token, refresh_token=refresh_token, user=new_user.to_dict()), 201
+    return jsonify(access_token=access_token, refresh_token=refresh_token, user=USER_OWNER.dump(new_user)), 201
 
 @auth_bp.route('/login', methods=['POST'])
 def login():
@@ -43,20 +53,29 @@ def login():
     if not data or not all(k in data for k in ['username', 'password']):
         return jsonify({'error': 'Missing username or password'}), 400
     user = User.query.filter_by(username=data['username']).first()
-    if user and user.check_password(data['password']):
+    try:
+        authenticated = user is not None and user.check_password(data['password'])
+    except PasswordHasherBusy:
+        return hashing_busy_response()
+    if authenticated and passwords.needs_rehash(user.password_hash):
+        # The cost factor changed since this hash was made; upgrade it while we have the password
+        try:
+            user.set_password(data['password'])
+            db.session.commit()
+        except PasswordHasherBusy:
+            # A later login can upgrade it; this one has already succeeded
+            db.session.rollback()
+    if authenticated:
         additional_claims = {"role": user.role}
         access_token = create_access_token(identity=str(user.id), additional_claims=additional_claims)
         refresh_token = create_refresh_token(identity=str(user.id))
-        return jsonify(access_token=access_token, refresh_token=refresh_token, user=user.to_dict()), 200
+        return jsonify(access_token=access_token, refresh_token=refresh_token, user=USER_OWNER.dump(user)), 200
     return jsonify({'error': 'Invalid username or password'}), 401
 
 @auth_bp.route('/logout', methods=['POST'])
 @jwt_required()
 def logout():
-    jwt = get_jwt()
-    jti = jwt['jti']
-    db.session.add(TokenBlocklist(jti=jti))
-    db.session.commit()
+    revocations.revoke(get_jwt())
     return jsonify({'message': 'Logout successful.'}), 200
 
 @auth_bp.route('/profile', methods=['GET'])
@@ -64,4 +83,4 @@ def logout():
 def profile():
     user_id = get_jwt_identity()
     user = db.session.get(User, int(user_id))
-    return jsonify(user.to_dict()) if user else jsonify({'error': 'User not found'}), 404
\ No newline at end of file
+    return jsonify(USER_OWNER.dump(user)) if user else jsonify({'error': 'User not found'}), 404
\ No newline at end of file
@@ -1,19 +1,75 @@
+from datetime import datetime, timezone
 from flask import Blueprint, jsonify, request
 from app import db
+from sqlalchemy import case, func, select, update
+from sqlalchemy.exc import IntegrityError
+from app.cache import cache
+from app.conditional import conditional_response, make_etag
 from app.models.category import Category
+from app.models.event import Event
+from app.models.associations import event_categories
 from app.auth_decorators import role_required
+from app.pagination import decode_cursor, encode_cursor
+from app.serializers import CATEGORY, CATEGORY_DETAIL
 
 category_bp = Blueprint("category_bp", __name__, url_prefix="/categories")
 
 # ---------- PUBLIC ROUTES ----------
 
+FEED_SORT = "category-feed"
+
+def _links_fingerprint(category_id):
+    """
+    (count, max event_id, sum of event_ids) of a category's links. Categories list their
+    event ids, and linking or unlinking events does not touch categories.updated_at. The
+    sum tells apart link sets that swap one event for another below the maximum.
+    """
+    links = select(
+        func.count(), func.max(event_categories.c.event_id), func.sum(event_categories.c.event_id)
+    ).where(
+        event_categories.c.category_id == category_id
+    )
+    return tuple(db.session.execute(links).one())
+
+def _event_counts():
+    """{category_id: (active, upcoming)} event counts from one grouped pass over the links."""
+    now = datetime.utcnow()
+    rows = db.session.execute(
+        select(
+            event_categories.c.category_id,
+            func.count(),
+            func.sum(case((Event.date > now, 1), else_=0)),
+        )
+        .select_from(event_categories)
+        .join(Event, Event.id == event_categories.c.event_id)
+        .where(Event.is_active.is_(True))
+        .group_by(event_categories.c.category_id)
+    )
+    return {category_id: (active, upcoming or 0) for category_id, active, upcoming in rows}
+
+def _category_response(category):
+    # No Last-Modified: updated_at misses link changes, so only the ETag is reliable
+    etag = make_etag(category.id, category.updated_at, _links_fingerprint(category.id))
+    return conditional_response(lambda: jsonify(CATEGORY_DETAIL.dump(category)), etag, policy="category")
+
 @category_bp.route("/", methods=["GET"])
 def get_categories():
     """
-    Get all categories.
+    Get all categories with their active and upcoming event counts. Event ids are
+    paged through /<id>/events rather than listed here.
     """
     categories = Category.query.order_by(Category.name.asc()).all()
-    return jsonify([category.to_dict() for category in categories])
+    counts = _event_counts()
+
+    def build():
+        index = []
+        for category in categories:
+            active, upcoming = counts.get(category.id, (0, 0))
+            index.append({**CATEGORY.dump(category), "active_events": active, "upcoming_events": upcoming})
+        return jsonify(index)
+
+    etag = make_etag([(category.id, category.updated_at, counts.get(category.id)) for category in categories])
+    return conditional_response(build, etag, weak=True, policy="category")
 
 @category_bp.route("/<int:category_id>", methods=["GET"])
 def get_category_by_id(category_id):
@@ -23,7 +79,7 @@ def get_category_by_id(category_id):
     category = Category.query.get(category_id)
     if not category:
         return jsonify({"error": "Category not found"}), 404
-    return jsonify(category.to_dict())
+    return _category_response(category)
 
 @category_bp.route("/slug/<string:category_slug>", methods=["GET"])
 def get_category_by_slug(category_slug):
@@ -33,7 +89,41 @@ def get_category_by_slug(category_slug):
     category = Category.query.filter_by(slug=category_slug).first()
     if not category:
         return jsonify({"error": "Category not found"}), 404
-    return jsonify(category.to_dict())
+    return _category_response(category)
+
+@category_bp.route("/<int:category_id>/events", methods=["GET"])
+def get_category_event_ids(category_id):
+    """
+    Page through the ids of a category's active events, oldest id first.
+    ?upcoming=true keeps only events that have not started; ?cursor continues a page.
+    """
+    if not db.session.get(Category, category_id):
+        return jsonify({"error": "Category not found"}), 404
+
+    try:
+        limit = max(1, min(int(request.args.get("limit", 100)), 1000))
+    except ValueError:
+        return jsonify({"error": "limit must be an integer"}), 400
+    query = (
+        select(event_categories.c.event_id)
+        .join(Event, Event.id == event_categories.c.event_id)
+        .where(event_categories.c.category_id == category_id, Event.is_active.is_(True))
+        .order_by(event_categories.c.event_id)
+        .limit(limit + 1)
+    )
+    if request.args.get("upcoming", "").lower() in ("1", "true"):
+        query = query.where(Event.date > datetime.utcnow())
+    cursor = request.args.get("cursor")
+    if cursor:
+        try:
+            _, after_id = decode_cursor(cursor, FEED_SORT)
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+        query = query.where(event_categories.c.event_id > after_id)
+
+    event_ids = db.session.execute(query).scalars().all()
+    next_cursor = encode_cursor(FEED_SORT, None, event_ids[limit - 1]) if len(event_ids) > limit else None
+    return jsonify({"category_id": category_id, "event_ids": event_ids[:limit], "next_cursor": next_cursor})
 
 # ---------- ADMIN/ORGANIZER ROUTES ----------
 
@@ -48,22 +138,23 @@ def create_category():
         return jsonify({"error": "Missing category name"}), 400
 
     name = data["name"]
-    slug = Category.create_slug(name)
-
-    if Category.query.filter_by(slug=slug).first():
-        return jsonify({"error": "Category with this name already exists"}), 409
-
     new_category = Category(
         name=name,
-        slug=slug,
+        slug=Category.create_slug(name),
         description=data.get("description")
     )
     db.session.add(new_category)
-    db.session.commit()
+    try:
+        # The unique name and slug indexes catch duplicates without a lookup first
+        db.session.commit()
+    except IntegrityError:
+        db.session.rollback()
+        return jsonify({"error": "Category with this name already exists"}), 409
+    cache.invalidate()
 
     return jsonify({
         "message": "Category created successfully",
-        "category": new_category.to_dict()
+        "category": CATEGORY_DETAIL.dump(new_category)
     }), 201
 
 @category_bp.route("/<int:category_id>", methods=["PUT", "PATCH"])
@@ -86,10 +177,15 @@ def update_category(category_id):
     if "description" in data:
         category.description = data["description"]
 
-    db.session.commit()
+    try:
+        db.session.commit()
+    except IntegrityError:
+        db.session.rollback()
+        return jsonify({"error": "Category with this name already exists"}), 409
+    cache.invalidate()
     return jsonify({
         "message": "Category updated successfully",
-        "category": category.to_dict()
+        "category": CATEGORY_DETAIL.dump(category)
     })
 
 @category_bp.route("/<int:category_id>", methods=["DELETE"])
@@ -102,6 +198,17 @@ def delete_category(category_id):
     if not category:
         return jsonify({"error": "Category not found"}), 404
 
+    # Deleting the category unlinks its events, which leaves their timestamps alone;
+    # touch them so event ETags and Last-Modified stop matching the old categories
+    db.session.execute(
+        update(Event)
+        .where(Event.id.in_(
+            select(event_categories.c.event_id).where(event_categories.c.category_id == category_id)
+        ))
+        .values(updated_at=datetime.now(timezone.utc))
+        .execution_options(synchronize_session=False)
+    )
     db.session.delete(category)
     db.session.commit()
+    cache.invalidate()
     return jsonify({"message": "Category deleted successfully"})
\ No newline at end of file
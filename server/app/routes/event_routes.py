@@ -1,115 +1,246 @@
-from flask import Blueprint, jsonify, request, current_app
+from flask import Blueprint, Response, jsonify, request, current_app, stream_with_context
 from app import db
+from app.cache import cache
 from app.models.event import Event
 from app.models.category import Category
+from app.models.associations import event_categories
 from app.auth_decorators import role_required
+from app.conditional import cache_control, conditional_response, make_etag
+from app.facets import BAND_NAMES, facet_counts, in_price_band
+from app.bulk import FORMATS, EventImporter, export_events, read_rows
+from app.images import images, store_upload
+from app.pagination import keyset_paginate
+from app.search import search_events
+from app.serializers import EVENT_DETAIL, EVENT_SUMMARY
+from app.slugs import insert_with_slug
+from app.stats import remove_event_sales
 from flask_jwt_extended import get_jwt_identity
-from sqlalchemy import or_
+from sqlalchemy import func, or_, select
 from datetime import datetime
-import os
-import uuid
-from werkzeug.utils import secure_filename
+import io
 
 event_bp = Blueprint("events", __name__)
 
+SORT_COLUMNS = {
+    "date": Event.date,
+    "price": Event.price,
+    "title": Event.title,
+}
+
+
+def _categories_updated_at():
+    # Summaries embed category names, so renaming one changes every listing
+    return select(func.max(Category.updated_at)).correlate(None).scalar_subquery()
+
 #PUBLIC ROUTES
 
 #Route for Top Picks section
 @event_bp.route("/top-picks", methods=["GET"])
+@cache_control("listing")
+@cache.cached()
 def get_top_picks():
     """Fetches the top 4 most expensive upcoming events."""
-    events = Event.query.filter(
+    events = EVENT_SUMMARY.query().filter(
         Event.is_active == True,
         Event.date > datetime.utcnow()
     ).order_by(Event.price.desc()).limit(4).all()
-    return jsonify([event.to_summary_dict() for event in events])
+    return jsonify(EVENT_SUMMARY.dump_many(events))
 
 #Route for Featured Events section
 @event_bp.route("/featured", methods=["GET"])
+@cache_control("listing")
+@cache.cached()
 def get_featured_events():
     """Fetches the top 8 soonest upcoming events."""
-    events = Event.query.filter(
+    events = EVENT_SUMMARY.query().filter(
         Event.is_active == True,
         Event.date > datetime.utcnow()
     ).order_by(Event.date.asc()).limit(8).all()
-    return jsonify([event.to_summary_dict() for event in events])
+    return jsonify(EVENT_SUMMARY.dump_many(events))
 
 
-@event_bp.route("/", methods=["GET"])
-def get_events():
-    """Browse/filter/search/paginate events"""
+def _requested_view(view):
+    """`view` narrowed to the comma-separated ?fields= list, if one was given."""
+    names = [name.strip() for name in request.args.get("fields", "").split(",") if name.strip()]
+    return view.only(names) if names else view
+
+def _browse_query(args):
+    """
+    Builds the filtered Event query shared by the listing and its facets.
+    Returns (query, rank_order); rank_order is None unless a search term was given.
+    """
     query = Event.query.filter_by(is_active=True)
 
-    search_term = request.args.get("search", "").strip()
+    rank_order = None
+    search_term = args.get("search", "").strip()
     if search_term:
-        query = query.filter(or_(
-            Event.title.ilike(f"%{search_term}%"),
-            Event.description.ilike(f"%{search_term}%"),
-            Event.short_description.ilike(f"%{search_term}%")
-        ))
+        query, rank_order = search_events(query, search_term)
 
-    category_param = request.args.get("category", "").strip()
+    category_param = args.get("category", "").strip()
     if category_param:
-        query = query.join(Event.categories).filter(or_(
-            Category.name.ilike(f"%{category_param}%"),
-            Category.slug.ilike(f"%{category_param}%")
+        # A subquery rather than a join, so an event in several matching categories appears once
+        query = query.filter(Event.id.in_(
+            select(event_categories.c.event_id)
+            .join(Category, Category.id == event_categories.c.category_id)
+            .where(or_(
+                Category.name.ilike(f"%{category_param}%"),
+                Category.slug.ilike(f"%{category_param}%")
+            ))
         ))
 
-    location = request.args.get("location", "").strip()
+    location = args.get("location", "").strip()
     if location:
         query = query.filter(Event.location.ilike(f"%{location}%"))
 
-    upcoming = request.args.get("upcoming", "").lower()
+    band = args.get("price_band", "").strip()
+    if band:
+        if band not in BAND_NAMES:
+            raise ValueError(f"Unknown price band '{band}'; expected one of {', '.join(BAND_NAMES)}")
+        query = query.filter(in_price_band(Event.price, band))
+
+    upcoming = args.get("upcoming", "").lower()
     if upcoming == "true":
         query = query.filter(Event.date > datetime.utcnow())
 
+    return query, rank_order
+
+@event_bp.route("/", methods=["GET"])
+def get_events():
+    """Browse/filter/search/paginate events, with facet counts when facets=true"""
+    try:
+        query, rank_order = _browse_query(request.args)
+        view = _requested_view(EVENT_SUMMARY)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    # Facets are computed up front (one statement) because they change when
+    # events move from upcoming to past, which the row validators do not see.
+    facets = facet_counts(query) if request.args.get("facets", "").lower() == "true" else None
+
     sort_by = request.args.get("sort", "date")
-    if sort_by == "price":
-        query = query.order_by(Event.price.asc())
-    elif sort_by == "title":
-        query = query.order_by(Event.title.asc())
-    else:
-        query = query.order_by(Event.date.asc())
+    if sort_by not in SORT_COLUMNS:
+        sort_by = "date"
+    sort_column = SORT_COLUMNS[sort_by]
+    try:
+        limit = max(1, min(int(request.args.get("limit", 20)), 100))
+    except ValueError:
+        return jsonify({"error": "limit must be an integer"}), 400
+
+    # Keyset mode: ?cursor= (empty for the first page) seeks on (sort key, id)
+    # and only counts the matching rows when include_total=true is passed.
+    # The page is first resolved to (id, updated_at) pairs, which double as its ETag.
+    if "cursor" in request.args:
+        try:
+            rows, next_cursor = keyset_paginate(
+                query.with_entities(Event.id, Event.updated_at, sort_column, _categories_updated_at()),
+                sort_by, sort_column, Event.id, request.args["cursor"], limit
+            )
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+
+        def build():
+            ids = [row.id for row in rows]
+            by_id = {
+                event.id: event
+                for event in view.query().filter(Event.id.in_(ids))
+            } if ids else {}
+            pagination = {
+                "items_per_page": limit,
+                "next_cursor": next_cursor,
+                "has_next": next_cursor is not None,
+            }
+            if request.args.get("include_total", "").lower() == "true":
+                pagination["total_items"] = query.order_by(None).count()
+            return jsonify(_with_facets({
+                "success": True,
+                "events": view.dump_many(by_id[event_id] for event_id in ids),
+                "pagination": pagination,
+            }, facets))
+
+        etag = make_etag([tuple(row[:2]) for row in rows], rows[0][3] if rows else None, next_cursor, facets)
+        return conditional_response(build, etag, weak=True, policy="listing")
 
+    # Offset mode: one aggregate yields both the total and the validators, so a
+    # matching If-None-Match costs a single query.
     page = int(request.args.get("page", 1))
-    limit = min(int(request.args.get("limit", 20)), 100)
-    events_paginated = query.paginate(page=page, per_page=limit, error_out=False)
-
-    return jsonify({
-        "success": True,
-        "events": [event.to_summary_dict() for event in events_paginated.items],
-        "pagination": {
-            "current_page": page,
-            "total_pages": events_paginated.pages,
-            "total_items": events_paginated.total,
-            "items_per_page": limit,
-            "has_next": events_paginated.has_next,
-            "has_prev": events_paginated.has_prev,
-        }
-    })
+    total, last_updated, categories_updated = query.order_by(None).with_entities(
+        func.count(Event.id), func.max(Event.updated_at), _categories_updated_at()
+    ).one()
+
+    def build():
+        page_query = query.options(view.projection(), *view.options())
+        # Search results are ranked by relevance unless a sort order was asked for
+        if rank_order is not None and "sort" not in request.args:
+            page_query = page_query.order_by(rank_order, Event.id.asc())
+        else:
+            page_query = page_query.order_by(sort_column.asc(), Event.id.asc())
+        events_paginated = page_query.paginate(page=page, per_page=limit, error_out=False, count=False)
+        events_paginated.total = total
+
+        return jsonify(_with_facets({
+            "success": True,
+            "events": view.dump_many(events_paginated.items),
+            "pagination": {
+                "current_page": page,
+                "total_pages": events_paginated.pages,
+                "total_items": events_paginated.total,
+                "items_per_page": limit,
+                "has_next": events_paginated.has_next,
+                "has_prev": events_paginated.has_prev,
+            }
+        }, facets))
+
+    etag = make_etag(total, last_updated, categories_updated, facets)
+    return conditional_response(build, etag, weak=True, policy="listing")
+
+def _with_facets(body, facets):
+    if facets is not None:
+        body["facets"] = facets
+    return body
+
+def _event_validators(**filters):
+    return db.session.query(
+        Event.id, Event.updated_at, _categories_updated_at().label("categories_updated_at")
+    ).filter_by(is_active=True, **filters).first()
+
+def _event_detail(event_id, view=EVENT_DETAIL):
+    return view.dump(view.query().filter_by(id=event_id).one())
+
+def _event_detail_response(validators):
+    """Serves one active event, answering conditional requests from its timestamps alone."""
+    try:
+        view = _requested_view(EVENT_DETAIL)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    if not validators:
+        return jsonify({"error": "Event not found"}), 404
+    event_id, updated_at, categories_updated = validators
+
+    def build():
+        return jsonify(_event_detail(event_id, view))
+
+    last_modified = max(filter(None, (updated_at, categories_updated)), default=None)
+    etag = make_etag(event_id, updated_at, categories_updated)
+    return conditional_response(build, etag, last_modified=last_modified, policy="event")
 
 @event_bp.route("/<int:event_id>", methods=["GET"])
 def get_event_by_id(event_id):
-    event = Event.query.filter_by(id=event_id, is_active=True).first()
-    if not event:
-        return jsonify({"error": "Event not found"}), 404
-    return jsonify(event.to_dict(include_categories=True))
+    return _event_detail_response(_event_validators(id=event_id))
 
 @event_bp.route("/slug/<string:event_slug>", methods=["GET"])
 def get_event_by_slug(event_slug):
-    event = Event.query.filter_by(slug=event_slug, is_active=True).first()
-    if not event:
-        return jsonify({"error": "Event not found"}), 404
-    return jsonify(event.to_dict(include_categories=True))
+    return _event_detail_response(_event_validators(slug=event_slug))
 
 @event_bp.route("/upcoming", methods=["GET"])
+@cache_control("listing")
+@cache.cached()
 def get_upcoming_events():
     limit = min(int(request.args.get("limit", 10)), 50)
-    events = Event.query.filter(
+    events = EVENT_SUMMARY.query().filter(
         Event.is_active == True,
         Event.date > datetime.utcnow()
     ).order_by(Event.date.asc()).limit(limit).all()
-    return jsonify([event.to_summary_dict() for event in events])
+    return jsonify(EVENT_SUMMARY.dump_many(events))
 
 #ORGANIZER CRUD ROUTES
 
@@ -125,15 +256,13 @@ def create_event():
             return jsonify({"error": "Missing required fields"}), 400
 
         image_url_path = None
+        filename = None
         if "image_url" in request.files:
             file = request.files["image_url"]
             if file and file.filename:
                 upload_folder = current_app.config.get("UPLOAD_FOLDER")
                 if upload_folder:
-                    os.makedirs(upload_folder, exist_ok=True)
-                    filename = secure_filename(f"{uuid.uuid4()}_{file.filename}")
-                    filepath = os.path.join(upload_folder, filename)
-                    file.save(filepath)
+                    filename = store_upload(file, upload_folder)
                     image_url_path = f"/uploads/{filename}"
 
         new_event = Event(
@@ -147,20 +276,22 @@ def create_event():
             venue=data.get("venue"),
             image_url=image_url_path,
             organizer_id=organizer_id,
-            slug=Event.create_slug(data.get("title"))
         )
-        
-        db.session.add(new_event)
+
+        insert_with_slug(new_event, Event.slugify(data.get("title")) or "event")
         db.session.commit()
+        cache.invalidate()
+        if filename:
+            images.submit(new_event.id, filename)
 
         return jsonify({
             "message": "Event created successfully",
-            "event": new_event.to_dict()
+            "event": _event_detail(new_event.id)
         }), 201
 
     except Exception as e:
         db.session.rollback()
-        print(f"Error creating event: {e}")
+        current_app.logger.exception(f"Error creating event: {e}")
         return jsonify({"error": "An internal error occurred."}), 500
 
 @event_bp.route("/<int:id>", methods=["PATCH"])
@@ -176,26 +307,28 @@ def update_event(id):
 
     data = request.form.to_dict() if request.files else request.get_json()
 
+    filename = None
     if "image_url" in request.files:
         file = request.files["image_url"]
         if file and file.filename:
             upload_folder = current_app.config.get("UPLOAD_FOLDER")
             if upload_folder:
-                os.makedirs(upload_folder, exist_ok=True)
-                filename = secure_filename(f"{uuid.uuid4()}_{file.filename}")
-                filepath = os.path.join(upload_folder, filename)
-                file.save(filepath)
+                filename = store_upload(file, upload_folder)
                 event.image_url = f"/uploads/{filename}"
+                event.image_variants = None
 
     for key, value in data.items():
-        if hasattr(event, key) and key not in ["image_url", "id", "slug", "organizer_id"]:
+        if hasattr(event, key) and key not in ["image_url", "image_variants", "tickets_sold", "id", "slug", "organizer_id"]:
             if key == 'date' and value:
                 event.date = datetime.fromisoformat(value.replace("Z", "+00:00"))
             else:
                  setattr(event, key, value)
 
     db.session.commit()
-    return jsonify({"message": "Event updated", "event": event.to_dict()})
+    cache.invalidate()
+    if filename:
+        images.submit(event.id, filename)
+    return jsonify({"message": "Event updated", "event": _event_detail(event.id)})
 
 @event_bp.route("/<int:id>", methods=["DELETE"])
 @role_required(["organizer"])
@@ -208,6 +341,57 @@ def delete_event(id):
     if str(event.organizer_id) != str(organizer_id_from_token):
         return jsonify({"error": "Unauthorized"}), 403
         
+    # The event's tickets go with it, so take its sales out of the organizer's stats first
+    remove_event_sales(event)
     db.session.delete(event)
     db.session.commit()
-    return jsonify({"message": "Event deleted"})
\ No newline at end of file
+    cache.invalidate()
+    return jsonify({"message": "Event deleted"})
+
+#BULK ROUTES
+
+BULK_MIMETYPES = {"csv": "text/csv", "ndjson": "application/x-ndjson"}
+
+@event_bp.route("/bulk", methods=["POST"])
+@role_required(["organizer"])
+def bulk_import_events():
+    """Imports a CSV or NDJSON request body as events owned by the organizer."""
+    fmt = request.args.get("format") or ("csv" if request.mimetype == "text/csv" else "ndjson")
+    if fmt not in FORMATS:
+        return jsonify({"error": f"Unsupported format. Use one of {list(FORMATS)}"}), 400
+    try:
+        batch_size = min(max(int(request.args.get("batch_size", 1000)), 1), 5000)
+    except ValueError:
+        return jsonify({"error": "batch_size must be an integer"}), 400
+
+    # Decode the body as it arrives instead of buffering it
+    stream = io.TextIOWrapper(io.BufferedReader(request.stream), encoding="utf-8", newline="")
+    importer = EventImporter(organizer_id=int(get_jwt_identity()), batch_size=batch_size)
+    try:
+        summary = importer.run(read_rows(stream, fmt))
+    except Exception as e:
+        db.session.rollback()
+        current_app.logger.exception(f"Error importing events: {e}")
+        summary = importer.summary()
+        summary["error"] = "Import stopped by an internal error; earlier batches were saved."
+        return jsonify(summary), 500
+    finally:
+        if importer.batches:
+            cache.invalidate()
+
+    return jsonify(summary), 201 if summary["imported"] else 400
+
+@event_bp.route("/bulk", methods=["GET"])
+@role_required(["organizer"])
+def bulk_export_events():
+    """Streams the organizer's events as CSV or NDJSON."""
+    fmt = request.args.get("format", "ndjson")
+    if fmt not in FORMATS:
+        return jsonify({"error": f"Unsupported format. Use one of {list(FORMATS)}"}), 400
+
+    query = select(Event).filter_by(organizer_id=int(get_jwt_identity())).order_by(Event.id)
+    return Response(
+        stream_with_context(export_events(fmt, query)),
+        mimetype=BULK_MIMETYPES[fmt],
+        headers={"Content-Disposition": f"attachment; filename=events.{fmt}"},
+    )
@@ -1,13 +1,25 @@
-from flask import Blueprint, jsonify, request
+from flask import Blueprint, current_app, jsonify, request
 from app import db
 from app.models.ticket import Ticket
 from app.models.event import Event
 from app.auth_decorators import role_required
+from app.serializers import TICKET
+from app.stats import record_purchase
 from flask_jwt_extended import get_jwt_identity
-from sqlalchemy import func
+from sqlalchemy import or_, update
+from sqlalchemy.exc import IntegrityError
+from datetime import datetime, timezone
 
 ticket_bp = Blueprint("ticket_bp", __name__)
 
+def _is_duplicate_purchase(error):
+    """True if `error` is the (user_id, event_id) unique constraint rejecting a second purchase."""
+    diag = getattr(error.orig, "diag", None)
+    if diag is not None and diag.constraint_name:
+        return diag.constraint_name == "uq_tickets_user_id_event_id"
+    # SQLite reports the columns rather than the constraint name
+    return "UNIQUE constraint failed: tickets.user_id, tickets.event_id" in str(error.orig)
+
 @ticket_bp.route("/", methods=["POST"])
 @role_required(["attendee"])
 def purchase_ticket():
@@ -20,33 +32,47 @@ def purchase_ticket():
     if not event_id or not isinstance(quantity, int) or quantity <= 0:
         return jsonify({"error": "Event ID and a valid quantity are required"}), 400
 
-    event = Event.query.get(event_id)
-    if not event:
-        return jsonify({"error": "Event not found"}), 404
-
-    existing_ticket = Ticket.query.filter_by(user_id=user_id, event_id=event_id).first()
-    if existing_ticket:
-        return jsonify({"error": "You already have tickets for this event"}), 409
+    try:
+        # Reserve inventory first: one conditional UPDATE that only succeeds while
+        # capacity remains. It takes the row (PostgreSQL) or write (SQLite) lock,
+        # so concurrent purchases serialize here and can never oversell.
+        reserved = db.session.execute(
+            update(Event)
+            .where(
+                Event.id == event_id,
+                or_(Event.max_attendees.is_(None), Event.tickets_sold + quantity <= Event.max_attendees)
+            )
+            .values(tickets_sold=Event.tickets_sold + quantity)
+            .returning(Event.organizer_id, Event.price)
+            .execution_options(synchronize_session=False)
+        ).first()
 
-    # -Capacity check
-    if event.max_attendees is not None:
-        # Sum the quantity of all tickets sold for this event
-        tickets_sold = db.session.query(func.sum(Ticket.quantity)).filter(Ticket.event_id == event_id).scalar() or 0
-        
-        if (tickets_sold + quantity) > event.max_attendees:
-            remaining_tickets = event.max_attendees - tickets_sold
+        if not reserved:
+            db.session.rollback()
+            event = db.session.get(Event, event_id)
+            if not event:
+                return jsonify({"error": "Event not found"}), 404
+            remaining_tickets = event.max_attendees - event.tickets_sold
             return jsonify({"error": f"Cannot purchase {quantity} tickets. Only {remaining_tickets} tickets remaining."}), 409
 
-    try:
-        #  Save ticket with the specified quantity
-        new_ticket = Ticket(user_id=user_id, event_id=event_id, quantity=quantity)
+        #  Save ticket with the specified quantity; the (user_id, event_id)
+        #  unique constraint rejects a second purchase and releases the reservation
+        purchased_at = datetime.now(timezone.utc)
+        new_ticket = Ticket(user_id=user_id, event_id=event_id, quantity=quantity, purchase_date=purchased_at,
+                            unit_price=reserved.price)
         db.session.add(new_ticket)
+        record_purchase(reserved.organizer_id, int(user_id), reserved.price, quantity, purchased_at)
         db.session.commit()
         return jsonify({
             "message": "Ticket purchased successfully!",
-            "ticket": new_ticket.to_dict()
+            "ticket": TICKET.dump(new_ticket)
         }), 201
+    except IntegrityError as e:
+        db.session.rollback()
+        if not _is_duplicate_purchase(e):
+            raise
+        return jsonify({"error": "You already have tickets for this event"}), 409
     except Exception as e:
         db.session.rollback()
-        print(f"Error purchasing ticket: {e}")
+        current_app.logger.exception(f"Error purchasing ticket: {e}")
         return jsonify({"error": "An error occurred while purchasing the ticket."}), 500
\ No newline at end of file
@@ -4,9 +4,9 @@ from flask_jwt_extended import get_jwt, get_jwt_identity
 from app.models.user import User
 from app.models.event import Event
 from app.models.ticket import Ticket
-from app import db
-from sqlalchemy import func, distinct
-from datetime import datetime, date, timedelta
+from app.serializers import EVENT_OWNER, TICKET_WITH_EVENT
+from app.stats import get_organizer_stats as read_organizer_stats
+from app.streaming import ndjson_response, wants_stream
 
 user_bp = Blueprint('user_bp', __name__)
 
@@ -15,28 +15,35 @@ user_bp = Blueprint('user_bp', __name__)
 def get_organizer_events():
     """Fetches all events created by the logged-in organizer."""
     organizer_id = get_jwt_identity()
-    events = Event.query.filter_by(organizer_id=organizer_id).order_by(Event.date.desc()).all()
-    return jsonify([event.to_dict(include_categories=False) for event in events])
+    query = Event.query.filter_by(organizer_id=organizer_id).order_by(Event.date.desc(), Event.id.desc())
+    if wants_stream():
+        return ndjson_response(query, EVENT_OWNER.dump)
+    return jsonify(EVENT_OWNER.dump_many(query.all()))
 
 @user_bp.route('/attendee/tickets', methods=['GET'])
 @role_required(['attendee'])
 def get_attendee_tickets():
     """Fetches all tickets for the logged-in attendee."""
     user_id = get_jwt_identity()
-    tickets = Ticket.query.filter_by(user_id=user_id).join(Event).order_by(Event.date.asc()).all()
-    return jsonify([ticket.to_dict(include_event=True) for ticket in tickets])
+    query = Ticket.query.filter_by(user_id=user_id).join(Event)\
+        .options(*TICKET_WITH_EVENT.options())\
+        .order_by(Event.date.asc(), Ticket.id.asc())
+    if wants_stream():
+        return ndjson_response(query, TICKET_WITH_EVENT.dump)
+    return jsonify(TICKET_WITH_EVENT.dump_many(query.all()))
 
 @user_bp.route('/attendee/tickets/<int:ticket_id>', methods=['GET'])
 @role_required(['attendee'])
 def get_ticket_details(ticket_id):
     """Fetches details for a single ticket, ensuring it belongs to the user."""
     user_id = get_jwt_identity()
-    ticket = Ticket.query.filter_by(id=ticket_id, user_id=user_id).first()
+    ticket = Ticket.query.filter_by(id=ticket_id, user_id=user_id)\
+        .options(*TICKET_WITH_EVENT.options()).first()
     
     if not ticket:
         return jsonify({"error": "Ticket not found or you do not have permission to view it."}), 404
         
-    return jsonify(ticket.to_dict(include_event=True))
+    return jsonify(TICKET_WITH_EVENT.dump(ticket))
 
 @user_bp.route('/organizer/stats', methods=['GET'])
 @role_required(['organizer'])
@@ -44,30 +51,10 @@ def get_organizer_stats():
     """Calculates and returns key statistics for the organizer."""
     organizer_id = get_jwt_identity()
 
-    # Total revenue from all tickets sold
-    total_revenue_query = db.session.query(func.sum(Event.price * Ticket.quantity))\
-        .join(Ticket, Ticket.event_id == Event.id)\
-        .filter(Event.organizer_id == organizer_id).scalar()
-    
-    # Total tickets sold this month
-    today = date.today()
-    start_of_month = today.replace(day=1)
-    tickets_this_month_query = db.session.query(func.sum(Ticket.quantity))\
-        .join(Event, Ticket.event_id == Event.id)\
-        .filter(Event.organizer_id == organizer_id, Ticket.purchase_date >= start_of_month).scalar()
-
-    #Calculates unique new attendees in the last 30 days
-    thirty_days_ago = datetime.utcnow() - timedelta(days=30)
-    new_attendees_query = db.session.query(func.count(distinct(Ticket.user_id)))\
-        .join(Event, Ticket.event_id == Event.id)\
-        .filter(Event.organizer_id == organizer_id, Ticket.purchase_date >= thirty_days_ago).scalar()
+    # Revenue, tickets this month and new attendees come from the
+    # incrementally maintained rollups in app.stats
+    stats = read_organizer_stats(int(organizer_id))
 
-    stats = {
-        "total_revenue": total_revenue_query or 0,
-        "tickets_this_month": tickets_this_month_query or 0,
-        "new_attendees": new_attendees_query or 0
-    }
-    
     return jsonify(stats)
 
 @user_bp.route('/dashboard', methods=['GET'])
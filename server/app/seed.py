@@ -11,6 +11,18 @@ from app.models.category import Category
 from app.models.user import User
 
 
+CATEGORIES = [
+    {'name': 'Music & Concerts', 'description': 'Live music performances, concerts, and music festivals', 'slug': 'music-concerts'},
+    {'name': 'Technology', 'description': 'Tech conferences, workshops, hackathons, and meetups', 'slug': 'technology'},
+    {'name': 'Sports & Fitness', 'description': 'Sporting events, tournaments, marathons, and fitness activities', 'slug': 'sports-fitness'},
+    {'name': 'Business & Networking', 'description': 'Business conferences, networking events, and entrepreneurship', 'slug': 'business-networking'},
+    {'name': 'Arts & Culture', 'description': 'Cultural festivals, art exhibitions, theater, and cultural events', 'slug': 'arts-culture'},
+    {'name': 'Food & Drink', 'description': 'Food festivals, wine tastings, and culinary experiences', 'slug': 'food-drink'},
+    {'name': 'Education & Workshops', 'description': 'Educational seminars, workshops, and training sessions', 'slug': 'education-workshops'},
+    {'name': 'Community & Social', 'description': 'Community gatherings, charity events, and social activities', 'slug': 'community-social'}
+]
+
+
 def clear_data():
     """Drops all tables and recreates them."""
     print("Clearing existing data...")
@@ -55,16 +67,7 @@ def create_categories():
     """Seeds the database with event categories."""
     print("📂 Creating categories...")
     
-    categories_data = [
-        {'name': 'Music & Concerts', 'description': 'Live music performances, concerts, and music festivals', 'slug': 'music-concerts'},
-        {'name': 'Technology', 'description': 'Tech conferences, workshops, hackathons, and meetups', 'slug': 'technology'},
-        {'name': 'Sports & Fitness', 'description': 'Sporting events, tournaments, marathons, and fitness activities', 'slug': 'sports-fitness'},
-        {'name': 'Business & Networking', 'description': 'Business conferences, networking events, and entrepreneurship', 'slug': 'business-networking'},
-        {'name': 'Arts & Culture', 'description': 'Cultural festivals, art exhibitions, theater, and cultural events', 'slug': 'arts-culture'},
-        {'name': 'Food & Drink', 'description': 'Food festivals, wine tastings, and culinary experiences', 'slug': 'food-drink'},
-        {'name': 'Education & Workshops', 'description': 'Educational seminars, workshops, and training sessions', 'slug': 'education-workshops'},
-        {'name': 'Community & Social', 'description': 'Community gatherings, charity events, and social activities', 'slug': 'community-social'}
-    ]
+    categories_data = CATEGORIES
     
     categories = {}
     for cat_data in categories_data:
@@ -0,0 +1,234 @@
+"""
+Declarative, compiled serializers for API responses.
+
+Each Serializer is one view of a model, listing its fields:
+
+- a string copies the attribute of that name;
+- Computed(name, function) stores function(obj);
+- Nested(name, serializer) serializes a relationship with another view.
+
+The field list is compiled once into a generated function that builds the
+dict with direct attribute reads, so dumping costs about as much as a
+hand-written dict literal. Values are left raw (datetimes included) for
+app.json_provider to encode.
+
+A view also plans its loads. `projection()` is a load_only option for the
+columns it reads, `options()` returns the selectinload chains for its Nested
+fields, and `query()` applies both. `only(names)` narrows a view to a sparse
+fieldset, dropping the columns and relationships it no longer needs. Each view
+keeps its MAX_SUBSETS most recently used narrowed views compiled. Relationships
+must be loaded before dumping; one that is not would lazy-load a query per row. With
+SERIALIZER_RAISE_ON_LAZY_LOAD set (as in tests), a second compiled variant
+checks every nested relationship first and raises UnplannedLoad instead.
+Otherwise the load happens and app.instrumentation's N+1 detection reports it.
+"""
+import threading
+from collections import OrderedDict
+from flask import current_app, has_app_context
+from sqlalchemy import inspect as sa_inspect, select
+from sqlalchemy.orm import configure_mappers, load_only, selectinload
+from sqlalchemy.orm.attributes import instance_state
+from app import db
+from app.models.associations import event_categories
+from app.models.category import Category
+from app.models.event import Event
+from app.models.ticket import Ticket
+from app.models.user import User
+
+# Compiled sparse fieldsets kept per view; clients choose them, so the set is bounded
+MAX_SUBSETS = 128
+
+
+class UnplannedLoad(Exception):
+    pass
+
+
+class Computed:
+    def __init__(self, name, function, columns=()):
+        self.name = name
+        self.function = function
+        # Columns the function reads, so projections load them
+        self.columns = tuple(columns)
+
+
+class Nested:
+    def __init__(self, name, serializer, many=False):
+        self.name = name
+        self.serializer = serializer
+        self.many = many
+
+
+class Serializer:
+    def __init__(self, model, fields, name=None):
+        self.model = model
+        self.fields = tuple(fields)
+        self.name = name or model.__name__
+        self._dump = self._compile()
+        self._checked = self._compile(checked=True)
+        self._subsets = OrderedDict()
+        self._subsets_lock = threading.Lock()
+
+    @property
+    def field_names(self):
+        return tuple(field if isinstance(field, str) else field.name for field in self.fields)
+
+    def _compile(self, checked=False):
+        """
+        Generates the dump function. The checked variant first verifies that each
+        nested relationship is loaded, and its nested dumps are checked too.
+        """
+        namespace = {"_state": instance_state, "_unplanned": self._unplanned}
+        checks = []
+        items = []
+        for i, field in enumerate(self.fields):
+            if isinstance(field, str):
+                if not field.isidentifier() or not hasattr(self.model, field):
+                    raise ValueError(f"{self.model.__name__} has no attribute '{field}'")
+                items.append(f"{field!r}: obj.{field}")
+            elif isinstance(field, Computed):
+                namespace[f"_computed{i}"] = field.function
+                items.append(f"{field.name!r}: _computed{i}(obj)")
+            elif isinstance(field, Nested):
+                if not hasattr(self.model, field.name):
+                    raise ValueError(f"{self.model.__name__} has no relationship '{field.name}'")
+                namespace[f"_nested{i}"] = field.serializer._checked if checked else field.serializer._dump
+                # Loaded attributes live in the instance dict; only persistent rows can lazy-load
+                checks.append(f"    if {field.name!r} not in obj.__dict__ and _state(obj).key is not None:\n"
+                              f"        raise _unplanned({field.name!r})\n")
+                if field.many:
+                    items.append(f"{field.name!r}: [_nested{i}(item) for item in obj.{field.name}]")
+                else:
+                    items.append(f"{field.name!r}: None if (_value{i} := obj.{field.name}) is None "
+                                 f"else _nested{i}(_value{i})")
+            else:
+                raise TypeError(f"Unsupported field: {field!r}")
+        source = "def dump(obj):\n" + ("".join(checks) if checked else "") \
+            + "    return {" + ", ".join(items) + "}\n"
+        exec(compile(source, f"<serializer {self.name}>", "exec"), namespace)
+        return namespace["dump"]
+
+    def _unplanned(self, relationship):
+        return UnplannedLoad(f"Serializer {self.name} would lazy-load {self.model.__name__}.{relationship}; "
+                             "load it with the query's options")
+
+    def only(self, names):
+        """
+        This view narrowed to `names`, in its own field order; "id" is always kept.
+        The MAX_SUBSETS most recently used field sets stay compiled. Raises ValueError for unknown names.
+        """
+        names = frozenset(names)
+        unknown = names - set(self.field_names)
+        if unknown:
+            raise ValueError(f"Unknown fields: {', '.join(sorted(unknown))}. "
+                             f"Available: {', '.join(self.field_names)}")
+        with self._subsets_lock:
+            view = self._subsets.get(names)
+            if view is not None:
+                self._subsets.move_to_end(names)
+                return view
+        fields = [field for field, name in zip(self.fields, self.field_names) if name in names or name == "id"]
+        view = Serializer(self.model, fields, name=f"{self.name}[{','.join(sorted(names))}]")
+        with self._subsets_lock:
+            # Another thread may have compiled the same set meanwhile; either view works
+            self._subsets[names] = view
+            while len(self._subsets) > MAX_SUBSETS:
+                self._subsets.popitem(last=False)
+        return view
+
+    @property
+    def columns(self):
+        """Names of the model columns this view reads, always including the primary key."""
+        mapper = sa_inspect(self.model)
+        column_names = set(mapper.column_attrs.keys())
+        columns = {prop.key for prop in mapper.column_attrs if any(c.primary_key for c in prop.columns)}
+        for field in self.fields:
+            if isinstance(field, str) and field in column_names:
+                columns.add(field)
+            elif isinstance(field, Computed):
+                columns.update(field.columns)
+            elif isinstance(field, Nested):
+                # The relationship is loaded through these (the foreign key of a many-to-one)
+                relationship = mapper.relationships[field.name]
+                columns.update(mapper.get_property_by_column(c).key for c in relationship.local_columns)
+        return columns
+
+    def projection(self):
+        """
+        A load_only option for this view's columns. Under SERIALIZER_RAISE_ON_LAZY_LOAD
+        any other column raises when read instead of loading a row at a time.
+        """
+        strict = has_app_context() and current_app.config.get("SERIALIZER_RAISE_ON_LAZY_LOAD", False)
+        return load_only(*(getattr(self.model, name) for name in sorted(self.columns)), raiseload=strict)
+
+    def options(self, parent=None):
+        """Loader options that load every relationship this view reads."""
+        options = []
+        for field in self.fields:
+            if isinstance(field, Nested):
+                attribute = getattr(self.model, field.name)
+                loader = parent.selectinload(attribute) if parent is not None else selectinload(attribute)
+                # A chain loads every relationship along it, so only the deepest ones are needed
+                options.extend(field.serializer.options(loader) or [loader])
+        return options
+
+    def query(self):
+        """The model's query with this view's columns and relationships planned."""
+        return self.model.query.options(self.projection(), *self.options())
+
+    def _function(self):
+        if has_app_context() and current_app.config.get("SERIALIZER_RAISE_ON_LAZY_LOAD"):
+            return self._checked
+        return self._dump
+
+    def dump(self, obj):
+        return self._function()(obj)
+
+    def dump_many(self, objs):
+        dump = self._function()
+        return [dump(obj) for obj in objs]
+
+
+def category_event_ids(category):
+    # Read from the (category_id, event_id) index instead of loading every event
+    return db.session.scalars(
+        select(event_categories.c.event_id)
+        .where(event_categories.c.category_id == category.id)
+        .order_by(event_categories.c.event_id)
+    ).all()
+
+
+# Backrefs such as Ticket.event only exist once the mappers are configured
+configure_mappers()
+
+CATEGORY_REF = Serializer(Category, ["id", "name", "slug"], name="CATEGORY_REF")
+CATEGORY = Serializer(Category, ["id", "name", "description", "slug", "created_at", "updated_at"], name="CATEGORY")
+CATEGORY_DETAIL = Serializer(Category, CATEGORY.fields + (Computed("events", category_event_ids),),
+                             name="CATEGORY_DETAIL")
+
+_IMAGE_COLUMNS = ("image_url", "image_variants")
+EVENT_SUMMARY = Serializer(Event, [
+    "id", "title", "short_description", "date", "location", "price", "currency",
+    Computed("image_url", lambda event: event._get_full_image_url("card"), _IMAGE_COLUMNS),
+    Computed("thumbnail_url", lambda event: event._get_full_image_url("thumb"), _IMAGE_COLUMNS),
+    "slug",
+    Nested("categories", CATEGORY_REF, many=True),
+], name="EVENT_SUMMARY")
+
+_EVENT_FIELDS = (
+    "id", "title", "description", "short_description", "date", "end_date", "location", "venue", "price",
+    "currency",
+    Computed("image_url", lambda event: event._get_full_image_url(), _IMAGE_COLUMNS),
+    Computed("image_variants", lambda event: event.image_variant_urls(), _IMAGE_COLUMNS),
+    "is_active", "max_attendees", "slug", "organizer_id", "created_at", "updated_at",
+)
+EVENT_DETAIL = Serializer(Event, _EVENT_FIELDS + (Nested("categories", CATEGORY, many=True),), name="EVENT_DETAIL")
+# The organizer's own events: sales figures, no categories
+EVENT_OWNER = Serializer(Event, _EVENT_FIELDS + ("tickets_sold",), name="EVENT_OWNER")
+
+TICKET = Serializer(Ticket, ["id", "purchase_date", "quantity", "user_id", "event_id"], name="TICKET")
+TICKET_WITH_EVENT = Serializer(Ticket, TICKET.fields + (Nested("event", EVENT_SUMMARY),), name="TICKET_WITH_EVENT")
+
+# A user's own account; never exposes the password hash
+USER_OWNER = Serializer(User, [
+    "id", "first_name", "last_name", "phone_number", "username", "email", "role", "created_at",
+], name="USER_OWNER")
@@ -0,0 +1,41 @@
+"""
+Slug allocation.
+
+Allocation relies on the unique index rather than a lookup. `insert_with_slug`
+flushes the new row inside a SAVEPOINT using the plain slug, and if the index
+rejects it, retries with a random suffix. The common, collision-free case
+costs no extra query, and two concurrent creates cannot both take the same
+slug.
+
+Slug URLs are resolved with a plain query on the same unique index. The
+route needs the row anyway, so a cached slug -> id map would still cost that
+one query, only by primary key instead; it is not kept.
+"""
+import uuid
+from sqlalchemy.exc import IntegrityError
+from app import db
+
+MAX_ATTEMPTS = 5
+
+
+class SlugTaken(Exception):
+    pass
+
+
+def _is_slug_violation(error):
+    return "slug" in str(error.orig).lower()
+
+
+def insert_with_slug(obj, base):
+    """Adds `obj` with `base` as its slug, or `base` plus a random suffix if taken. Flushes; does not commit."""
+    for attempt in range(MAX_ATTEMPTS):
+        obj.slug = base if attempt == 0 else f"{base}-{uuid.uuid4().hex[:6]}"
+        try:
+            with db.session.begin_nested():
+                db.session.add(obj)
+            return obj.slug
+        except IntegrityError as e:
+            if not _is_slug_violation(e):
+                raise
+    raise SlugTaken(f"No free slug for '{base}' after {MAX_ATTEMPTS} attempts")
+
@@ -0,0 +1,162 @@
+"""
+Serving the built single-page client from CLIENT_DIST_FOLDER (client/dist).
+
+The folder is indexed once at startup into an in-memory manifest, so resolving
+a request never probes the filesystem. Pre-built `.br` and `.gz` siblings are
+picked through Accept-Encoding, and `flask assets compress` writes them after
+`npm run build`. Files the bundler names with a content hash (Vite's
+`assets/index-3f9aB1cD.js`: under assets/, an 8-character hash containing a
+digit) are cached as immutable. Everything else, including public/ files such as
+apple-touch-icon.png and the index.html fallback for client-side routes, is
+revalidated with its ETag.
+Files go out through send_file, which hands them to the WSGI server's
+file_wrapper (sendfile under gunicorn), or to the front proxy when
+USE_X_SENDFILE is set.
+"""
+import gzip
+import mimetypes
+import os
+import re
+import shutil
+from datetime import datetime, timezone
+import click
+from flask import abort, current_app, request, send_file
+from flask.cli import with_appcontext
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - brotli is an optional dependency
+    brotli = None
+
+# Preferred first when the client accepts several
+ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+# Vite's build.assetsDir and its default [name]-[hash].[ext] file names
+BUNDLE_DIR = "assets/"
+HASHED_NAME = re.compile(r"-(?=[A-Za-z_-]{0,7}[0-9])[A-Za-z0-9_-]{8}\.[A-Za-z0-9]+$")
+COMPRESSIBLE_TYPES = ("text/", "application/javascript", "application/json", "image/svg+xml", "application/manifest+json")
+MIN_COMPRESS_SIZE = 1024
+IMMUTABLE = "public, max-age=31536000, immutable"
+REVALIDATE = "no-cache"
+
+
+class Asset:
+    __slots__ = ("path", "mimetype", "size", "mtime", "etag", "immutable", "variants")
+
+    def __init__(self, path, rel_path):
+        stat = os.stat(path)
+        self.path = path
+        self.mimetype = mimetypes.guess_type(rel_path)[0] or "application/octet-stream"
+        self.size = stat.st_size
+        self.mtime = datetime.fromtimestamp(stat.st_mtime, timezone.utc)
+        self.etag = f"{stat.st_mtime_ns:x}-{stat.st_size:x}"
+        self.immutable = rel_path.startswith(BUNDLE_DIR) and bool(HASHED_NAME.search(os.path.basename(rel_path)))
+        # encoding -> path of a pre-compressed copy that is newer than the original
+        self.variants = {}
+        for encoding, suffix in ENCODINGS:
+            variant = path + suffix
+            if os.path.isfile(variant) and os.stat(variant).st_mtime_ns >= stat.st_mtime_ns:
+                self.variants[encoding] = variant
+
+    def negotiate(self, accept_encodings):
+        """Returns (encoding, path) of the best variant the client accepts; encoding is None for identity."""
+        for encoding, _ in ENCODINGS:
+            if encoding in self.variants and accept_encodings[encoding]:
+                return encoding, self.variants[encoding]
+        return None, self.path
+
+
+def build_manifest(root):
+    """Maps every servable file under `root` (by its URL path) to an Asset."""
+    manifest = {}
+    if not root or not os.path.isdir(root):
+        return manifest
+    suffixes = tuple(suffix for _, suffix in ENCODINGS)
+    for dirpath, _, filenames in os.walk(root):
+        for filename in filenames:
+            path = os.path.join(dirpath, filename)
+            # A .gz/.br file is only a variant when its original exists
+            if filename.endswith(suffixes) and os.path.isfile(os.path.splitext(path)[0]):
+                continue
+            rel_path = os.path.relpath(path, root).replace(os.sep, "/")
+            manifest[rel_path] = Asset(path, rel_path)
+    return manifest
+
+
+def is_compressible(asset):
+    return asset.size >= MIN_COMPRESS_SIZE and asset.mimetype.startswith(COMPRESSIBLE_TYPES)
+
+
+def compress_asset(asset):
+    """Writes .gz (and .br when brotli is installed) copies of an asset; returns the encodings written."""
+    written = ["gzip"]
+    with open(asset.path, "rb") as src, gzip.GzipFile(asset.path + ".gz", "wb", compresslevel=9, mtime=0) as out:
+        shutil.copyfileobj(src, out)
+    if brotli is not None:
+        with open(asset.path, "rb") as src, open(asset.path + ".br", "wb") as out:
+            out.write(brotli.compress(src.read(), quality=11))
+        written.append("br")
+    return written
+
+
+class StaticAssets:
+    def __init__(self, app=None):
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.extensions["static_assets"] = build_manifest(app.config.get("CLIENT_DIST_FOLDER"))
+
+    @property
+    def manifest(self):
+        return current_app.extensions["static_assets"]
+
+    def serve(self, path):
+        """Serves `path` from the manifest, falling back to index.html for client-side routes."""
+        manifest = self.manifest
+        asset = manifest.get(path)
+        if asset is None:
+            # A missing bundle must not be answered with HTML
+            if path.startswith(BUNDLE_DIR):
+                abort(404)
+            asset = manifest.get("index.html")
+            if asset is None:
+                abort(404)
+
+        encoding, file_path = asset.negotiate(request.accept_encodings)
+        response = send_file(
+            file_path,
+            mimetype=asset.mimetype,
+            etag=f"{asset.etag}-{encoding}" if encoding else asset.etag,
+            last_modified=asset.mtime,
+            conditional=True,
+        )
+        if encoding:
+            response.headers["Content-Encoding"] = encoding
+        if asset.variants:
+            response.vary.add("Accept-Encoding")
+        response.headers["Cache-Control"] = IMMUTABLE if asset.immutable else REVALIDATE
+        return response
+
+
+static_assets = StaticAssets()
+
+
+@click.group("assets")
+def assets_cli():
+    """Client build assets."""
+
+
+@assets_cli.command("compress")
+@with_appcontext
+def compress_command():
+    """Write .gz/.br copies of compressible files in CLIENT_DIST_FOLDER."""
+    manifest = build_manifest(current_app.config.get("CLIENT_DIST_FOLDER"))
+    compressed = 0
+    for asset in manifest.values():
+        if is_compressible(asset):
+            compress_asset(asset)
+            compressed += 1
+    static_assets.init_app(current_app)
+    if brotli is None:
+        click.echo("brotli is not installed; wrote gzip variants only.", err=True)
+    click.echo(f"Compressed {compressed} of {len(manifest)} files.")
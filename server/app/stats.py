@@ -0,0 +1,184 @@
+"""
+Pre-aggregated organizer sales statistics.
+
+Each purchase upserts the organizer's row for that day in organizer_daily_stats
+and their (organizer, attendee) row in organizer_attendees inside the purchase
+transaction. The dashboard then reads a month of daily rows and one indexed
+count instead of aggregating every ticket. Deleting an event subtracts just
+that event's sales. `flask stats backfill` rebuilds both tables from the
+tickets table, using the price each ticket was sold at.
+"""
+from datetime import datetime, timedelta, timezone
+import click
+from flask.cli import with_appcontext
+from sqlalchemy import bindparam, delete, func, insert, select
+from app import db
+from app.models.event import Event
+from app.models.ticket import Ticket
+from app.models.organizer_stats import OrganizerDailyStats, OrganizerAttendee
+
+
+def _ticket_revenue():
+    # Tickets saved before unit_price was recorded fall back to the event's current price
+    return func.coalesce(Ticket.unit_price, Event.price) * Ticket.quantity
+
+
+def _purchase_day():
+    return func.date(Ticket.purchase_date, type_=db.Date)
+
+
+def _dialect_insert(model):
+    dialect = db.session.get_bind().dialect.name
+    if dialect == 'postgresql':
+        from sqlalchemy.dialects.postgresql import insert as dialect_insert
+    elif dialect == 'sqlite':
+        from sqlalchemy.dialects.sqlite import insert as dialect_insert
+    else:
+        raise NotImplementedError(f"Organizer stats upserts are not supported on '{dialect}'")
+    return dialect_insert(model)
+
+
+def record_purchase(organizer_id, user_id, price, quantity, purchased_at):
+    """Adds one purchase to the organizer's rollups. Runs in the caller's transaction."""
+    if organizer_id is None:
+        return
+    purchased_at = purchased_at.astimezone(timezone.utc).replace(tzinfo=None)
+
+    daily = _dialect_insert(OrganizerDailyStats).values(
+        organizer_id=organizer_id,
+        day=purchased_at.date(),
+        revenue=price * quantity,
+        tickets_sold=quantity,
+    )
+    db.session.execute(daily.on_conflict_do_update(
+        index_elements=['organizer_id', 'day'],
+        set_={
+            'revenue': OrganizerDailyStats.revenue + daily.excluded.revenue,
+            'tickets_sold': OrganizerDailyStats.tickets_sold + daily.excluded.tickets_sold,
+        },
+    ))
+
+    attendee = _dialect_insert(OrganizerAttendee).values(
+        organizer_id=organizer_id,
+        user_id=user_id,
+        last_purchase_at=purchased_at,
+    )
+    db.session.execute(attendee.on_conflict_do_update(
+        index_elements=['organizer_id', 'user_id'],
+        set_={'last_purchase_at': attendee.excluded.last_purchase_at},
+    ))
+
+
+def remove_event_sales(event):
+    """
+    Subtracts an event's ticket sales from its organizer's rollups. Call it before
+    deleting the event; it reads only that event's tickets. Does not commit.
+    """
+    if event.organizer_id is None:
+        return
+    sales = db.session.execute(
+        select(_purchase_day(), func.sum(_ticket_revenue()), func.sum(Ticket.quantity))
+        .join(Event, Ticket.event_id == Event.id)
+        .where(Ticket.event_id == event.id)
+        .group_by(_purchase_day())
+    ).all()
+    if not sales:
+        return
+
+    daily = OrganizerDailyStats.__table__
+    db.session.execute(
+        daily.update()
+        .where(daily.c.organizer_id == event.organizer_id, daily.c.day == bindparam('sale_day'))
+        .values(revenue=daily.c.revenue - bindparam('sale_revenue'),
+                tickets_sold=daily.c.tickets_sold - bindparam('sale_tickets')),
+        [{'sale_day': day, 'sale_revenue': revenue, 'sale_tickets': quantity} for day, revenue, quantity in sales],
+    )
+    db.session.execute(delete(OrganizerDailyStats).where(
+        OrganizerDailyStats.organizer_id == event.organizer_id, OrganizerDailyStats.tickets_sold <= 0,
+    ))
+
+    # The event's attendees keep their latest purchase from the organizer's other events, if any
+    attendees = select(Ticket.user_id).where(Ticket.event_id == event.id)
+    db.session.execute(delete(OrganizerAttendee).where(
+        OrganizerAttendee.organizer_id == event.organizer_id, OrganizerAttendee.user_id.in_(attendees),
+    ))
+    db.session.execute(insert(OrganizerAttendee).from_select(
+        ['organizer_id', 'user_id', 'last_purchase_at'],
+        select(Event.organizer_id, Ticket.user_id, func.max(Ticket.purchase_date))
+        .join(Event, Ticket.event_id == Event.id)
+        .where(Event.organizer_id == event.organizer_id, Ticket.event_id != event.id,
+               Ticket.user_id.in_(attendees))
+        .group_by(Event.organizer_id, Ticket.user_id),
+    ))
+
+
+def get_organizer_stats(organizer_id, now=None):
+    """Reads dashboard statistics from the rollup tables."""
+    now = now or datetime.now(timezone.utc).replace(tzinfo=None)
+    start_of_month = now.date().replace(day=1)
+
+    total_revenue, tickets_this_month = db.session.query(
+        func.sum(OrganizerDailyStats.revenue),
+        func.sum(OrganizerDailyStats.tickets_sold).filter(OrganizerDailyStats.day >= start_of_month),
+    ).filter(OrganizerDailyStats.organizer_id == organizer_id).one()
+
+    new_attendees = db.session.query(func.count()).select_from(OrganizerAttendee).filter(
+        OrganizerAttendee.organizer_id == organizer_id,
+        OrganizerAttendee.last_purchase_at >= now - timedelta(days=30),
+    ).scalar()
+
+    return {
+        "total_revenue": total_revenue or 0,
+        "tickets_this_month": tickets_this_month or 0,
+        "new_attendees": new_attendees or 0
+    }
+
+
+def rebuild_organizer_stats(organizer_id=None):
+    """Recomputes the rollups from tickets, for one organizer or for everyone. Does not commit."""
+    daily_delete = delete(OrganizerDailyStats)
+    attendee_delete = delete(OrganizerAttendee)
+    daily_select = select(
+        Event.organizer_id,
+        _purchase_day(),
+        func.sum(_ticket_revenue()),
+        func.sum(Ticket.quantity),
+    ).join(Event, Ticket.event_id == Event.id).where(Event.organizer_id.is_not(None))
+    attendee_select = select(
+        Event.organizer_id,
+        Ticket.user_id,
+        func.max(Ticket.purchase_date),
+    ).join(Event, Ticket.event_id == Event.id).where(Event.organizer_id.is_not(None))
+
+    if organizer_id is not None:
+        daily_delete = daily_delete.where(OrganizerDailyStats.organizer_id == organizer_id)
+        attendee_delete = attendee_delete.where(OrganizerAttendee.organizer_id == organizer_id)
+        daily_select = daily_select.where(Event.organizer_id == organizer_id)
+        attendee_select = attendee_select.where(Event.organizer_id == organizer_id)
+
+    db.session.execute(daily_delete)
+    db.session.execute(attendee_delete)
+    db.session.execute(insert(OrganizerDailyStats).from_select(
+        ['organizer_id', 'day', 'revenue', 'tickets_sold'],
+        daily_select.group_by(Event.organizer_id, _purchase_day()),
+    ))
+    db.session.execute(insert(OrganizerAttendee).from_select(
+        ['organizer_id', 'user_id', 'last_purchase_at'],
+        attendee_select.group_by(Event.organizer_id, Ticket.user_id),
+    ))
+
+
+@click.group("stats")
+def stats_cli():
+    """Manage pre-aggregated organizer statistics."""
+
+
+@stats_cli.command("backfill")
+@click.option("--organizer-id", type=int, default=None, help="Only rebuild this organizer's stats.")
+@with_appcontext
+def backfill_command(organizer_id):
+    """Rebuild organizer stats rollups from existing tickets."""
+    rebuild_organizer_stats(organizer_id)
+    db.session.commit()
+    rows = OrganizerDailyStats.query.count()
+    click.echo(f"Organizer stats rebuilt ({rows} daily rows).")
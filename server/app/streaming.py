@@ -0,0 +1,30 @@
+from flask import Response, current_app, request, stream_with_context
+
+NDJSON_MIMETYPE = "application/x-ndjson"
+
+
+def wants_stream():
+    """True when the client asked for NDJSON via ?stream=1 or the Accept header."""
+    if request.args.get("stream", "").lower() in ("1", "true"):
+        return True
+    return request.accept_mimetypes.best == NDJSON_MIMETYPE
+
+
+def ndjson_response(query, serialize, chunk_size=500):
+    """
+    Streams `query` as one JSON object per line. Rows are fetched `chunk_size`
+    at a time with yield_per and each chunk is flushed as soon as it is
+    serialized, so memory stays flat however many rows match.
+    """
+    def generate():
+        dumps = current_app.json.dumps
+        lines = []
+        for item in query.yield_per(chunk_size):
+            lines.append(dumps(serialize(item)))
+            if len(lines) >= chunk_size:
+                yield "\n".join(lines) + "\n"
+                lines = []
+        if lines:
+            yield "\n".join(lines) + "\n"
+
+    return Response(stream_with_context(generate()), mimetype=NDJSON_MIMETYPE)
@@ -0,0 +1,20 @@
+"""
+Benchmarks for the API's hot endpoints.
+
+    python -m benchmarks --scale small --mode inprocess
+    python -m benchmarks --scale full --mode gunicorn --workers 4 --concurrency 32
+
+A SQLite database at the requested scale is generated once (see
+benchmarks.dataset) and kept as a snapshot. Each run works on a fresh copy of
+it, since the workload commits purchases; a --database-url is regenerated
+instead. A weighted mix of browse, search, featured, purchase, login and
+organizer-stats requests is replayed against it, either through the Flask test
+client in this process or over HTTP against a multi-worker gunicorn. The report
+gives p50/p95/p99 latency per operation and overall throughput. It is compared
+with the stored baseline (benchmarks/baseline.json), and the run exits non-zero
+if any operation regressed beyond the tolerance, or if there is no baseline for
+the mode and scale. Pass --update-baseline to record a new one.
+
+benchmarks.serialization is a separate microbenchmark that times encoding a
+single event page with each JSON provider.
+"""
@@ -0,0 +1,65 @@
+import argparse
+import os
+import sys
+import tempfile
+from app import create_app
+from benchmarks import dataset, runner
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Benchmark the API's hot endpoints.")
+    parser.add_argument("--scale", choices=sorted(dataset.SCALES), default="small")
+    parser.add_argument("--mode", choices=("inprocess", "gunicorn"), default="inprocess")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--warmup", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--database-url", help="Regenerated for every run. Defaults to a copy of a SQLite "
+                                               "snapshot per scale and seed in the temp dir.")
+    parser.add_argument("--fresh", action="store_true", help="Regenerate the SQLite snapshot even if it exists.")
+    parser.add_argument("--workers", type=int, default=4, help="gunicorn workers.")
+    parser.add_argument("--concurrency", type=int, default=16, help="Concurrent clients in gunicorn mode.")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    args = parser.parse_args(argv)
+
+    # Purchases are committed, so each run starts from the generated data again
+    if args.database_url:
+        database_url, fresh = args.database_url, True
+    else:
+        snapshot = os.path.join(tempfile.gettempdir(),
+                                f"eventhorizon-bench-{args.scale}-{args.seed}-{runner.schema_version()}.db")
+        database_url = runner.working_copy(snapshot, args.scale, seed=args.seed, fresh=args.fresh)
+        fresh = False
+    app = create_app(runner.make_config(database_url))
+    ctx = runner.prepare(app, args.scale, seed=args.seed, fresh=fresh)
+
+    if args.mode == "inprocess":
+        results, elapsed = runner.run_inprocess(app, ctx, args.requests, warmup=args.warmup, seed=args.seed)
+    else:
+        results, elapsed = runner.run_gunicorn(database_url, ctx, args.requests, workers=args.workers,
+                                               concurrency=args.concurrency, warmup=args.warmup, seed=args.seed)
+    report = runner.summarize(results, elapsed, mode=args.mode, scale=args.scale)
+    print(runner.format_report(report))
+
+    key = f"{args.mode}/{args.scale}"
+    if args.update_baseline:
+        runner.save_baseline(args.baseline, key, report)
+        print(f"Saved baseline '{key}' to {args.baseline}")
+        return 0
+
+    baseline = runner.load_baseline(args.baseline).get(key)
+    if baseline is None:
+        # Nothing to compare against must not read as a pass
+        print(f"No baseline for '{key}'; run with --update-baseline to record one.", file=sys.stderr)
+        return 2
+    regressions = runner.compare(report, baseline, tolerance=args.tolerance)
+    for regression in regressions:
+        print(f"REGRESSION {regression}", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,43 @@
+"""
+The benchmark dataset: app.datagen at one of its preset scales, plus the ids
+and names the workload samples from.
+"""
+import random
+from datetime import datetime
+from sqlalchemy import func, select
+from app import db
+from app.datagen import SCALES, generate, search_terms
+from app.models.category import Category
+from app.models.event import Event
+from app.models.user import User
+
+PASSWORD = "benchmark-password"
+
+
+def populate(users, events, tickets, seed=0):
+    """Fills an empty schema with the given number of users, events and tickets, and commits."""
+    summary = generate(users, events, tickets, seed=seed, password=PASSWORD)
+    db.session.commit()
+    return summary
+
+
+def is_populated():
+    return db.session.execute(select(func.count()).select_from(Event)).scalar() > 0
+
+
+def sample_context(limit=200, seed=0):
+    """Ids and names the workload draws from: active upcoming events, attendees and organizers."""
+    rng = random.Random(seed)
+    upcoming = [event_id for (event_id,) in db.session.execute(
+        select(Event.id).where(Event.is_active.is_(True), Event.date > datetime.utcnow()).limit(limit * 10)
+    )]
+    attendees = db.session.execute(select(User.id, User.username).where(User.role == "attendee").limit(limit)).all()
+    organizers = db.session.execute(select(User.id).where(User.role == "organizer").limit(limit)).scalars().all()
+    categories = db.session.execute(select(Category.slug)).scalars().all()
+    return {
+        "events": rng.sample(upcoming, min(len(upcoming), limit * 10)),
+        "attendees": [tuple(row) for row in attendees],
+        "organizers": list(organizers),
+        "categories": list(categories),
+        "words": search_terms(),
+    }
@@ -0,0 +1,235 @@
+import hashlib
+import http.client
+import json
+import os
+import shutil
+import socket
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from flask_jwt_extended import create_access_token
+from app import create_app, db
+from app.config import ProductionConfig
+from benchmarks import dataset, workload
+
+SERVER_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+BENCHMARK_JWT_SECRET = "benchmark-jwt-secret"
+LATENCY_KEYS = ("p50_ms", "p95_ms")
+
+
+def make_config(database_url, **overrides):
+    """Production settings pointed at the benchmark database."""
+    attributes = {
+        "SQLALCHEMY_DATABASE_URI": database_url,
+        "JWT_SECRET_KEY": BENCHMARK_JWT_SECRET,
+        **overrides,
+    }
+    return type("BenchmarkConfig", (ProductionConfig,), attributes)
+
+
+def prepare(app, scale, seed=0, fresh=False):
+    """Generates the dataset unless it already exists; returns the workload context with auth headers."""
+    with app.app_context():
+        if fresh:
+            db.drop_all()
+        db.create_all()
+        if not dataset.is_populated():
+            started = time.perf_counter()
+            counts = dataset.populate(**dataset.SCALES[scale], seed=seed)
+            print(f"Generated {counts} in {time.perf_counter() - started:.1f}s")
+        ctx = dataset.sample_context(seed=seed)
+        ctx["headers"] = {}
+        for role, ids in (("attendee", [i for i, _ in ctx["attendees"]]), ("organizer", ctx["organizers"])):
+            for user_id in ids:
+                token = create_access_token(identity=str(user_id), additional_claims={"role": role})
+                ctx["headers"][(role, user_id)] = {"Authorization": f"Bearer {token}"}
+    return ctx
+
+
+def schema_version():
+    """Short hash of the models' tables and columns, so snapshots of an older schema are not reused."""
+    tables = sorted((table.name, tuple(sorted(table.columns.keys()))) for table in db.metadata.tables.values())
+    return hashlib.sha1(repr(tables).encode("utf-8")).hexdigest()[:8]
+
+
+def working_copy(snapshot_path, scale, seed=0, fresh=False, **overrides):
+    """
+    Returns the URL of a fresh copy of the SQLite dataset at `snapshot_path`, generating
+    the snapshot first if it is missing or `fresh` is set. The workload commits ticket
+    purchases, so every run starts from an untouched copy and stays comparable with
+    the baseline.
+    """
+    if fresh or not os.path.exists(snapshot_path):
+        building = f"{snapshot_path}.building"
+        _remove_database(building)
+        app = create_app(make_config(f"sqlite:///{building}", **overrides))
+        prepare(app, scale, seed=seed)
+        with app.app_context():
+            db.engine.dispose()
+        os.replace(building, snapshot_path)
+    root, ext = os.path.splitext(snapshot_path)
+    working = f"{root}-run{ext}"
+    # A WAL left by the previous run would otherwise be replayed onto the new copy
+    _remove_database(working)
+    shutil.copyfile(snapshot_path, working)
+    return f"sqlite:///{working}"
+
+
+def _remove_database(path):
+    for name in (path, f"{path}-wal", f"{path}-shm", f"{path}-journal"):
+        if os.path.exists(name):
+            os.remove(name)
+
+
+def percentile(sorted_values, q):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, int(round(q / 100 * len(sorted_values) + 0.5)) - 1))
+    return sorted_values[index]
+
+
+def summarize(results, elapsed, **meta):
+    """Builds the report from (operation, status, seconds) samples."""
+    operations = {}
+    for name in sorted({name for name, _, _ in results}):
+        samples = [(status, seconds) for op, status, seconds in results if op == name]
+        latencies = sorted(seconds * 1000 for _, seconds in samples)
+        operations[name] = {
+            "count": len(samples),
+            "errors": sum(1 for status, _ in samples if status is None or status >= 500),
+            "p50_ms": round(percentile(latencies, 50), 2),
+            "p95_ms": round(percentile(latencies, 95), 2),
+            "p99_ms": round(percentile(latencies, 99), 2),
+        }
+    return {
+        **meta,
+        "requests": len(results),
+        "seconds": round(elapsed, 3),
+        "throughput_rps": round(len(results) / elapsed, 1) if elapsed else 0.0,
+        "operations": operations,
+    }
+
+
+def run_inprocess(app, ctx, requests, warmup=50, seed=0):
+    client = app.test_client()
+    results = []
+    planned = workload.plan(ctx, warmup + requests, seed=seed)
+    started = None
+    for i, (name, (method, path, body, auth)) in enumerate(planned):
+        if i == warmup:
+            results.clear()
+            started = time.perf_counter()
+        headers = ctx["headers"][auth] if auth else {}
+        t0 = time.perf_counter()
+        res = client.open(path, method=method, json=body, headers=headers)
+        results.append((name, res.status_code, time.perf_counter() - t0))
+    return results, time.perf_counter() - (started or time.perf_counter())
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _http(port, method, path, body=None, headers=None, timeout=30):
+    connection = http.client.HTTPConnection("127.0.0.1", port, timeout=timeout)
+    try:
+        payload = json.dumps(body) if body is not None else None
+        headers = {**(headers or {}), **({"Content-Type": "application/json"} if payload else {})}
+        connection.request(method, path, body=payload, headers=headers)
+        response = connection.getresponse()
+        response.read()
+        return response.status
+    finally:
+        connection.close()
+
+
+def start_gunicorn(database_url, workers):
+    port = _free_port()
+    env = {**os.environ, "BENCHMARK_DATABASE_URL": database_url}
+    process = subprocess.Popen(
+        [sys.executable, "-m", "gunicorn", "--workers", str(workers), "--bind", f"127.0.0.1:{port}",
+         "--log-level", "warning", "benchmarks.wsgi:app"],
+        cwd=SERVER_DIR, env=env,
+    )
+    deadline = time.monotonic() + 60
+    while time.monotonic() < deadline:
+        try:
+            if _http(port, "GET", "/api/events/featured", timeout=5) == 200:
+                return process, port
+        except OSError:
+            time.sleep(0.2)
+    process.terminate()
+    raise RuntimeError("gunicorn did not become ready within 60s")
+
+
+def run_gunicorn(database_url, ctx, requests, workers=4, concurrency=16, warmup=50, seed=0):
+    process, port = start_gunicorn(database_url, workers)
+    try:
+        def send(item):
+            name, (method, path, body, auth) = item
+            t0 = time.perf_counter()
+            try:
+                status = _http(port, method, path, body, ctx["headers"][auth] if auth else None)
+            except OSError:
+                status = None
+            return name, status, time.perf_counter() - t0
+
+        planned = workload.plan(ctx, warmup + requests, seed=seed)
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            list(pool.map(send, planned[:warmup]))
+            started = time.perf_counter()
+            results = list(pool.map(send, planned[warmup:]))
+            elapsed = time.perf_counter() - started
+        return results, elapsed
+    finally:
+        process.terminate()
+        process.wait(timeout=30)
+
+
+def compare(report, baseline, tolerance=0.25, min_delta_ms=2.0):
+    """
+    Lists regressions of `report` against `baseline`: an operation whose p50 or p95
+    grew by more than `tolerance` (and by at least `min_delta_ms`, to ignore jitter
+    on sub-millisecond calls), new server errors, or throughput that fell by more
+    than `tolerance`.
+    """
+    regressions = []
+    for name, base in baseline.get("operations", {}).items():
+        current = report["operations"].get(name)
+        if current is None:
+            continue
+        for key in LATENCY_KEYS:
+            if current[key] > base[key] * (1 + tolerance) and current[key] - base[key] >= min_delta_ms:
+                regressions.append(f"{name} {key}: {current[key]} ms vs baseline {base[key]} ms")
+        if current["errors"] > base["errors"]:
+            regressions.append(f"{name} errors: {current['errors']} vs baseline {base['errors']}")
+    if report["throughput_rps"] < baseline.get("throughput_rps", 0) * (1 - tolerance):
+        regressions.append(f"throughput: {report['throughput_rps']} req/s vs baseline {baseline['throughput_rps']} req/s")
+    return regressions
+
+
+def load_baseline(path):
+    if not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_baseline(path, key, report):
+    baselines = load_baseline(path)
+    baselines[key] = report
+    with open(path, "w") as f:
+        json.dump(baselines, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def format_report(report):
+    lines = [f"{report['mode']} / {report['scale']}: {report['requests']} requests in {report['seconds']}s "
+             f"({report['throughput_rps']} req/s)",
+             f"{'operation':<16}{'count':>7}{'errors':>8}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}"]
+    for name, op in report["operations"].items():
+        lines.append(f"{name:<16}{op['count']:>7}{op['errors']:>8}{op['p50_ms']:>10}{op['p95_ms']:>10}{op['p99_ms']:>10}")
+    return "\n".join(lines)
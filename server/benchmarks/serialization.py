@@ -0,0 +1,132 @@
+"""
+Microbenchmarks for serializing and encoding an event listing page.
+
+    python -m benchmarks.serialization --events 100 --rounds 2000
+
+Builds a page of transient events, each in two categories, and reports pages
+per second for:
+
+- serializers: the compiled views in app.serializers against the hand-written
+  to_dict/to_summary_dict methods they replaced (kept below as reference
+  copies), building dicts only;
+- encoders: the detail page encoded by each JSON provider. "legacy" is the
+  original path: hand-written dicts with isoformat() dates, then Flask's
+  default provider with sorted keys.
+"""
+import argparse
+import time
+from datetime import datetime, timedelta
+from flask.json.provider import DefaultJSONProvider
+from app import create_app
+from app.config import TestConfig
+from app.json_provider import PROVIDERS, orjson
+from app.models.category import Category
+from app.models.event import Event
+from app.serializers import EVENT_DETAIL, EVENT_SUMMARY
+
+
+def make_page(count):
+    categories = [Category(id=i, name=f"Category {i}", slug=f"category-{i}", created_at=datetime(2024, 1, 1),
+                           updated_at=datetime(2024, 1, 1)) for i in range(1, 4)]
+    start = datetime(2025, 6, 1, 18, 30)
+    return [
+        Event(id=i, title=f"Event {i}", short_description="An evening of live music and food.",
+              description="Doors open at six. " * 20, date=start + timedelta(days=i),
+              end_date=start + timedelta(days=i, hours=4), location="Nairobi", venue="KICC", price=1500.0 + i,
+              currency="KSH", image_url=f"https://cdn.example.com/events/{i}.jpg", image_variants="",
+              is_active=True, max_attendees=500, slug=f"event-{i}", organizer_id=1,
+              created_at=start, updated_at=start, categories=[categories[i % 3], categories[(i + 1) % 3]])
+        for i in range(1, count + 1)
+    ]
+
+
+def _iso(value):
+    return value.isoformat() if value else None
+
+
+def handwritten_category(category):
+    return {'id': category.id, 'name': category.name, 'description': category.description, 'slug': category.slug,
+            'created_at': _iso(category.created_at), 'updated_at': _iso(category.updated_at)}
+
+
+def handwritten_detail(event):
+    """Event.to_dict(include_categories=True) as it was before app.serializers."""
+    return {
+        'id': event.id, 'title': event.title, 'description': event.description,
+        'short_description': event.short_description, 'date': _iso(event.date), 'end_date': _iso(event.end_date),
+        'location': event.location, 'venue': event.venue, 'price': event.price, 'currency': event.currency,
+        'image_url': event._get_full_image_url(), 'image_variants': event.image_variant_urls(),
+        'is_active': event.is_active, 'max_attendees': event.max_attendees, 'slug': event.slug,
+        'organizer_id': event.organizer_id, 'created_at': _iso(event.created_at),
+        'updated_at': _iso(event.updated_at),
+        'categories': [handwritten_category(category) for category in event.categories],
+    }
+
+
+def handwritten_summary(event):
+    """Event.to_summary_dict() as it was before app.serializers."""
+    return {
+        'id': event.id, 'title': event.title, 'short_description': event.short_description,
+        'date': _iso(event.date), 'location': event.location, 'price': event.price, 'currency': event.currency,
+        'image_url': event._get_full_image_url('card'), 'thumbnail_url': event._get_full_image_url('thumb'),
+        'slug': event.slug,
+        'categories': [{'id': cat.id, 'name': cat.name, 'slug': cat.slug} for cat in event.categories],
+    }
+
+
+def serializer_variants():
+    """name -> function turning a list of events into dicts."""
+    return {
+        "summary/handwritten": lambda events: [handwritten_summary(e) for e in events],
+        "summary/compiled": EVENT_SUMMARY.dump_many,
+        "detail/handwritten": lambda events: [handwritten_detail(e) for e in events],
+        "detail/compiled": EVENT_DETAIL.dump_many,
+    }
+
+
+def encoder_variants(app):
+    """name -> function encoding a list of events to a detail response body."""
+    legacy = DefaultJSONProvider(app)
+    legacy.sort_keys = True
+    encoders = {"encode/legacy": lambda events: legacy.dumps([handwritten_detail(e) for e in events])}
+    for name, provider_class in PROVIDERS.items():
+        if name == "orjson" and orjson is None:
+            continue
+        provider = provider_class(app)
+        encoders[f"encode/{name}"] = lambda events, provider=provider: provider.dumps(EVENT_DETAIL.dump_many(events))
+    return encoders
+
+
+def _rate(function, page, rounds):
+    function(page)
+    started = time.perf_counter()
+    for _ in range(rounds):
+        function(page)
+    return rounds / (time.perf_counter() - started)
+
+
+def run(events=100, rounds=500):
+    """Returns {variant: pages per second} for a page of `events` events."""
+    # Time the unchecked dump functions that production uses
+    app = create_app(type("SerializationBenchmarkConfig", (TestConfig,), {"SERIALIZER_RAISE_ON_LAZY_LOAD": False}))
+    with app.test_request_context():
+        page = make_page(events)
+        variants = {**serializer_variants(), **encoder_variants(app)}
+        return {name: _rate(function, page, rounds) for name, function in variants.items()}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.serialization",
+                                     description="Time serializing and encoding an event page.")
+    parser.add_argument("--events", type=int, default=100)
+    parser.add_argument("--rounds", type=int, default=500)
+    args = parser.parse_args(argv)
+
+    results = run(args.events, args.rounds)
+    print(f"{'variant':<22}{'pages/s':>10}{'ms/page':>10}")
+    for name, rate in results.items():
+        print(f"{name:<22}{rate:>10.0f}{1000 / rate:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
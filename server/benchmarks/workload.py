@@ -0,0 +1,68 @@
+"""
+The request mix replayed by the benchmark runner.
+
+Each operation turns the sampled context into one request spec:
+(method, path, json body, (role, user id) to authenticate as, or None).
+"""
+import random
+from benchmarks.dataset import PASSWORD
+
+# name -> relative weight
+MIX = {
+    "browse": 30,
+    "search": 20,
+    "featured": 20,
+    "purchase": 10,
+    "organizer_stats": 15,
+    "login": 5,
+}
+
+
+def browse(rng, ctx):
+    params = [f"page={rng.randint(1, 20)}", f"sort={rng.choice(['date', 'price', 'title'])}"]
+    if rng.random() < 0.3:
+        params.append(f"category={rng.choice(ctx['categories'])}")
+    return "GET", "/api/events/?" + "&".join(params), None, None
+
+
+def search(rng, ctx):
+    term = rng.choice(ctx["words"])
+    if rng.random() < 0.5:
+        term = term[:rng.randint(3, len(term))]
+    return "GET", f"/api/events/?search={term}", None, None
+
+
+def featured(rng, ctx):
+    return "GET", rng.choice(["/api/events/featured", "/api/events/top-picks", "/api/events/upcoming"]), None, None
+
+
+def purchase(rng, ctx):
+    return "POST", "/api/tickets/", {"event_id": rng.choice(ctx["events"]), "quantity": 1}, \
+        ("attendee", rng.choice(ctx["attendees"])[0])
+
+
+def organizer_stats(rng, ctx):
+    return "GET", "/api/users/organizer/stats", None, ("organizer", rng.choice(ctx["organizers"]))
+
+
+def login(rng, ctx):
+    _, username = rng.choice(ctx["attendees"])
+    return "POST", "/api/login", {"username": username, "password": PASSWORD}, None
+
+
+OPERATIONS = {
+    "browse": browse,
+    "search": search,
+    "featured": featured,
+    "purchase": purchase,
+    "organizer_stats": organizer_stats,
+    "login": login,
+}
+
+
+def plan(ctx, count, seed=0, mix=MIX):
+    """Returns `count` (operation name, request spec) pairs drawn from the weighted mix."""
+    rng = random.Random(seed)
+    names = list(mix)
+    choices = rng.choices(names, weights=[mix[name] for name in names], k=count)
+    return [(name, OPERATIONS[name](rng, ctx)) for name in choices]
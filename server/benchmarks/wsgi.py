@@ -0,0 +1,6 @@
+"""gunicorn entry point for `python -m benchmarks --mode gunicorn`."""
+import os
+from app import create_app
+from benchmarks.runner import make_config
+
+app = create_app(make_config(os.environ["BENCHMARK_DATABASE_URL"]))
@@ -0,0 +1,30 @@
+"""Add token type and expiry to token blocklist
+
+Revision ID: 2d7f4b6e8c13
+Revises: 9a41c7e3b2d8
+Create Date: 2025-09-12 09:41:55.873210
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '2d7f4b6e8c13'
+down_revision = '9a41c7e3b2d8'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('token_blocklist', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('token_type', sa.String(length=10), nullable=True))
+        batch_op.add_column(sa.Column('expires_at', sa.DateTime(), nullable=True))
+        batch_op.create_index(batch_op.f('ix_token_blocklist_expires_at'), ['expires_at'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('token_blocklist', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_token_blocklist_expires_at'))
+        batch_op.drop_column('expires_at')
+        batch_op.drop_column('token_type')
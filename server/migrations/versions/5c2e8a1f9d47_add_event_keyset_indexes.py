@@ -0,0 +1,30 @@
+"""Add composite indexes for keyset pagination on events
+
+Revision ID: 5c2e8a1f9d47
+Revises: f77876ac3728
+Create Date: 2025-09-08 10:12:41.518302
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5c2e8a1f9d47'
+down_revision = 'f77876ac3728'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('events', schema=None) as batch_op:
+        batch_op.create_index('ix_events_active_date_id', ['is_active', 'date', 'id'], unique=False)
+        batch_op.create_index('ix_events_active_price_id', ['is_active', 'price', 'id'], unique=False)
+        batch_op.create_index('ix_events_active_title_id', ['is_active', 'title', 'id'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('events', schema=None) as batch_op:
+        batch_op.drop_index('ix_events_active_title_id')
+        batch_op.drop_index('ix_events_active_price_id')
+        batch_op.drop_index('ix_events_active_date_id')
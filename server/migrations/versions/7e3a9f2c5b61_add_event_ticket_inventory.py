@@ -0,0 +1,38 @@
+"""Add tickets_sold counter to events and one ticket row per user and event
+
+Revision ID: 7e3a9f2c5b61
+Revises: 2d7f4b6e8c13
+Create Date: 2025-09-15 16:20:12.639418
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '7e3a9f2c5b61'
+down_revision = '2d7f4b6e8c13'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('events', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('tickets_sold', sa.Integer(), server_default='0', nullable=False))
+
+    op.execute("""
+        UPDATE events SET tickets_sold = (
+            SELECT COALESCE(SUM(tickets.quantity), 0) FROM tickets WHERE tickets.event_id = events.id
+        )
+    """)
+
+    with op.batch_alter_table('tickets', schema=None) as batch_op:
+        batch_op.create_unique_constraint('uq_tickets_user_id_event_id', ['user_id', 'event_id'])
+
+
+def downgrade():
+    with op.batch_alter_table('tickets', schema=None) as batch_op:
+        batch_op.drop_constraint('uq_tickets_user_id_event_id', type_='unique')
+
+    # A plain ALTER rather than batch mode: recreating events on SQLite would drop the FTS triggers
+    op.drop_column('events', 'tickets_sold')
@@ -0,0 +1,75 @@
+"""Add full-text search index for events
+
+Revision ID: 9a41c7e3b2d8
+Revises: 5c2e8a1f9d47
+Create Date: 2025-09-10 14:33:07.204119
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9a41c7e3b2d8'
+down_revision = '5c2e8a1f9d47'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    dialect = op.get_bind().dialect.name
+
+    if dialect == 'postgresql':
+        op.execute("""
+            ALTER TABLE events ADD COLUMN search_vector tsvector
+            GENERATED ALWAYS AS (
+                setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+                setweight(to_tsvector('english', coalesce(short_description, '')), 'B') ||
+                setweight(to_tsvector('english', coalesce(description, '')), 'C')
+            ) STORED
+        """)
+        op.execute("CREATE INDEX ix_events_search_vector ON events USING GIN (search_vector)")
+
+    elif dialect == 'sqlite':
+        op.execute("""
+            CREATE VIRTUAL TABLE events_fts USING fts5(
+                title, description, short_description,
+                content='events', content_rowid='id'
+            )
+        """)
+        op.execute("""
+            CREATE TRIGGER events_fts_ai AFTER INSERT ON events BEGIN
+                INSERT INTO events_fts(rowid, title, description, short_description)
+                VALUES (new.id, new.title, new.description, new.short_description);
+            END
+        """)
+        op.execute("""
+            CREATE TRIGGER events_fts_ad AFTER DELETE ON events BEGIN
+                INSERT INTO events_fts(events_fts, rowid, title, description, short_description)
+                VALUES ('delete', old.id, old.title, old.description, old.short_description);
+            END
+        """)
+        op.execute("""
+            CREATE TRIGGER events_fts_au AFTER UPDATE OF title, description, short_description ON events BEGIN
+                INSERT INTO events_fts(events_fts, rowid, title, description, short_description)
+                VALUES ('delete', old.id, old.title, old.description, old.short_description);
+                INSERT INTO events_fts(rowid, title, description, short_description)
+                VALUES (new.id, new.title, new.description, new.short_description);
+            END
+        """)
+        # Index the events that already exist
+        op.execute("INSERT INTO events_fts(events_fts) VALUES ('rebuild')")
+
+
+def downgrade():
+    dialect = op.get_bind().dialect.name
+
+    if dialect == 'postgresql':
+        op.execute("DROP INDEX IF EXISTS ix_events_search_vector")
+        op.execute("ALTER TABLE events DROP COLUMN IF EXISTS search_vector")
+
+    elif dialect == 'sqlite':
+        op.execute("DROP TRIGGER IF EXISTS events_fts_au")
+        op.execute("DROP TRIGGER IF EXISTS events_fts_ad")
+        op.execute("DROP TRIGGER IF EXISTS events_fts_ai")
+        op.execute("DROP TABLE IF EXISTS events_fts")
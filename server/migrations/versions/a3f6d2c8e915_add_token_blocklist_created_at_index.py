@@ -0,0 +1,26 @@
+"""Index token blocklist rows by creation time for revocation syncs
+
+Revision ID: a3f6d2c8e915
+Revises: e1b9c3f47a26
+Create Date: 2025-10-02 10:12:44.519306
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a3f6d2c8e915'
+down_revision = 'e1b9c3f47a26'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('token_blocklist', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_token_blocklist_created_at'), ['created_at'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('token_blocklist', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_token_blocklist_created_at'))
@@ -0,0 +1,62 @@
+"""Add organizer stats rollup tables
+
+Revision ID: b8d15e7a3c92
+Revises: 7e3a9f2c5b61
+Create Date: 2025-09-18 11:05:48.310957
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b8d15e7a3c92'
+down_revision = '7e3a9f2c5b61'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('organizer_daily_stats',
+    sa.Column('organizer_id', sa.Integer(), nullable=False),
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('revenue', sa.Float(), nullable=False),
+    sa.Column('tickets_sold', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['organizer_id'], ['users.id'], name=op.f('fk_organizer_daily_stats_organizer_id_users')),
+    sa.PrimaryKeyConstraint('organizer_id', 'day')
+    )
+    op.create_table('organizer_attendees',
+    sa.Column('organizer_id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('last_purchase_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['organizer_id'], ['users.id'], name=op.f('fk_organizer_attendees_organizer_id_users')),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], name=op.f('fk_organizer_attendees_user_id_users')),
+    sa.PrimaryKeyConstraint('organizer_id', 'user_id')
+    )
+    with op.batch_alter_table('organizer_attendees', schema=None) as batch_op:
+        batch_op.create_index('ix_organizer_attendees_organizer_last_purchase', ['organizer_id', 'last_purchase_at'], unique=False)
+
+    # Backfill from existing sales; `flask stats backfill` does the same at any time
+    op.execute("""
+        INSERT INTO organizer_daily_stats (organizer_id, day, revenue, tickets_sold)
+        SELECT events.organizer_id, date(tickets.purchase_date),
+               SUM(events.price * tickets.quantity), SUM(tickets.quantity)
+        FROM tickets JOIN events ON tickets.event_id = events.id
+        WHERE events.organizer_id IS NOT NULL
+        GROUP BY events.organizer_id, date(tickets.purchase_date)
+    """)
+    op.execute("""
+        INSERT INTO organizer_attendees (organizer_id, user_id, last_purchase_at)
+        SELECT events.organizer_id, tickets.user_id, MAX(tickets.purchase_date)
+        FROM tickets JOIN events ON tickets.event_id = events.id
+        WHERE events.organizer_id IS NOT NULL
+        GROUP BY events.organizer_id, tickets.user_id
+    """)
+
+
+def downgrade():
+    with op.batch_alter_table('organizer_attendees', schema=None) as batch_op:
+        batch_op.drop_index('ix_organizer_attendees_organizer_last_purchase')
+
+    op.drop_table('organizer_attendees')
+    op.drop_table('organizer_daily_stats')
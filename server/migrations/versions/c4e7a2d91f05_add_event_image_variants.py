@@ -0,0 +1,26 @@
+"""Add event image variants
+
+Revision ID: c4e7a2d91f05
+Revises: b8d15e7a3c92
+Create Date: 2025-09-22 15:12:07.441203
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c4e7a2d91f05'
+down_revision = 'b8d15e7a3c92'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('events', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('image_variants', sa.String(length=100), nullable=True))
+
+
+def downgrade():
+    # A plain DROP COLUMN keeps SQLite from rebuilding the table (and losing its FTS triggers)
+    op.drop_column('events', 'image_variants')
@@ -0,0 +1,31 @@
+"""Record the price each ticket was sold at
+
+Revision ID: d5b8e2f14a70
+Revises: a3f6d2c8e915
+Create Date: 2025-10-02 11:03:27.148552
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd5b8e2f14a70'
+down_revision = 'a3f6d2c8e915'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('tickets', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('unit_price', sa.Float(), nullable=True))
+
+    # The event's current price is the best record there is of past sales
+    op.execute("""
+        UPDATE tickets SET unit_price = (SELECT events.price FROM events WHERE events.id = tickets.event_id)
+    """)
+
+
+def downgrade():
+    with op.batch_alter_table('tickets', schema=None) as batch_op:
+        batch_op.drop_column('unit_price')
@@ -0,0 +1,40 @@
+"""Add composite and partial indexes for hot query paths
+
+Revision ID: e1b9c3f47a26
+Revises: c4e7a2d91f05
+Create Date: 2025-09-24 09:41:16.082735
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e1b9c3f47a26'
+down_revision = 'c4e7a2d91f05'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('events', schema=None) as batch_op:
+        batch_op.create_index('ix_events_organizer_id_date_id', ['organizer_id', 'date', 'id'], unique=False,
+                              sqlite_where=sa.text('organizer_id IS NOT NULL'),
+                              postgresql_where=sa.text('organizer_id IS NOT NULL'))
+
+    with op.batch_alter_table('tickets', schema=None) as batch_op:
+        batch_op.create_index('ix_tickets_event_id_purchase_date', ['event_id', 'purchase_date'], unique=False)
+
+    with op.batch_alter_table('event_categories', schema=None) as batch_op:
+        batch_op.create_index('ix_event_categories_category_id_event_id', ['category_id', 'event_id'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('event_categories', schema=None) as batch_op:
+        batch_op.drop_index('ix_event_categories_category_id_event_id')
+
+    with op.batch_alter_table('tickets', schema=None) as batch_op:
+        batch_op.drop_index('ix_tickets_event_id_purchase_date')
+
+    with op.batch_alter_table('events', schema=None) as batch_op:
+        batch_op.drop_index('ix_events_organizer_id_date_id')
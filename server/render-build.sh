@@ -15,6 +15,10 @@ npm run build --prefix ../client
 export FLASK_APP="app:create_app()"
 
 
+echo "Precompressing client assets..."
+flask assets compress
+
+
 echo "Running database migrations..."
 flask db upgrade
 
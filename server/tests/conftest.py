@@ -0,0 +1,42 @@
+import sys
+import os
+import pytest
+from contextlib import contextmanager
+from sqlalchemy import event as sa_event
+
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app import db
+
+
+class Statement(str):
+    """A captured SQL string, with the parameters and executemany flag it was sent with."""
+
+    def __new__(cls, statement, parameters, executemany):
+        captured = super().__new__(cls, statement)
+        captured.parameters = parameters
+        captured.executemany = executemany
+        return captured
+
+
+@pytest.fixture
+def capture_statements():
+    """
+    `with capture_statements() as statements:` records every statement sent to
+    db.engine inside the block, in order, as Statement strings.
+    """
+    @contextmanager
+    def capture():
+        statements = []
+
+        def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            statements.append(Statement(statement, parameters, executemany))
+
+        sa_event.listen(db.engine, 'before_cursor_execute', before_cursor_execute)
+        try:
+            yield statements
+        finally:
+            sa_event.remove(db.engine, 'before_cursor_execute', before_cursor_execute)
+
+    return capture
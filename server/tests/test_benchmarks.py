@@ -0,0 +1,92 @@
+import sys
+import os
+import pytest
+
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app import create_app, db
+from app.models.event import Event
+from app.models.ticket import Ticket
+from app.models.user import User
+from benchmarks import runner, workload
+
+# Pytest fixture
+@pytest.fixture(scope='function')
+def bench_app(tmp_path):
+    """Create a benchmark app on a throwaway SQLite file with cheap hashing."""
+    config = runner.make_config(f"sqlite:///{tmp_path / 'bench.db'}",
+                                BCRYPT_LOG_ROUNDS=4, PASSWORD_HASH_WORKERS=0)
+    app = create_app(config)
+    yield app
+    with app.app_context():
+        db.session.remove()
+        db.drop_all()
+
+def report(**operations):
+    return {
+        'throughput_rps': 100.0,
+        'operations': {name: {'count': 10, 'errors': 0, 'p50_ms': p50, 'p95_ms': p95, 'p99_ms': p95}
+                       for name, (p50, p95) in operations.items()},
+    }
+
+# --- Test Functions ---
+
+def test_tiny_run_reports_every_operation(bench_app):
+    """ ✅ GIVEN the tiny dataset
+        WHEN a short in-process run replays the mix
+        THEN check that the data is consistent and every operation is reported without server errors
+    """
+    ctx = runner.prepare(bench_app, 'tiny')
+    with bench_app.app_context():
+        assert User.query.count() == 60
+        assert Event.query.count() == 200
+        assert 900 <= Ticket.query.count() <= 1100
+        sold = db.session.query(db.func.sum(Event.tickets_sold)).scalar()
+        assert sold == db.session.query(db.func.sum(Ticket.quantity)).scalar()
+
+    results, elapsed = runner.run_inprocess(bench_app, ctx, 120, warmup=10)
+    result = runner.summarize(results, elapsed, mode='inprocess', scale='tiny')
+    assert result['requests'] == 120
+    assert set(result['operations']) == set(workload.MIX)
+    for op in result['operations'].values():
+        assert op['errors'] == 0
+        assert op['p50_ms'] <= op['p95_ms'] <= op['p99_ms']
+
+def test_each_run_starts_from_an_untouched_copy(tmp_path):
+    """ ✅ GIVEN a generated snapshot and a run that committed purchases to its copy
+        WHEN the next run takes its copy
+        THEN check that the purchases are gone and the snapshot was not regenerated
+    """
+    snapshot = tmp_path / 'tiny.db'
+    overrides = {'BCRYPT_LOG_ROUNDS': 4, 'PASSWORD_HASH_WORKERS': 0}
+    url = runner.working_copy(str(snapshot), 'tiny', **overrides)
+    generated_at = snapshot.stat().st_mtime_ns
+    app = create_app(runner.make_config(url, **overrides))
+    ctx = runner.prepare(app, 'tiny')
+    with app.app_context():
+        tickets = Ticket.query.count()
+    headers = ctx['headers'][('attendee', ctx['attendees'][0][0])]
+    for event_id in ctx['events'][:5]:
+        app.test_client().post('/api/tickets/', json={'event_id': event_id, 'quantity': 1}, headers=headers)
+    with app.app_context():
+        assert Ticket.query.count() > tickets
+
+    app = create_app(runner.make_config(runner.working_copy(str(snapshot), 'tiny', **overrides), **overrides))
+    with app.app_context():
+        assert Ticket.query.count() == tickets
+    assert snapshot.stat().st_mtime_ns == generated_at
+
+def test_compare_flags_latency_and_throughput_regressions():
+    """ ❌ GIVEN a baseline
+        WHEN a run is slower beyond the tolerance
+        THEN check that the regressions are listed, ignoring sub-threshold jitter
+    """
+    baseline = report(browse=(10.0, 20.0), featured=(0.5, 1.0))
+    assert runner.compare(report(browse=(11.0, 24.0), featured=(1.0, 2.0)), baseline) == []
+
+    slower = report(browse=(10.0, 40.0), featured=(0.5, 1.0))
+    slower['throughput_rps'] = 50.0
+    regressions = runner.compare(slower, baseline)
+    assert regressions == ['browse p95_ms: 40.0 ms vs baseline 20.0 ms',
+                           'throughput: 50.0 req/s vs baseline 100.0 req/s']
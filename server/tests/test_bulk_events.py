@@ -0,0 +1,166 @@
+import sys
+import os
+import json
+import pytest
+from datetime import datetime, timedelta
+from flask_jwt_extended import create_access_token
+
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app import create_app, db
+from app.models.event import Event
+from app.models.category import Category
+from app.models.user import User
+from app.models.associations import event_categories
+
+# Pytest fixture
+@pytest.fixture(scope='function')
+def test_client():
+    """Create and configure a new app instance for each test."""
+    app = create_app('testing')
+    client = app.test_client()
+
+    with app.app_context():
+        db.create_all()
+        db.session.add_all([
+            Category(name='Technology', slug='technology'),
+            Category(name='Music & Concerts', slug='music-concerts'),
+        ])
+        db.session.commit()
+        yield client
+        db.session.remove()
+        db.drop_all()
+
+def organizer_headers():
+    organizer = User(
+        first_name='Org', last_name='Anizer', phone_number='123',
+        username='organizer', email='org@example.com', role='organizer'
+    )
+    organizer.password_hash = 'not-used'
+    db.session.add(organizer)
+    db.session.commit()
+    token = create_access_token(identity=str(organizer.id), additional_claims={'role': 'organizer'})
+    return organizer, {'Authorization': f'Bearer {token}'}
+
+def ndjson_rows(count, **overrides):
+    start = datetime(2030, 1, 1)
+    return ''.join(json.dumps({
+        'title': f'Imported Event {i}',
+        'date': (start + timedelta(days=i)).isoformat(),
+        'location': 'Nairobi',
+        'price': i * 10,
+        'categories': ['technology'],
+        **overrides,
+    }) + '\n' for i in range(count))
+
+# --- Test Functions ---
+
+def test_cli_import_csv_with_categories_and_errors(test_client, tmp_path):
+    """ ✅ GIVEN a CSV file with valid, duplicate-titled and invalid rows
+        WHEN it is imported with the CLI
+        THEN check that valid rows land with unique slugs and bad rows are reported
+    """
+    csv_file = tmp_path / 'events.csv'
+    csv_file.write_text(
+        'title,date,location,price,categories\n'
+        'Tech Summit,2030-05-01T09:00:00,Nairobi,1500,technology;Music & Concerts\n'
+        'Tech Summit,2030-06-01T09:00:00,Mombasa,0,\n'
+        'No Date,,Kisumu,10,\n'
+        'Bad Price,2030-07-01,Nakuru,free,\n'
+        'Unknown Category,2030-07-01,Nakuru,5,sports\n'
+    )
+    result = test_client.application.test_cli_runner().invoke(
+        args=['events', 'import', str(csv_file), '--batch-size', '1']
+    )
+    assert 'Imported 2 events in 2 batches.' in result.output
+    assert 'line 4: Missing required fields: date' in result.output
+    assert "line 6: Unknown category: 'sports'" in result.output
+
+    events = Event.query.order_by(Event.id).all()
+    assert [e.title for e in events] == ['Tech Summit', 'Tech Summit']
+    assert events[0].slug == 'tech-summit' and events[1].slug.startswith('tech-summit-')
+    assert sorted(c.slug for c in events[0].categories) == ['music-concerts', 'technology']
+    assert events[1].short_description == ''
+
+def test_api_import_uses_batched_statements(test_client, capture_statements):
+    """ ✅ GIVEN an NDJSON body of many events
+        WHEN it is posted to /api/events/bulk
+        THEN check that the statement count depends on batches, not rows
+    """
+    _, headers = organizer_headers()
+    with capture_statements() as statements:
+        res = test_client.post('/api/events/bulk?batch_size=100', headers=headers,
+                               data=ndjson_rows(500), content_type='application/x-ndjson')
+
+    assert res.status_code == 201
+    assert res.get_json() == {'imported': 500, 'batches': 5, 'failed': 0, 'errors': []}
+    assert Event.query.count() == 500
+    assert len(statements) < 40
+    assert Event.query.filter(Event.categories.any(slug='technology')).count() == 500
+
+def test_api_import_rejects_invalid_json_lines(test_client):
+    """ ❌ GIVEN an NDJSON body with malformed lines
+        WHEN it is posted to /api/events/bulk
+        THEN check that the bad lines are reported with their line numbers
+    """
+    _, headers = organizer_headers()
+    body = ndjson_rows(1) + '{not json}\n[1, 2]\n'
+    res = test_client.post('/api/events/bulk', headers=headers, data=body, content_type='application/x-ndjson')
+    summary = res.get_json()
+    assert res.status_code == 201
+    assert summary['imported'] == 1
+    assert [e['line'] for e in summary['errors']] == [2, 3]
+
+def test_api_import_rejects_bad_batch_size_and_normalizes_slugs(test_client):
+    """ ❌ GIVEN a non-numeric batch_size, then rows with hand-written slugs
+        WHEN they are posted to /api/events/bulk
+        THEN check for a 400, then slugs normalized and truncated before the uniqueness check
+    """
+    _, headers = organizer_headers()
+    res = test_client.post('/api/events/bulk?batch_size=lots', headers=headers,
+                           data=ndjson_rows(1), content_type='application/x-ndjson')
+    assert res.status_code == 400
+
+    body = ndjson_rows(1, slug='Tech Summit!') + ndjson_rows(1, slug='tech-summit')
+    res = test_client.post('/api/events/bulk', headers=headers, data=body, content_type='application/x-ndjson')
+    assert res.get_json()['imported'] == 2
+    slugs = sorted(slug for (slug,) in db.session.query(Event.slug))
+    assert slugs[0] == 'tech-summit' and slugs[1].startswith('tech-summit-')
+
+    # Overlong slugs are cut to fit the column, suffix included
+    body = ndjson_rows(1, slug='a' * 300) + ndjson_rows(1, slug='a' * 300)
+    res = test_client.post('/api/events/bulk', headers=headers, data=body, content_type='application/x-ndjson')
+    assert res.get_json()['imported'] == 2
+    long_slugs = [slug for (slug,) in db.session.query(Event.slug).filter(Event.slug.like('aaa%'))]
+    assert len(set(long_slugs)) == 2 and max(map(len, long_slugs)) <= Event.__table__.c.slug.type.length
+
+def test_export_round_trips_through_import(test_client, tmp_path):
+    """ ✅ GIVEN imported events
+        WHEN they are exported via the API and the CLI and re-imported
+        THEN check that the data survives the round trip
+    """
+    organizer, headers = organizer_headers()
+    organizer_id = organizer.id
+    test_client.post('/api/events/bulk', headers=headers, data=ndjson_rows(30), content_type='application/x-ndjson')
+
+    res = test_client.get('/api/events/bulk?format=ndjson', headers=headers)
+    assert res.status_code == 200
+    assert res.mimetype == 'application/x-ndjson'
+    lines = [json.loads(line) for line in res.get_data(as_text=True).splitlines()]
+    assert len(lines) == 30
+    assert lines[0]['categories'] == ['technology']
+    assert lines[0]['organizer_id'] == organizer_id
+
+    export_file = tmp_path / 'export.csv'
+    runner = test_client.application.test_cli_runner()
+    runner.invoke(args=['events', 'export', str(export_file)])
+    db.session.execute(event_categories.delete())
+    db.session.query(Event).delete()
+    db.session.commit()
+
+    result = runner.invoke(args=['events', 'import', str(export_file)])
+    assert 'Imported 30 events in 1 batches.' in result.output
+    reimported = Event.query.order_by(Event.date).first()
+    assert (reimported.slug, reimported.price, reimported.organizer_id) == ('imported-event-0', 0.0, organizer_id)
+    assert [c.slug for c in reimported.categories] == ['technology']
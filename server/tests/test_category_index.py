@@ -0,0 +1,103 @@
+import sys
+import os
+import pytest
+from datetime import datetime, timedelta
+
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app import create_app, db
+from app.models.event import Event
+from app.models.category import Category
+
+# Pytest fixture
+@pytest.fixture(scope='function')
+def test_client():
+    """Create and configure a new app instance for each test."""
+    app = create_app('testing')
+    client = app.test_client()
+
+    with app.app_context():
+        db.create_all()
+        music = Category(name='Music', slug='music')
+        tech = Category(name='Tech', slug='tech')
+        empty = Category(name='Empty', slug='empty')
+        db.session.add_all([music, tech, empty])
+        now = datetime.utcnow()
+        # (days from now, active, categories)
+        for i, (days, active, categories) in enumerate([
+            (5, True, [music]), (10, True, [music, tech]), (-5, True, [music]),
+            (3, False, [music]), (7, True, [tech]), (-1, True, [tech]),
+        ]):
+            db.session.add(Event(title=f'Event {i}', slug=f'event-{i}', location='Nairobi',
+                                 date=now + timedelta(days=days), is_active=active, categories=categories))
+        db.session.commit()
+        yield client
+        db.session.remove()
+        db.drop_all()
+
+# --- Test Functions ---
+
+def test_index_counts_active_and_upcoming_events(test_client, capture_statements):
+    """ ✅ GIVEN categories with active, inactive, past and upcoming events
+        WHEN the category index is requested
+        THEN check that the counts come from two queries and no event ids are listed
+    """
+    with capture_statements() as statements:
+        res = test_client.get('/api/categories/')
+    assert res.status_code == 200
+    index = {category['slug']: category for category in res.get_json()}
+    assert [c['slug'] for c in res.get_json()] == ['empty', 'music', 'tech']
+    assert (index['music']['active_events'], index['music']['upcoming_events']) == (3, 2)
+    assert (index['tech']['active_events'], index['tech']['upcoming_events']) == (3, 2)
+    assert (index['empty']['active_events'], index['empty']['upcoming_events']) == (0, 0)
+    assert 'events' not in index['music']
+    assert len(statements) == 2
+
+def test_index_etag_follows_counts(test_client):
+    """ ✅ GIVEN the category index fetched once
+        WHEN an event is deactivated
+        THEN check that the index stops answering 304
+    """
+    first = test_client.get('/api/categories/')
+    headers = {'If-None-Match': first.headers['ETag']}
+    assert test_client.get('/api/categories/', headers=headers).status_code == 304
+
+    db.session.get(Event, 1).is_active = False
+    db.session.commit()
+    res = test_client.get('/api/categories/', headers=headers)
+    assert res.status_code == 200
+    assert {c['slug']: c['active_events'] for c in res.get_json()}['music'] == 2
+
+def test_event_id_feed_is_paginated(test_client):
+    """ ✅ GIVEN a category with several active events
+        WHEN its event-id feed is paged two at a time
+        THEN check that pages follow the cursor and inactive events are left out
+    """
+    first = test_client.get('/api/categories/1/events?limit=2').get_json()
+    assert first['event_ids'] == [1, 2]
+    second = test_client.get(f"/api/categories/1/events?limit=2&cursor={first['next_cursor']}").get_json()
+    assert second == {'category_id': 1, 'event_ids': [3], 'next_cursor': None}
+
+    upcoming = test_client.get('/api/categories/2/events?upcoming=true').get_json()
+    assert upcoming['event_ids'] == [2, 5]
+
+def test_event_id_feed_rejects_bad_input(test_client):
+    """ ❌ GIVEN the event-id feed
+        WHEN an unknown category, a malformed cursor or a non-numeric limit is requested
+        THEN check that 404 and 400 are returned
+    """
+    assert test_client.get('/api/categories/99/events').status_code == 404
+    assert test_client.get('/api/categories/1/events?cursor=garbage').status_code == 400
+    res = test_client.get('/api/categories/1/events?limit=ten')
+    assert res.status_code == 400 and res.get_json() == {'error': 'limit must be an integer'}
+
+def test_category_detail_reads_ids_from_the_link_index(test_client, capture_statements):
+    """ ✅ GIVEN a category with linked events
+        WHEN it is fetched
+        THEN check that its event ids are listed without loading the events
+    """
+    with capture_statements() as statements:
+        res = test_client.get('/api/categories/1')
+    assert res.get_json()['events'] == [1, 2, 3, 4]
+    assert not [s for s in statements if 'FROM events' in s]
@@ -0,0 +1,202 @@
+import sys
+import os
+import pytest
+from datetime import datetime, timedelta
+from flask_jwt_extended import create_access_token
+
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app import create_app, db
+from app.models.event import Event
+from app.models.category import Category
+from app.models.user import User
+
+# Pytest fixture
+@pytest.fixture(scope='function')
+def test_client():
+    """Create and configure a new app instance for each test."""
+    app = create_app('testing')
+    client = app.test_client()
+
+    with app.app_context():
+        db.create_all()
+        yield client
+        db.session.remove()
+        db.drop_all()
+
+def seed_events(count):
+    category = Category(name='Music', slug='music')
+    for i in range(count):
+        db.session.add(Event(
+            title=f'Event {i}',
+            date=datetime.utcnow() + timedelta(days=i + 1),
+            location='Nairobi',
+            slug=f'event-{i}',
+            categories=[category],
+        ))
+    db.session.commit()
+
+def revalidate(client, path, res):
+    return client.get(path, headers={'If-None-Match': res.headers['ETag']})
+
+# --- Test Functions ---
+
+def test_event_detail_revalidates_without_loading_the_event(test_client, capture_statements):
+    """ ✅ GIVEN an event fetched once with its validators
+        WHEN it is requested again with If-None-Match or If-Modified-Since
+        THEN check that a bodyless 304 is returned from a single timestamp query
+    """
+    seed_events(1)
+    first = test_client.get('/api/events/1')
+    assert first.status_code == 200
+    assert not first.headers['ETag'].startswith('W/')
+    assert first.headers['Cache-Control'] == 'public, max-age=60, stale-while-revalidate=300'
+    assert 'Last-Modified' in first.headers
+
+    with capture_statements() as statements:
+        by_etag = revalidate(test_client, '/api/events/1', first)
+    assert by_etag.status_code == 304
+    assert by_etag.data == b''
+    assert by_etag.headers['ETag'] == first.headers['ETag']
+    assert len(statements) == 1
+
+    by_date = test_client.get('/api/events/slug/event-0', headers={'If-Modified-Since': first.headers['Last-Modified']})
+    assert by_date.status_code == 304
+
+def test_event_detail_etag_changes_on_update(test_client):
+    """ ✅ GIVEN a cached event detail
+        WHEN the event, or a category it embeds, is updated
+        THEN check that the old ETag no longer matches
+    """
+    seed_events(1)
+    first = test_client.get('/api/events/1')
+
+    db.session.get(Event, 1).title = 'Renamed'
+    db.session.commit()
+    updated = revalidate(test_client, '/api/events/1', first)
+    assert updated.status_code == 200
+    assert updated.get_json()['title'] == 'Renamed'
+
+    Category.query.first().name = 'Live Music'
+    db.session.commit()
+    renamed = revalidate(test_client, '/api/events/1', updated)
+    assert renamed.status_code == 200
+    assert renamed.get_json()['categories'][0]['name'] == 'Live Music'
+
+def test_listing_uses_weak_etag_per_filter(test_client, capture_statements):
+    """ ✅ GIVEN an events listing fetched once
+        WHEN it is revalidated, filtered differently, or an event is deleted
+        THEN check that only the unchanged listing answers 304, from one query
+    """
+    seed_events(5)
+    first = test_client.get('/api/events/?limit=2')
+    assert first.headers['ETag'].startswith('W/')
+    assert first.headers['Cache-Control'] == 'public, max-age=30, stale-while-revalidate=60'
+
+    with capture_statements() as statements:
+        assert revalidate(test_client, '/api/events/?limit=2', first).status_code == 304
+    assert len(statements) == 1
+
+    assert revalidate(test_client, '/api/events/?limit=3', first).status_code == 200
+    assert revalidate(test_client, '/api/events/?limit=2&page=2', first).status_code == 200
+
+    db.session.delete(db.session.get(Event, 5))
+    db.session.commit()
+    after_delete = revalidate(test_client, '/api/events/?limit=2', first)
+    assert after_delete.status_code == 200
+    assert after_delete.get_json()['pagination']['total_items'] == 4
+
+def test_cursor_page_etag_tracks_its_rows(test_client):
+    """ ✅ GIVEN a keyset page fetched once
+        WHEN it is revalidated before and after one of its events changes
+        THEN check that the page answers 304 until the change
+    """
+    seed_events(5)
+    first = test_client.get('/api/events/?limit=2&cursor=')
+    assert revalidate(test_client, '/api/events/?limit=2&cursor=', first).status_code == 304
+
+    db.session.get(Event, 2).price = 500
+    db.session.commit()
+    assert revalidate(test_client, '/api/events/?limit=2&cursor=', first).status_code == 200
+
+def test_event_validators_change_when_a_category_is_deleted(test_client):
+    """ ✅ GIVEN an event detail and listing fetched once
+        WHEN a category the event embeds is deleted
+        THEN check that neither ETag nor Last-Modified still answers 304
+    """
+    seed_events(1)
+    # Last-Modified has one-second resolution, so start from timestamps well in the past
+    db.session.get(Event, 1).updated_at = datetime.utcnow() - timedelta(days=1)
+    db.session.get(Category, 1).updated_at = datetime.utcnow() - timedelta(days=1)
+    organizer = User(first_name='Org', last_name='Anizer', phone_number='123',
+                     username='organizer', email='org@example.com', role='organizer')
+    organizer.password_hash = 'not-used'
+    db.session.add(organizer)
+    db.session.commit()
+    token = create_access_token(identity=str(organizer.id), additional_claims={'role': 'organizer'})
+    detail = test_client.get('/api/events/1')
+    listing = test_client.get('/api/events/?cursor=')
+
+    res = test_client.delete('/api/categories/1', headers={'Authorization': f'Bearer {token}'})
+    assert res.status_code == 200
+    assert revalidate(test_client, '/api/events/1', detail).get_json()['categories'] == []
+    by_date = test_client.get('/api/events/1', headers={'If-Modified-Since': detail.headers['Last-Modified']})
+    assert by_date.status_code == 200
+    assert revalidate(test_client, '/api/events/?cursor=', listing).status_code == 200
+
+def test_categories_etag_follows_event_links(test_client):
+    """ ✅ GIVEN the categories listing fetched once
+        WHEN a new event is linked to a category
+        THEN check that the listing and category detail stop answering 304
+    """
+    seed_events(2)
+    listing = test_client.get('/api/categories/')
+    detail = test_client.get('/api/categories/1')
+    assert listing.headers['Cache-Control'] == 'public, max-age=300, stale-while-revalidate=3600'
+    assert revalidate(test_client, '/api/categories/', listing).status_code == 304
+    assert revalidate(test_client, '/api/categories/1', detail).status_code == 304
+
+    db.session.add(Event(title='Late', date=datetime.utcnow() + timedelta(days=9), location='Nairobi',
+                         slug='late', categories=[db.session.get(Category, 1)]))
+    db.session.commit()
+    assert revalidate(test_client, '/api/categories/', listing).status_code == 200
+    assert revalidate(test_client, '/api/categories/1', detail).get_json()['events'] == [1, 2, 3]
+
+def test_category_etag_changes_when_a_link_is_swapped(test_client):
+    """ ✅ GIVEN a category detail fetched once
+        WHEN one linked event is swapped for another, keeping the count and highest id
+        THEN check that it stops answering 304
+    """
+    seed_events(3)
+    category = db.session.get(Category, 1)
+    category.events.remove(db.session.get(Event, 2))
+    db.session.commit()
+    detail = test_client.get('/api/categories/1')
+    assert detail.get_json()['events'] == [1, 3]
+
+    category.events.remove(db.session.get(Event, 1))
+    category.events.append(db.session.get(Event, 2))
+    db.session.commit()
+    assert revalidate(test_client, '/api/categories/1', detail).get_json()['events'] == [2, 3]
+
+def test_cached_listings_answer_conditional_requests(test_client):
+    """ ✅ GIVEN a response-cached listing such as /featured
+        WHEN it is revalidated with its ETag
+        THEN check that a 304 with the listing Cache-Control is returned
+    """
+    seed_events(3)
+    first = test_client.get('/api/events/featured')
+    assert first.headers['ETag'].startswith('W/')
+    not_modified = revalidate(test_client, '/api/events/featured', first)
+    assert not_modified.status_code == 304
+    assert not_modified.headers['Cache-Control'] == 'public, max-age=30, stale-while-revalidate=60'
+
+def test_missing_event_is_not_cacheable(test_client):
+    """ ❌ GIVEN an id with no active event
+        WHEN it is requested
+        THEN check that the 404 carries no validators
+    """
+    res = test_client.get('/api/events/99')
+    assert res.status_code == 404
+    assert 'ETag' not in res.headers and 'Cache-Control' not in res.headers
@@ -0,0 +1,95 @@
+import sys
+import os
+import pytest
+from sqlalchemy import text
+
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app import create_app, db
+from app.config import ProductionConfig, TestConfig
+from app.database import TimedQueuePool, engine_options
+
+# Pytest fixture
+@pytest.fixture(scope='function')
+def file_app(tmp_path):
+    """Create an app backed by a SQLite file, which gets a real pool and the PRAGMAs."""
+    class FileConfig(TestConfig):
+        SQLALCHEMY_DATABASE_URI = f"sqlite:///{tmp_path / 'app.db'}"
+        DB_POOL_SIZE = 2
+
+    app = create_app(FileConfig)
+    with app.app_context():
+        db.create_all()
+        yield app
+        db.session.remove()
+        db.drop_all()
+        db.engine.dispose()
+
+# --- Test Functions ---
+
+def test_postgres_gets_pool_and_statement_timeout():
+    """ ✅ GIVEN the production settings and a PostgreSQL URI
+        WHEN the engine options are built
+        THEN check that the pool is sized, recycled and pre-pinged and statements time out
+    """
+    config = {key: getattr(ProductionConfig, key) for key in dir(ProductionConfig) if key.isupper()}
+    config['SQLALCHEMY_DATABASE_URI'] = 'postgresql://user:pw@db.example.com/app'
+    options = engine_options(config)
+    assert options['poolclass'] is TimedQueuePool
+    assert options['pool_size'] == ProductionConfig.DB_POOL_SIZE
+    assert options['max_overflow'] == ProductionConfig.DB_MAX_OVERFLOW
+    assert options['pool_recycle'] == 1800
+    assert options['pool_pre_ping'] is True
+    assert options['connect_args'] == {'options': f'-c statement_timeout={ProductionConfig.DB_STATEMENT_TIMEOUT_MS}'}
+
+def test_memory_sqlite_keeps_static_pool():
+    """ ✅ GIVEN the in-memory test database
+        WHEN the app starts
+        THEN check that no pool options are forced onto its single static connection
+    """
+    assert engine_options({'SQLALCHEMY_DATABASE_URI': 'sqlite:///:memory:'}) == {}
+    app = create_app('testing')
+    with app.app_context():
+        assert type(db.engine.pool).__name__ == 'StaticPool'
+
+def test_sqlite_file_gets_pragmas_and_pool(file_app):
+    """ ✅ GIVEN a file-backed SQLite database
+        WHEN connections are opened
+        THEN check that WAL and the other PRAGMAs are applied and the timed pool is used
+    """
+    assert isinstance(db.engine.pool, TimedQueuePool)
+    assert db.engine.pool.size() == 2
+    with db.engine.connect() as connection:
+        assert connection.execute(text('PRAGMA journal_mode')).scalar() == 'wal'
+        assert connection.execute(text('PRAGMA synchronous')).scalar() == 1
+        assert connection.execute(text('PRAGMA busy_timeout')).scalar() == 5000
+        assert connection.execute(text('PRAGMA cache_size')).scalar() == -64000
+
+def test_checkout_wait_is_exported(file_app):
+    """ ✅ GIVEN requests that check connections out of the pool
+        WHEN /metrics is scraped
+        THEN check that checkout waits and pool gauges are reported
+    """
+    client = file_app.test_client()
+    client.get('/api/events/')
+    body = client.get('/metrics').get_data(as_text=True)
+    count_line = next(line for line in body.splitlines() if line.startswith('db_pool_checkout_wait_seconds_count'))
+    assert int(float(count_line.split()[-1])) >= 1
+    assert 'db_pool_size 2' in body
+    assert 'db_pool_checked_out' in body
+
+def test_explicit_engine_options_win(tmp_path):
+    """ ✅ GIVEN SQLALCHEMY_ENGINE_OPTIONS set in the config
+        WHEN the app starts
+        THEN check that they override the DB_* settings
+    """
+    class Overridden(TestConfig):
+        SQLALCHEMY_DATABASE_URI = f"sqlite:///{tmp_path / 'app.db'}"
+        SQLALCHEMY_ENGINE_OPTIONS = {'pool_size': 7}
+
+    app = create_app(Overridden)
+    with app.app_context():
+        assert app.config['SQLALCHEMY_ENGINE_OPTIONS']['pool_size'] == 7
+        assert db.engine.pool.size() == 7
+        db.engine.dispose()
@@ -0,0 +1,92 @@
+import sys
+import os
+import pytest
+from datetime import datetime
+from sqlalchemy import func, select
+
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app import create_app, db
+from app.datagen import clear_data, generate
+from app.models.event import Event
+from app.models.ticket import Ticket
+from app.models.user import User
+from app.models.organizer_stats import OrganizerDailyStats
+
+# Pytest fixture
+@pytest.fixture(scope='function')
+def test_client():
+    """Create and configure a new app instance for each test."""
+    app = create_app('testing')
+    client = app.test_client()
+
+    with app.app_context():
+        db.create_all()
+        yield client
+        db.session.remove()
+        db.drop_all()
+
+def event_rows():
+    return db.session.execute(select(Event.__table__).order_by(Event.id)).all()
+
+# --- Test Functions ---
+
+def test_generate_command_populates_consistent_data(test_client):
+    """ ✅ GIVEN an empty database
+        WHEN `flask seed generate` runs with explicit counts
+        THEN check that the rows are consistent and every user can log in with the shared password
+    """
+    result = test_client.application.test_cli_runner().invoke(
+        args=['seed', 'generate', '--users', '50', '--events', '120', '--tickets', '600', '--password', 'pw-123']
+    )
+    assert result.exit_code == 0, result.output
+    assert 'Generated 50 users, 120 events' in result.output
+
+    assert User.query.count() == 50
+    assert Event.query.count() == 120
+    assert 500 <= Ticket.query.count() <= 700
+    sold = dict(db.session.execute(
+        select(Ticket.event_id, func.sum(Ticket.quantity)).group_by(Ticket.event_id)
+    ).all())
+    for event in Event.query.all():
+        assert event.tickets_sold == sold.get(event.id, 0)
+        assert event.tickets_sold <= event.max_attendees
+        assert event.categories
+    assert OrganizerDailyStats.query.count() > 0
+
+    attendee = User.query.filter_by(role='attendee').first()
+    res = test_client.post('/api/login', json={'username': attendee.username, 'password': 'pw-123'})
+    assert res.status_code == 200
+
+def test_same_seed_generates_same_rows(test_client):
+    """ ✅ GIVEN a fixed seed and clock
+        WHEN the data is generated twice
+        THEN check that the rows are identical, and that another seed gives different rows
+    """
+    now = datetime(2025, 6, 1, 12, 0)
+    generate(20, 40, 100, seed=7, now=now)
+    first = event_rows()
+    clear_data()
+    generate(20, 40, 100, seed=7, now=now)
+    assert event_rows() == first
+    clear_data()
+    generate(20, 40, 100, seed=8, now=now)
+    assert event_rows() != first
+
+def test_generate_refuses_to_mix_with_existing_data(test_client):
+    """ ❌ GIVEN a database that already has users
+        WHEN `flask seed generate` runs without --reset
+        THEN check that it fails without touching the data, and that --reset replaces it
+    """
+    runner = test_client.application.test_cli_runner()
+    runner.invoke(args=['seed', 'generate', '--scale', 'tiny'])
+    result = runner.invoke(args=['seed', 'generate', '--scale', 'tiny', '--users', '10'])
+    assert result.exit_code != 0
+    assert 'pass --reset' in result.output
+    assert User.query.count() == 60
+
+    result = runner.invoke(args=['seed', 'generate', '--users', '10', '--events', '5', '--tickets', '20', '--reset'])
+    assert result.exit_code == 0, result.output
+    assert User.query.count() == 10
+    assert Event.query.count() == 5
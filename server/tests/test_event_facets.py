@@ -0,0 +1,124 @@
+import sys
+import os
+import pytest
+from datetime import datetime, timedelta
+
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app import create_app, db
+from app.models.event import Event
+from app.models.category import Category
+
+# Pytest fixture
+@pytest.fixture(scope='function')
+def test_client():
+    """Create and configure a new app instance for each test."""
+    app = create_app('testing')
+    client = app.test_client()
+
+    with app.app_context():
+        db.create_all()
+        music = Category(name='Music', slug='music')
+        tech = Category(name='Tech', slug='tech')
+        db.session.add_all([music, tech])
+        now = datetime.utcnow()
+        # (title, days from now, location, price, categories, active)
+        for i, (title, days, location, price, categories, active) in enumerate([
+            ('Jazz Night', 5, 'Nairobi', 0.0, [music], True),
+            ('Rock Show', 9, 'Nairobi', 1500.0, [music], True),
+            ('Dev Summit', 12, 'Mombasa', 4000.0, [tech, music], True),
+            ('Old Concert', -3, 'Kisumu', 800.0, [music], True),
+            ('Hackathon', 20, 'Mombasa', 7500.0, [tech], True),
+            ('Hidden Gig', 4, 'Nairobi', 0.0, [music], False),
+        ]):
+            db.session.add(Event(title=title, slug=f'event-{i}', date=now + timedelta(days=days),
+                                 location=location, price=price, categories=categories, is_active=active))
+        db.session.commit()
+        db.session.expunge_all()
+        yield client
+        db.session.remove()
+        db.drop_all()
+
+def bands(facets):
+    return {band['band']: band['count'] for band in facets['price_bands']}
+
+# --- Test Functions ---
+
+def test_facets_count_every_active_event(test_client):
+    """ ✅ GIVEN active events across categories, cities, prices and dates
+        WHEN the listing is requested with facets=true
+        THEN check every facet counts the active events once each
+    """
+    res = test_client.get('/api/events/?facets=true')
+    assert res.status_code == 200
+    facets = res.get_json()['facets']
+    assert facets['categories'] == [
+        {'slug': 'music', 'name': 'Music', 'count': 4},
+        {'slug': 'tech', 'name': 'Tech', 'count': 2},
+    ]
+    assert facets['locations'] == [
+        {'location': 'Mombasa', 'count': 2},
+        {'location': 'Nairobi', 'count': 2},
+        {'location': 'Kisumu', 'count': 1},
+    ]
+    assert bands(facets) == {'free': 1, 'under-1000': 1, '1000-2999': 1, '3000-4999': 1, '5000-plus': 1}
+    assert facets['dates'] == {'upcoming': 4, 'past': 1}
+
+def test_facets_follow_the_filters(test_client):
+    """ ✅ GIVEN a category filter that matches events through two categories
+        WHEN facets are requested for it together with upcoming=true
+        THEN check the counts cover only the filtered events, without duplicates
+    """
+    res = test_client.get('/api/events/?facets=true&category=m&upcoming=true')
+    body = res.get_json()
+    assert body['pagination']['total_items'] == 3
+    facets = body['facets']
+    assert {c['slug']: c['count'] for c in facets['categories']} == {'music': 3, 'tech': 1}
+    assert facets['dates'] == {'upcoming': 3, 'past': 0}
+
+def test_price_band_filter(test_client):
+    """ ✅ GIVEN events in every price band
+        WHEN the listing is filtered by a price band
+        THEN check only that band's events are returned and unknown bands are rejected
+    """
+    res = test_client.get('/api/events/?price_band=free')
+    assert [event['title'] for event in res.get_json()['events']] == ['Jazz Night']
+    res = test_client.get('/api/events/?price_band=under-1000&cursor=')
+    assert [event['title'] for event in res.get_json()['events']] == ['Old Concert']
+    assert test_client.get('/api/events/?price_band=cheap').status_code == 400
+
+def test_faceted_page_is_a_bounded_number_of_queries(test_client, capture_statements):
+    """ ✅ GIVEN the event listing
+        WHEN a faceted page is requested in offset and keyset mode
+        THEN check each costs one extra statement over the plain page
+    """
+    with capture_statements() as plain:
+        test_client.get('/api/events/')
+    with capture_statements() as faceted:
+        test_client.get('/api/events/?facets=true')
+    assert len(faceted) == len(plain) + 1
+
+    with capture_statements() as plain:
+        test_client.get('/api/events/?cursor=')
+    with capture_statements() as faceted:
+        res = test_client.get('/api/events/?cursor=&facets=true')
+    assert len(faceted) == len(plain) + 1
+    assert res.get_json()['facets']['dates'] == {'upcoming': 4, 'past': 1}
+
+def test_facets_are_part_of_the_etag(test_client):
+    """ ✅ GIVEN a faceted listing fetched once
+        WHEN an event is moved to another city
+        THEN check the cached ETag no longer matches
+    """
+    first = test_client.get('/api/events/?facets=true')
+    headers = {'If-None-Match': first.headers['ETag']}
+    assert test_client.get('/api/events/?facets=true', headers=headers).status_code == 304
+    assert first.headers['ETag'] != test_client.get('/api/events/').headers['ETag']
+
+    event = db.session.get(Event, 4)
+    event.location = 'Nairobi'
+    db.session.commit()
+    res = test_client.get('/api/events/?facets=true', headers=headers)
+    assert res.status_code == 200
+    assert res.get_json()['facets']['locations'][0] == {'location': 'Nairobi', 'count': 3}
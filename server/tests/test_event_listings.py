@@ -0,0 +1,179 @@
+import sys
+import os
+import pytest
+from datetime import datetime, timedelta
+
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app import create_app, db
+from app.models.event import Event
+from app.models.category import Category
+from app.pagination import encode_cursor
+
+# Pytest fixture
+@pytest.fixture(scope='function')
+def test_client():
+    """Create and configure a new app instance for each test."""
+    app = create_app('testing')
+    client = app.test_client()
+
+    with app.app_context():
+        db.create_all()
+        yield client
+        db.session.remove()
+        db.drop_all()
+
+def seed_events(count):
+    """Creates `count` upcoming events, each linked to two categories."""
+    categories = [
+        Category(name=f'Category {i}', slug=f'category-{i}') for i in range(3)
+    ]
+    db.session.add_all(categories)
+    for i in range(count):
+        event = Event(
+            title=f'Event {i}',
+            date=datetime.utcnow() + timedelta(days=i + 1),
+            location='Nairobi',
+            price=float(i * 100),
+            slug=f'event-{i}',
+        )
+        event.categories = [categories[i % 3], categories[(i + 1) % 3]]
+        db.session.add(event)
+    db.session.commit()
+    db.session.expunge_all()
+
+# --- Test Functions ---
+
+@pytest.mark.parametrize('path', [
+    '/api/events/?limit=100',
+    '/api/events/featured',
+    '/api/events/top-picks',
+    '/api/events/upcoming?limit=50',
+])
+def test_listing_query_count_is_constant(test_client, capture_statements, path):
+    """ ✅ GIVEN a small and a large catalog
+        WHEN a listing endpoint is requested
+        THEN check that both pages cost the same number of queries
+    """
+    seed_events(2)
+    with capture_statements() as small:
+        res = test_client.get(path)
+    assert res.status_code == 200
+
+    for i in range(40):
+        db.session.add(Event(
+            title=f'More {i}',
+            date=datetime.utcnow() + timedelta(days=i + 1),
+            location='Mombasa',
+            slug=f'more-{i}',
+            categories=[Category.query.first()],
+        ))
+    db.session.commit()
+    db.session.expunge_all()
+
+    with capture_statements() as large:
+        res = test_client.get(path)
+    assert res.status_code == 200
+    assert len(large) == len(small)
+    assert len(large) <= 3
+
+def test_listing_serializes_preloaded_categories(test_client):
+    """ ✅ GIVEN events linked to categories
+        WHEN the events listing is requested
+        THEN check that each summary carries its categories
+    """
+    seed_events(3)
+    res = test_client.get('/api/events/')
+    events = res.get_json()['events']
+    assert [len(e['categories']) for e in events] == [2, 2, 2]
+    assert {'id', 'name', 'slug'} == set(events[0]['categories'][0])
+
+@pytest.mark.parametrize('sort', ['date', 'price', 'title'])
+def test_cursor_pagination_walks_every_event_once(test_client, sort):
+    """ ✅ GIVEN a catalog larger than one page
+        WHEN pages are fetched by following next_cursor
+        THEN check that every event appears exactly once, in offset-mode order
+    """
+    seed_events(23)
+    expected = [
+        e['id'] for e in test_client.get(f'/api/events/?sort={sort}&limit=100').get_json()['events']
+    ]
+
+    seen, cursor = [], ''
+    while True:
+        res = test_client.get(f'/api/events/?sort={sort}&limit=5&cursor={cursor}')
+        assert res.status_code == 200
+        body = res.get_json()
+        seen.extend(e['id'] for e in body['events'])
+        if not body['pagination']['has_next']:
+            break
+        cursor = body['pagination']['next_cursor']
+
+    assert seen == expected
+    assert 'total_items' not in body['pagination']
+
+def test_category_filter_lists_each_event_once(test_client):
+    """ ✅ GIVEN events that are each in two categories matching the filter
+        WHEN the filtered listing is paged by cursor and by offset
+        THEN check that every event appears once and the total counts events, not links
+    """
+    seed_events(5)
+    seen, cursor = [], ''
+    while True:
+        body = test_client.get(f'/api/events/?category=category&limit=3&cursor={cursor}').get_json()
+        seen.extend(e['id'] for e in body['events'])
+        if not body['pagination']['has_next']:
+            break
+        cursor = body['pagination']['next_cursor']
+    assert len(seen) == len(set(seen)) == 5
+
+    body = test_client.get('/api/events/?category=category&limit=3').get_json()
+    assert body['pagination']['total_items'] == 5
+    assert len(body['events']) == 3
+
+def test_cursor_pagination_deep_page_costs_same_as_first(test_client, capture_statements):
+    """ ✅ GIVEN a cursor pointing deep into the catalog
+        WHEN that page is requested
+        THEN check that it costs the same number of queries as the first page
+    """
+    seed_events(30)
+    first = test_client.get('/api/events/?limit=2&cursor=').get_json()
+    cursor = first['pagination']['next_cursor']
+    for _ in range(10):
+        cursor = test_client.get(f'/api/events/?limit=2&cursor={cursor}').get_json()['pagination']['next_cursor']
+
+    with capture_statements() as first_page:
+        test_client.get('/api/events/?limit=2&cursor=')
+    with capture_statements() as deep_page:
+        test_client.get(f'/api/events/?limit=2&cursor={cursor}')
+    assert len(deep_page) == len(first_page)
+    assert not any('count(' in s.lower() for s in deep_page)
+
+def test_cursor_pagination_optional_total_and_bad_cursor(test_client):
+    """ ❌ GIVEN a malformed cursor or one issued for another sort order
+        WHEN the events listing is requested
+        THEN check that the response is 400, and that include_total adds a count
+    """
+    seed_events(4)
+    body = test_client.get('/api/events/?limit=2&cursor=&include_total=true').get_json()
+    assert body['pagination']['total_items'] == 4
+
+    assert test_client.get('/api/events/?cursor=not-a-cursor').status_code == 400
+    price_cursor = body['pagination']['next_cursor']
+    assert test_client.get(f'/api/events/?sort=price&cursor={price_cursor}').status_code == 400
+
+def test_cursor_pagination_rejects_bad_limits_and_sort_keys(test_client):
+    """ ❌ GIVEN a non-positive limit, or a cursor whose sort key has the wrong type
+        WHEN the events listing is paged
+        THEN check that limits are clamped and bad keys get 400 instead of a server error
+    """
+    seed_events(3)
+    for limit in ('0', '-2'):
+        body = test_client.get(f'/api/events/?limit={limit}&cursor=').get_json()
+        assert len(body['events']) == 1 and body['pagination']['has_next']
+    assert test_client.get('/api/events/?limit=many&cursor=').status_code == 400
+
+    for sort, key in [('date', 5), ('price', {'a': 1}), ('price', 'cheap'), ('title', [1])]:
+        cursor = encode_cursor(sort, key, 1)
+        assert test_client.get(f'/api/events/?sort={sort}&cursor={cursor}').status_code == 400
@@ -0,0 +1,110 @@
+import sys
+import os
+import pytest
+from datetime import datetime, timedelta
+from alembic.autogenerate import compare_metadata
+from alembic.migration import MigrationContext
+
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app import create_app, db
+from app.models.event import Event
+from app.search import is_search_object
+
+# Pytest fixture
+@pytest.fixture(scope='function')
+def test_client():
+    """Create and configure a new app instance for each test."""
+    app = create_app('testing')
+    client = app.test_client()
+
+    with app.app_context():
+        db.create_all()
+        yield client
+        db.session.remove()
+        db.drop_all()
+
+def add_event(title, description='', short_description='', days=1):
+    event = Event(
+        title=title,
+        description=description,
+        short_description=short_description,
+        date=datetime.utcnow() + timedelta(days=days),
+        location='Nairobi',
+        slug=Event.slugify(title),
+    )
+    db.session.add(event)
+    db.session.commit()
+    return event
+
+def search(client, term, extra=''):
+    res = client.get(f'/api/events/?search={term}{extra}')
+    assert res.status_code == 200
+    return [e['title'] for e in res.get_json()['events']]
+
+# --- Test Functions ---
+
+def test_search_ranks_title_matches_first(test_client):
+    """ ✅ GIVEN events mentioning a term in different fields
+        WHEN the events listing is searched for that term
+        THEN check that title matches rank above description matches
+    """
+    add_event('Startup Pitch Night', description='An evening of jazz and founders', days=1)
+    add_event('Jazz Festival', description='Live music by the lake', days=5)
+    add_event('Food Fair', description='Street food from every county', days=2)
+
+    assert search(test_client, 'jazz') == ['Jazz Festival', 'Startup Pitch Night']
+
+def test_search_supports_prefix_and_multiple_terms(test_client):
+    """ ✅ GIVEN events with related words
+        WHEN searching with a partial last word or several words
+        THEN check that prefixes match and all words are required
+    """
+    add_event('Nairobi Tech Summit', short_description='Technology conference')
+    add_event('Tech Meetup Mombasa')
+    add_event('Nairobi Marathon')
+
+    assert sorted(search(test_client, 'techn')) == ['Nairobi Tech Summit']
+    assert sorted(search(test_client, 'nairobi tec')) == ['Nairobi Tech Summit']
+    assert search(test_client, '"*()') == []
+
+def test_search_index_follows_updates_and_deletes(test_client):
+    """ ✅ GIVEN an indexed event
+        WHEN it is renamed and later deleted
+        THEN check that search results follow both writes
+    """
+    event = add_event('Wine Tasting')
+    assert search(test_client, 'wine') == ['Wine Tasting']
+
+    event.title = 'Coffee Cupping'
+    db.session.commit()
+    assert search(test_client, 'wine') == []
+    assert search(test_client, 'coffee') == ['Coffee Cupping']
+
+    db.session.delete(event)
+    db.session.commit()
+    assert search(test_client, 'coffee') == []
+
+def test_search_respects_explicit_sort_and_pagination(test_client):
+    """ ✅ GIVEN several matching events
+        WHEN a sort order and page size are requested alongside a search
+        THEN check that the sort order wins and totals count search hits only
+    """
+    add_event('Rugby Sevens', days=3)
+    add_event('Rugby Final', description='rugby rugby rugby', days=1)
+    add_event('Chess Open', days=2)
+
+    body = test_client.get('/api/events/?search=rugby&sort=date&limit=1').get_json()
+    assert [e['title'] for e in body['events']] == ['Rugby Final']
+    assert body['pagination']['total_items'] == 2
+
+def test_autogenerate_leaves_the_search_index_alone(test_client):
+    """ ✅ GIVEN a schema with the FTS5 table and its shadow tables
+        WHEN it is compared with the models, skipping search objects as migrations/env.py does
+        THEN check that no operations are detected
+    """
+    include_name = lambda name, type_, parent_names: not is_search_object(name, type_)
+    context = MigrationContext.configure(db.session.connection(), opts={'include_name': include_name})
+    assert compare_metadata(context, db.metadata) == []
+    assert compare_metadata(MigrationContext.configure(db.session.connection()), db.metadata)
@@ -0,0 +1,124 @@
+import sys
+import os
+import io
+import pytest
+from flask_jwt_extended import create_access_token
+
+PIL = pytest.importorskip('PIL.Image')
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app import create_app, db
+from app.config import TestConfig
+from app.models.event import Event
+from app.models.user import User
+from app.images import images
+
+# Pytest fixture
+@pytest.fixture(scope='function')
+def test_client(tmp_path):
+    """Create and configure a new app instance with a temporary upload folder."""
+    class UploadConfig(TestConfig):
+        UPLOAD_FOLDER = str(tmp_path)
+
+    app = create_app(UploadConfig)
+    client = app.test_client()
+
+    with app.app_context():
+        db.create_all()
+        yield client
+        db.session.remove()
+        db.drop_all()
+
+def organizer_headers():
+    organizer = User(
+        first_name='Org', last_name='Anizer', phone_number='123',
+        username='organizer', email='org@example.com', role='organizer'
+    )
+    organizer.password_hash = 'not-used'
+    db.session.add(organizer)
+    db.session.commit()
+    token = create_access_token(identity=str(organizer.id), additional_claims={'role': 'organizer'})
+    return {'Authorization': f'Bearer {token}'}
+
+def png_upload(width=2000, height=1000):
+    buffer = io.BytesIO()
+    PIL.new('RGB', (width, height), (200, 30, 30)).save(buffer, format='PNG')
+    buffer.seek(0)
+    return buffer, 'poster.png'
+
+def event_form(**overrides):
+    return {
+        'title': 'Poster Launch', 'description': 'An event with a poster', 'date': '2030-05-01T18:00:00',
+        'price': '100', 'max_attendees': '50', 'location': 'Nairobi', 'venue': 'KICC',
+        **overrides,
+    }
+
+def wait_for_pipeline(client):
+    client.application.extensions['image_pipeline'].shutdown(wait=True)
+    images.init_app(client.application)
+    db.session.expire_all()
+
+# --- Test Functions ---
+
+def test_upload_renders_variants_in_background(test_client, tmp_path):
+    """ ✅ GIVEN an organizer creating an event with a large PNG poster
+        WHEN the image pipeline has finished
+        THEN check that WebP variants are written and used by the serializers
+    """
+    headers = organizer_headers()
+    res = test_client.post('/api/events/', headers=headers, content_type='multipart/form-data',
+                           data={**event_form(), 'image_url': png_upload()})
+    assert res.status_code == 201
+    assert res.get_json()['event']['image_variants'] == {}
+
+    wait_for_pipeline(test_client)
+    event = Event.query.one()
+    stem = os.path.splitext(os.path.basename(event.image_url))[0]
+    assert event.image_variants == 'thumb,card,hero'
+    with PIL.open(tmp_path / f'{stem}_thumb.webp') as thumb:
+        assert thumb.format == 'WEBP' and thumb.size == (320, 160)
+    with PIL.open(tmp_path / f'{stem}_hero.webp') as hero:
+        assert hero.size == (1600, 800)
+    assert not [name for name in os.listdir(tmp_path) if name.endswith('.part')]
+
+    summary = test_client.get('/api/events/').get_json()['events'][0]
+    assert summary['image_url'].endswith(f'/uploads/{stem}_card.webp')
+    assert summary['thumbnail_url'].endswith(f'/uploads/{stem}_thumb.webp')
+
+def test_replacing_image_resets_variants(test_client):
+    """ ✅ GIVEN an event whose poster has variants
+        WHEN a new poster is uploaded
+        THEN check that the old variants are dropped until the new ones are rendered
+    """
+    headers = organizer_headers()
+    event_id = test_client.post('/api/events/', headers=headers, content_type='multipart/form-data',
+                                data={**event_form(), 'image_url': png_upload()}).get_json()['event']['id']
+    wait_for_pipeline(test_client)
+
+    res = test_client.patch(f'/api/events/{event_id}', headers=headers, content_type='multipart/form-data',
+                          data={'image_url': png_upload(400, 400)})
+    assert res.status_code == 200
+    assert res.get_json()['event']['image_variants'] == {}
+
+    wait_for_pipeline(test_client)
+    event = db.session.get(Event, event_id)
+    assert event.image_variants == 'thumb,card,hero'
+    stem = os.path.splitext(os.path.basename(event.image_url))[0]
+    assert test_client.get(f'/api/events/{event_id}').get_json()['image_variants']['hero'].endswith(f'/uploads/{stem}_hero.webp')
+
+def test_invalid_image_keeps_original(test_client):
+    """ ❌ GIVEN an upload that is not a decodable image
+        WHEN the pipeline processes it
+        THEN check that the event keeps serving the original file
+    """
+    headers = organizer_headers()
+    res = test_client.post('/api/events/', headers=headers, content_type='multipart/form-data',
+                           data={**event_form(), 'image_url': (io.BytesIO(b'not an image'), 'poster.png')})
+    assert res.status_code == 201
+
+    wait_for_pipeline(test_client)
+    event = Event.query.one()
+    assert event.image_variants is None
+    summary = test_client.get('/api/events/').get_json()['events'][0]
+    assert summary['image_url'].endswith(event.image_url)
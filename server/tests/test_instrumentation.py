@@ -0,0 +1,151 @@
+import sys
+import os
+import logging
+import pytest
+from datetime import datetime, timedelta
+
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app import create_app, db
+from app.config import TestConfig
+from app.metrics import MetricsRegistry
+from app.models.event import Event
+from app.models.category import Category
+
+class InstrumentedConfig(TestConfig):
+    N_PLUS_ONE_THRESHOLD = 3
+    PROFILER_ENABLED = True
+    PROFILER_TOKEN = 'profile-secret'
+    METRICS_TOKEN = 'metrics-secret'
+
+# Pytest fixture
+@pytest.fixture(scope='function')
+def test_client():
+    """Create and configure a new instrumented app instance for each test."""
+    app = create_app(InstrumentedConfig)
+
+    @app.route('/test/lazy-categories')
+    def lazy_categories():
+        # Touches a lazy relationship per row: the classic N+1
+        return {'counts': [len(event.categories) for event in Event.query.all()]}
+
+    client = app.test_client()
+    with app.app_context():
+        db.create_all()
+        music = Category(name='Music', slug='music')
+        for i in range(4):
+            db.session.add(Event(title=f'Event {i}', date=datetime.utcnow() + timedelta(days=1),
+                                 location='Nairobi', slug=f'event-{i}', categories=[music]))
+        db.session.commit()
+        yield client
+        db.session.remove()
+        db.drop_all()
+
+def scrape(client):
+    res = client.get('/metrics', headers={'Authorization': 'Bearer metrics-secret'})
+    assert res.status_code == 200
+    assert res.content_type.startswith('text/plain; version=0.0.4')
+    return res.get_data(as_text=True)
+
+# --- Test Functions ---
+
+def test_requests_are_timed_per_endpoint(test_client):
+    """ ✅ GIVEN a few listing requests
+        WHEN /metrics is scraped
+        THEN check that latency, query counts and DB time are reported per endpoint
+    """
+    for _ in range(2):
+        res = test_client.get('/api/events/')
+        assert res.headers['Server-Timing'].startswith('db;dur=')
+
+    body = scrape(test_client)
+    assert 'http_request_duration_seconds_count{endpoint="events.get_events",method="GET"} 2' in body
+    assert 'http_requests_total{endpoint="events.get_events",method="GET",status="200"} 2' in body
+    assert 'db_queries_per_request_bucket{endpoint="events.get_events",le="3"} 2' in body
+    assert 'db_time_per_request_seconds_sum{endpoint="events.get_events"}' in body
+    assert 'response_cache_requests_total{result="miss"}' in body
+    assert 'password_hash_pending 0' in body
+
+def test_repeated_statements_are_flagged_as_n_plus_one(test_client, caplog):
+    """ ✅ GIVEN a view that lazy-loads a relationship per row
+        WHEN it is requested
+        THEN check that the request is counted and logged as a likely N+1
+    """
+    with caplog.at_level(logging.WARNING, logger='app.instrumentation'):
+        test_client.get('/test/lazy-categories')
+        test_client.get('/api/events/')
+    assert 'db_n_plus_one_total{endpoint="lazy_categories"} 1' in scrape(test_client)
+    assert not any('events.get_events' in r.getMessage() for r in caplog.records)
+    assert any('Possible N+1 in lazy_categories: 4 x' in r.getMessage() for r in caplog.records)
+
+def test_slow_queries_are_logged(test_client, caplog):
+    """ ✅ GIVEN a slow-query threshold of zero
+        WHEN a request runs SQL
+        THEN check that each statement is logged and counted as slow
+    """
+    test_client.application.config['SLOW_QUERY_SECONDS'] = 0
+    with caplog.at_level(logging.WARNING, logger='app.instrumentation'):
+        test_client.get('/api/events/slug/event-1')
+    assert any(r.getMessage().startswith('Slow query') for r in caplog.records)
+    assert 'db_slow_queries_total{endpoint="events.get_event_by_slug"} 3' in scrape(test_client)
+
+def test_profile_header_requires_token(test_client):
+    """ ✅ GIVEN the profiler enabled with a token
+        WHEN a request carries the right or wrong X-Profile header
+        THEN check that only the right token returns a profile report
+    """
+    normal = test_client.get('/api/events/', headers={'X-Profile': 'guess'})
+    assert normal.is_json
+
+    profiled = test_client.get('/api/events/', headers={'X-Profile': 'profile-secret'})
+    assert profiled.mimetype == 'text/plain'
+    assert profiled.headers['X-Profiled-Status'] == '200'
+    assert 'get_events' in profiled.get_data(as_text=True)
+
+def test_metrics_require_token(test_client):
+    """ ❌ GIVEN METRICS_TOKEN configured
+        WHEN /metrics is requested without it
+        THEN check that 401 is returned
+    """
+    assert test_client.get('/metrics').status_code == 401
+    assert test_client.get('/metrics', headers={'Authorization': 'Bearer nope'}).status_code == 401
+
+def test_profiler_and_metrics_fail_closed_without_tokens(caplog):
+    """ ❌ GIVEN a production-like app with the profiler enabled but no profiler or metrics token
+        WHEN it starts, a request asks to be profiled and /metrics is scraped
+        THEN check that both are refused and the missing tokens are logged
+    """
+    class UnguardedConfig(TestConfig):
+        TESTING = False
+        PROFILER_ENABLED = True
+        PROFILER_TOKEN = None
+        METRICS_TOKEN = None
+
+    with caplog.at_level(logging.WARNING, logger='app.instrumentation'):
+        app = create_app(UnguardedConfig)
+    assert any('PROFILER_TOKEN' in r.getMessage() for r in caplog.records)
+    assert any('METRICS_TOKEN' in r.getMessage() for r in caplog.records)
+
+    client = app.test_client()
+    with app.app_context():
+        db.create_all()
+        assert client.get('/api/events/', headers={'X-Profile': 'anything'}).is_json
+        assert client.get('/metrics').status_code == 403
+        db.session.remove()
+        db.drop_all()
+
+def test_registry_renders_prometheus_text():
+    """ ✅ GIVEN a counter and a histogram
+        WHEN the registry is rendered
+        THEN check that buckets are cumulative and label values escaped
+    """
+    registry = MetricsRegistry()
+    registry.counter('jobs_total', 'Jobs.', ('name',)).inc(name='say "hi"')
+    histogram = registry.histogram('work_seconds', 'Work.', buckets=(0.1, 1.0))
+    for value in (0.05, 0.5, 5):
+        histogram.observe(value)
+    body = registry.render()
+    assert 'jobs_total{name="say \\"hi\\""} 1' in body
+    assert 'work_seconds_bucket{le="0.1"} 1\nwork_seconds_bucket{le="1.0"} 2\nwork_seconds_bucket{le="+Inf"} 3' in body
+    assert 'work_seconds_count 3' in body
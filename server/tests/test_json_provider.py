@@ -0,0 +1,109 @@
+import sys
+import os
+import json
+import pytest
+from dataclasses import dataclass
+from datetime import date, datetime, timezone
+from decimal import Decimal
+
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app import create_app, db
+from app.config import TestConfig
+from app.json_provider import OrjsonProvider, StdlibJSONProvider, provider_class
+from app.models.event import Event
+from app.models.category import Category
+from benchmarks import serialization
+
+def make_app(provider):
+    return create_app(type('JSONTestConfig', (TestConfig,), {'JSON_PROVIDER': provider}))
+
+# Pytest fixture
+@pytest.fixture(scope='function', params=['orjson', 'stdlib'])
+def test_client(request):
+    """Create and configure a new app instance for each test, once per provider."""
+    app = make_app(request.param)
+    client = app.test_client()
+
+    with app.app_context():
+        db.create_all()
+        yield client
+        db.session.remove()
+        db.drop_all()
+
+@dataclass
+class Price:
+    amount: Decimal
+    currency: str
+
+# --- Test Functions ---
+
+def test_provider_encodes_rich_types(test_client):
+    """ ✅ GIVEN either JSON provider
+        WHEN datetimes, dates, Decimals and dataclasses are encoded
+        THEN check both produce the same ISO 8601 and string output
+    """
+    provider = test_client.application.json
+    payload = {
+        'naive': datetime(2025, 6, 1, 18, 30),
+        'aware': datetime(2025, 6, 1, 18, 30, 5, 120000, tzinfo=timezone.utc),
+        'day': date(2025, 6, 1),
+        'price': Price(Decimal('1500.50'), 'KSH'),
+        1: 'int key',
+    }
+    assert json.loads(provider.dumps(payload)) == {
+        'naive': '2025-06-01T18:30:00',
+        'aware': '2025-06-01T18:30:05.120000+00:00',
+        'day': '2025-06-01',
+        'price': {'amount': '1500.50', 'currency': 'KSH'},
+        '1': 'int key',
+    }
+    with pytest.raises(TypeError):
+        provider.dumps({'value': object()})
+
+def test_api_responses_carry_iso_dates(test_client):
+    """ ✅ GIVEN an event whose serializer returns raw datetimes
+        WHEN it is fetched as JSON and as NDJSON
+        THEN check the dates are ISO 8601 strings in both
+    """
+    event = Event(title='Gala', slug='gala', location='Nairobi', date=datetime(2030, 5, 4, 19, 0),
+                  categories=[Category(name='Music', slug='music')])
+    db.session.add(event)
+    db.session.commit()
+
+    res = test_client.get('/api/events/1')
+    assert res.mimetype == 'application/json'
+    body = res.get_json()
+    assert body['date'] == '2030-05-04T19:00:00'
+    assert body['end_date'] is None
+    assert datetime.fromisoformat(body['categories'][0]['created_at'])
+    assert test_client.get('/api/events/?upcoming=true').get_json()['events'][0]['date'] == '2030-05-04T19:00:00'
+
+def test_request_bodies_are_decoded(test_client):
+    """ ❌ GIVEN either JSON provider
+        WHEN a malformed JSON body is posted
+        THEN check the request is rejected rather than crashing
+    """
+    res = test_client.post('/api/login', data='{"email": ', content_type='application/json')
+    assert res.status_code == 400
+
+def test_provider_selection():
+    """ ✅ GIVEN the JSON_PROVIDER setting
+        WHEN a provider class is chosen
+        THEN check auto prefers orjson and unknown names are rejected
+    """
+    assert provider_class('auto') is OrjsonProvider
+    assert provider_class('stdlib') is StdlibJSONProvider
+    assert isinstance(make_app('stdlib').json, StdlibJSONProvider)
+    with pytest.raises(ValueError):
+        provider_class('simplejson')
+
+def test_serialization_benchmark_runs():
+    """ ✅ GIVEN the serialization microbenchmark
+        WHEN it encodes a small page a few times
+        THEN check every provider and the legacy path report a rate
+    """
+    results = serialization.run(events=5, rounds=3)
+    assert {'encode/legacy', 'encode/orjson', 'encode/stdlib'} <= set(results)
+    assert all(rate > 0 for rate in results.values())
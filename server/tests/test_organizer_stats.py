@@ -0,0 +1,142 @@
+import sys
+import os
+import re
+import pytest
+from datetime import datetime, timedelta, timezone
+from flask_jwt_extended import create_access_token
+
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app import create_app, db
+from app.models.event import Event
+from app.models.ticket import Ticket
+from app.models.user import User
+from app.models.organizer_stats import OrganizerDailyStats
+from app.stats import get_organizer_stats
+
+# Pytest fixture
+@pytest.fixture(scope='function')
+def test_client():
+    """Create and configure a new app instance for each test."""
+    app = create_app('testing')
+    client = app.test_client()
+
+    with app.app_context():
+        db.create_all()
+        yield client
+        db.session.remove()
+        db.drop_all()
+
+def create_user(username, role):
+    user = User(
+        first_name='Test', last_name='User', phone_number='123',
+        username=username, email=f'{username}@example.com', role=role
+    )
+    user.password_hash = 'not-used'
+    db.session.add(user)
+    db.session.commit()
+    headers = {'Authorization': f"Bearer {create_access_token(identity=str(user.id), additional_claims={'role': role})}"}
+    return user, headers
+
+def create_event(organizer, title, price):
+    event = Event(
+        title=title,
+        date=datetime.utcnow() + timedelta(days=10),
+        location='Nairobi',
+        price=price,
+        slug=Event.slugify(title),
+        organizer_id=organizer.id,
+    )
+    db.session.add(event)
+    db.session.commit()
+    return event
+
+# --- Test Functions ---
+
+def test_purchases_update_stats_incrementally(test_client):
+    """ ✅ GIVEN an organizer with two events
+        WHEN attendees buy tickets
+        THEN check that the stats endpoint reflects every purchase
+    """
+    organizer, organizer_headers = create_user('organizer', 'organizer')
+    concert = create_event(organizer, 'Concert', 1000.0)
+    talk = create_event(organizer, 'Talk', 250.0)
+    _, first = create_user('first', 'attendee')
+    _, second = create_user('second', 'attendee')
+
+    test_client.post('/api/tickets/', headers=first, json={'event_id': concert.id, 'quantity': 2})
+    test_client.post('/api/tickets/', headers=first, json={'event_id': talk.id, 'quantity': 1})
+    test_client.post('/api/tickets/', headers=second, json={'event_id': talk.id, 'quantity': 4})
+
+    res = test_client.get('/api/users/organizer/stats', headers=organizer_headers)
+    assert res.status_code == 200
+    assert res.get_json() == {'total_revenue': 3250.0, 'tickets_this_month': 7, 'new_attendees': 2}
+    assert OrganizerDailyStats.query.count() == 1
+
+def test_stats_endpoint_does_not_scan_tickets(test_client, capture_statements):
+    """ ✅ GIVEN an organizer with sales
+        WHEN the stats endpoint is requested
+        THEN check that it reads the rollups and never touches the tickets table
+    """
+    organizer, organizer_headers = create_user('organizer', 'organizer')
+    event = create_event(organizer, 'Concert', 100.0)
+    _, attendee = create_user('attendee', 'attendee')
+    test_client.post('/api/tickets/', headers=attendee, json={'event_id': event.id})
+
+    with capture_statements() as statements:
+        test_client.get('/api/users/organizer/stats', headers=organizer_headers)
+
+    assert len(statements) == 2
+    assert not any(re.search(r'\btickets\b', s) for s in statements)
+
+def test_backfill_rebuilds_stats_from_existing_tickets(test_client):
+    """ ✅ GIVEN tickets written before the rollups existed
+        WHEN the backfill command runs
+        THEN check that the stats match an aggregate over the raw tickets
+    """
+    organizer, _ = create_user('organizer', 'organizer')
+    event = create_event(organizer, 'Concert', 500.0)
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    attendees = [create_user(f'attendee{i}', 'attendee')[0] for i in range(3)]
+    db.session.add_all([
+        Ticket(user_id=attendees[0].id, event_id=event.id, quantity=2, purchase_date=now),
+        Ticket(user_id=attendees[1].id, event_id=event.id, quantity=1, purchase_date=now - timedelta(days=3)),
+        Ticket(user_id=attendees[2].id, event_id=event.id, quantity=5, purchase_date=now - timedelta(days=90)),
+    ])
+    db.session.commit()
+    assert get_organizer_stats(organizer.id)['total_revenue'] == 0
+
+    result = test_client.application.test_cli_runner().invoke(args=['stats', 'backfill'])
+    assert 'Organizer stats rebuilt (3 daily rows).' in result.output
+
+    stats = get_organizer_stats(organizer.id, now=now)
+    assert stats['total_revenue'] == 4000.0
+    assert stats['new_attendees'] == 2
+    start_of_month = now.date().replace(day=1)
+    assert stats['tickets_this_month'] == 2 + (1 if (now - timedelta(days=3)).date() >= start_of_month else 0)
+
+def test_deleting_event_removes_its_sales(test_client):
+    """ ✅ GIVEN an organizer with sales on two events
+        WHEN the kept event's price changes and the other event is deleted
+        THEN check that only the kept event's sales remain, at the price paid
+    """
+    organizer, organizer_headers = create_user('organizer', 'organizer')
+    keep = create_event(organizer, 'Keep', 100.0)
+    drop = create_event(organizer, 'Drop', 900.0)
+    _, attendee = create_user('attendee', 'attendee')
+    test_client.post('/api/tickets/', headers=attendee, json={'event_id': keep.id})
+    test_client.post('/api/tickets/', headers=attendee, json={'event_id': drop.id})
+
+    _, other = create_user('other', 'attendee')
+    test_client.post('/api/tickets/', headers=other, json={'event_id': drop.id, 'quantity': 3})
+    res = test_client.patch(f'/api/events/{keep.id}', headers=organizer_headers, json={'price': 500.0})
+    assert res.get_json()['event']['price'] == 500.0
+
+    assert test_client.delete(f'/api/events/{drop.id}', headers=organizer_headers).status_code == 200
+    stats = test_client.get('/api/users/organizer/stats', headers=organizer_headers).get_json()
+    assert stats == {'total_revenue': 100.0, 'tickets_this_month': 1, 'new_attendees': 1}
+
+    # A rebuild agrees: tickets keep the price they were sold at
+    test_client.application.test_cli_runner().invoke(args=['stats', 'backfill'])
+    assert get_organizer_stats(organizer.id) == stats
@@ -0,0 +1,141 @@
+import sys
+import os
+import time
+import bcrypt
+import pytest
+
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app import create_app, db
+from app.config import TestConfig
+from app.models.user import User
+from app.passwords import HashingPool, PasswordHasherBusy, hash_rounds, passwords
+
+# Pytest fixture
+@pytest.fixture(scope='function')
+def test_client():
+    """Create and configure a new app instance for each test."""
+    app = create_app('testing')
+    client = app.test_client()
+
+    with app.app_context():
+        db.create_all()
+        yield client
+        db.session.remove()
+        db.drop_all()
+
+def create_user(password_hash):
+    user = User(
+        first_name='Test', last_name='User', phone_number='123',
+        username='attendee', email='attendee@example.com', role='attendee',
+        password_hash=password_hash,
+    )
+    db.session.add(user)
+    db.session.commit()
+    return user
+
+def login(client, password='secret-pass'):
+    return client.post('/api/login', json={'username': 'attendee', 'password': password})
+
+# --- Test Functions ---
+
+def test_login_rehashes_when_cost_factor_changes(test_client):
+    """ ✅ GIVEN a user whose hash was made at an older cost factor
+        WHEN they log in with the right password
+        THEN check that the stored hash is upgraded to the configured cost
+    """
+    user = create_user(bcrypt.hashpw(b'secret-pass', bcrypt.gensalt(5)).decode())
+    assert login(test_client, 'wrong-pass').status_code == 401
+    assert hash_rounds(user.password_hash) == 5
+
+    assert login(test_client).status_code == 200
+    db.session.refresh(user)
+    assert hash_rounds(user.password_hash) == TestConfig.BCRYPT_LOG_ROUNDS
+    assert login(test_client).status_code == 200
+
+def test_saturated_hasher_sheds_load(test_client):
+    """ ❌ GIVEN a hashing pool with every slot taken
+        WHEN a user logs in
+        THEN check that a 503 with Retry-After is returned and counted
+    """
+    create_user(bcrypt.hashpw(b'secret-pass', bcrypt.gensalt(4)).decode())
+    pool = passwords.pool
+    for _ in range(pool.max_pending):
+        pool._slots.acquire()
+    try:
+        res = login(test_client)
+    finally:
+        for _ in range(pool.max_pending):
+            pool._slots.release()
+
+    assert res.status_code == 503
+    assert res.headers['Retry-After'] == '1'
+    assert passwords.stats()['rejected'] == 1
+    assert login(test_client).status_code == 200
+
+def test_login_succeeds_when_rehash_is_busy(test_client, monkeypatch):
+    """ ✅ GIVEN a user whose hash needs upgrading, and a hasher that is busy by then
+        WHEN they log in with the right password
+        THEN check that the login succeeds and the old hash is kept for a later upgrade
+    """
+    user = create_user(bcrypt.hashpw(b'secret-pass', bcrypt.gensalt(5)).decode())
+    def busy(password):
+        raise PasswordHasherBusy('Password hashing queue is full')
+    monkeypatch.setattr(passwords, 'hash', busy)
+
+    assert login(test_client).status_code == 200
+    db.session.refresh(user)
+    assert hash_rounds(user.password_hash) == 5
+
+def test_slow_hash_times_out_but_keeps_its_slot():
+    """ ❌ GIVEN a pool with one slot and a hash that outlasts the timeout
+        WHEN the caller gives up waiting
+        THEN check that it gets PasswordHasherBusy and the slot stays taken until the hash finishes
+    """
+    pool = HashingPool(workers=1, max_pending=1, timeout=0.05)
+    try:
+        with pytest.raises(PasswordHasherBusy):
+            pool.run(time.sleep, 1)
+        with pytest.raises(PasswordHasherBusy):
+            pool.run(time.sleep, 0)
+        assert pool.stats()['timed_out'] == 1 and pool.stats()['rejected'] == 1
+
+        deadline = time.monotonic() + 30
+        while pool.stats()['pending'] and time.monotonic() < deadline:
+            time.sleep(0.05)
+        pool.timeout = 30
+        assert pool.run(time.sleep, 0) is None
+    finally:
+        pool._executor.shutdown()
+
+def test_hashing_runs_in_process_pool(test_client):
+    """ ✅ GIVEN a hasher configured with a worker process
+        WHEN a password is hashed and verified
+        THEN check that the work is done by the pool and tracked in its stats
+    """
+    class PoolConfig(TestConfig):
+        PASSWORD_HASH_WORKERS = 1
+
+    app = create_app(PoolConfig)
+    with app.app_context():
+        password_hash = passwords.hash('secret-pass')
+        assert passwords.verify(password_hash, 'secret-pass')
+        assert not passwords.verify(password_hash, 'other-pass')
+        assert not passwords.verify('not-a-bcrypt-hash', 'secret-pass')
+        pool = passwords.pool
+        assert pool._executor is not None
+        assert passwords.stats()['completed'] == 3
+        assert passwords.stats()['pending'] == 0
+        pool._executor.shutdown()
+
+def test_benchmark_suggests_cost_factor(test_client):
+    """ ✅ GIVEN a generous latency target
+        WHEN the benchmark command is run over a small range of costs
+        THEN check that it suggests the highest cost within the target
+    """
+    result = test_client.application.test_cli_runner().invoke(args=[
+        'passwords', 'benchmark', '--min-rounds', '4', '--max-rounds', '5', '--samples', '1', '--target-ms', '10000'
+    ])
+    assert 'rounds=4' in result.output
+    assert 'Suggested BCRYPT_LOG_ROUNDS=5 (currently 4).' in result.output
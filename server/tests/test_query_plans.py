@@ -0,0 +1,109 @@
+import sys
+import os
+import re
+import pytest
+from datetime import datetime, timedelta
+from sqlalchemy import text
+from flask_jwt_extended import create_access_token
+
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app import create_app, db
+from app.models.event import Event
+from app.models.category import Category
+from app.models.ticket import Ticket
+from app.models.user import User
+
+# Lookup tables small enough that a full scan is the right plan
+SCANNABLE_TABLES = {'categories'}
+
+# Pytest fixture
+@pytest.fixture(scope='function')
+def test_client():
+    """Create and configure a new app instance for each test."""
+    app = create_app('testing')
+    client = app.test_client()
+
+    with app.app_context():
+        db.create_all()
+        yield client
+        db.session.remove()
+        db.drop_all()
+
+def seed():
+    organizer = User(first_name='Org', last_name='Anizer', phone_number='123',
+                     username='organizer', email='org@example.com', role='organizer', password_hash='not-used')
+    attendee = User(first_name='Att', last_name='Endee', phone_number='456',
+                    username='attendee', email='att@example.com', role='attendee', password_hash='not-used')
+    music = Category(name='Music', slug='music')
+    db.session.add_all([organizer, attendee, music])
+    db.session.flush()
+    for i in range(5):
+        event = Event(title=f'Concert {i}', date=datetime.utcnow() + timedelta(days=i + 1), location='Nairobi',
+                      price=100.0 * i, max_attendees=100, slug=f'concert-{i}', organizer_id=organizer.id,
+                      categories=[music])
+        db.session.add(event)
+        db.session.flush()
+        if i < 2:
+            db.session.add(Ticket(user_id=attendee.id, event_id=event.id, quantity=1))
+    db.session.commit()
+    token = lambda user: {'Authorization': 'Bearer ' + create_access_token(
+        identity=str(user.id), additional_claims={'role': user.role})}
+    return token(organizer), token(attendee)
+
+def sequential_scans(statement, parameters):
+    """EXPLAINs a statement and returns the tables it reads with a full table scan."""
+    connection = db.session.connection()
+    if connection.dialect.name == 'postgresql':
+        # Tiny test tables make a seq scan the cheapest plan; only fail if no index could be used
+        connection.execute(text('SET LOCAL enable_seqscan = off'))
+        plan = [row[0] for row in connection.exec_driver_sql('EXPLAIN ' + statement, parameters)]
+        return {m.group(1) for line in plan for m in [re.search(r'Seq Scan on (\w+)', line)] if m}
+    plan = [row[3] for row in connection.exec_driver_sql('EXPLAIN QUERY PLAN ' + statement, parameters)]
+    return {m.group(1) for line in plan for m in [re.fullmatch(r'SCAN (\w+)', line)] if m}
+
+HOT_REQUESTS = [
+    ('GET', '/api/events/?limit=20', None),
+    ('GET', '/api/events/?sort=price&limit=20&cursor=', None),
+    ('GET', '/api/events/?category=music', None),
+    ('GET', '/api/events/?facets=true&upcoming=true', None),
+    ('GET', '/api/events/featured', None),
+    ('GET', '/api/events/top-picks', None),
+    ('GET', '/api/events/upcoming', None),
+    ('GET', '/api/events/slug/concert-1', None),
+    ('GET', '/api/categories/', None),
+    ('GET', '/api/categories/1', None),
+    ('GET', '/api/categories/1/events?upcoming=true', None),
+    ('GET', '/api/users/organizer/events', 'organizer'),
+    ('GET', '/api/users/organizer/stats', 'organizer'),
+    ('GET', '/api/users/attendee/tickets', 'attendee'),
+    ('GET', '/api/users/dashboard', 'organizer'),
+    ('GET', '/api/users/dashboard', 'attendee'),
+    ('POST', '/api/tickets/', 'attendee'),
+    ('DELETE', '/api/events/5', 'organizer'),
+]
+
+# --- Test Functions ---
+
+@pytest.mark.parametrize('method,path,role', HOT_REQUESTS)
+def test_hot_queries_use_indexes(test_client, capture_statements, method, path, role):
+    """ ✅ GIVEN a seeded catalog with organizers, attendees and tickets
+        WHEN a hot endpoint runs
+        THEN check that EXPLAIN shows no sequential scan for any statement it issues
+    """
+    organizer, attendee = seed()
+    headers = {'organizer': organizer, 'attendee': attendee}.get(role, {})
+    body = {'event_id': 3, 'quantity': 1} if method == 'POST' else None
+
+    with capture_statements() as statements:
+        res = test_client.open(path, method=method, headers=headers, json=body)
+    assert res.status_code < 400, res.get_data(as_text=True)
+
+    # Only the non-batched DML and SELECTs can be EXPLAINed
+    explainable = [statement for statement in statements if not statement.executemany and
+                   statement.lstrip().upper().startswith(('SELECT', 'INSERT', 'UPDATE', 'DELETE'))]
+    assert explainable
+    for statement in explainable:
+        scans = sequential_scans(statement, statement.parameters) - SCANNABLE_TABLES
+        assert not scans, f'sequential scan on {scans}:\n{statement}'
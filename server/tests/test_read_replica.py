@@ -0,0 +1,135 @@
+import sys
+import os
+import pytest
+from datetime import datetime, timedelta
+from flask import g
+from flask_jwt_extended import create_access_token
+
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app import create_app, db
+from app.config import TestConfig
+from app.models.event import Event
+from app.models.user import User
+from app.cache import MemoryBackend
+from app.replica import STICKY_COOKIE
+
+# Pytest fixture
+@pytest.fixture(scope='function')
+def test_client(tmp_path):
+    """
+    Create an app whose replica is a separate SQLite file holding stale data,
+    so every response shows which database served it.
+    """
+    class ReplicaConfig(TestConfig):
+        SQLALCHEMY_DATABASE_URI = f"sqlite:///{tmp_path / 'primary.db'}"
+        REPLICA_DATABASE_URI = f"sqlite:///{tmp_path / 'replica.db'}"
+
+    app = create_app(ReplicaConfig)
+    client = app.test_client()
+    with app.app_context():
+        db.create_all()
+        replica = db.engines['replica']
+        db.metadata.create_all(replica)
+        date = datetime.utcnow() + timedelta(days=7)
+        with replica.begin() as connection:
+            connection.execute(Event.__table__.insert(), [
+                {'id': 1, 'title': 'Replica Copy', 'slug': 'shared', 'date': date, 'location': 'Nairobi'},
+            ])
+        organizer = User(first_name='Org', last_name='User', phone_number='1', username='org',
+                         email='org@example.com', role='organizer', password_hash='not-used')
+        db.session.add(organizer)
+        db.session.add(Event(id=1, title='Primary Copy', slug='shared', date=date, location='Nairobi'))
+        db.session.commit()
+        client.organizer_headers = {'Authorization': 'Bearer ' + create_access_token(
+            identity=str(organizer.id), additional_claims={'role': 'organizer'})}
+        yield client
+        db.session.remove()
+        db.drop_all()
+        db.metadata.drop_all(replica)
+        for engine in db.engines.values():
+            engine.dispose()
+
+def titles(res):
+    assert res.status_code == 200
+    return sorted(event['title'] for event in res.get_json()['events'])
+
+def create_event(client, title):
+    return client.post('/api/events/', headers=client.organizer_headers, data={
+        'title': title, 'description': 'Fresh', 'date': (datetime.utcnow() + timedelta(days=3)).isoformat(),
+        'price': '100', 'max_attendees': '10', 'location': 'Nairobi', 'venue': 'KICC',
+    })
+
+# --- Test Functions ---
+
+def test_public_reads_are_served_by_the_replica(test_client):
+    """ ✅ GIVEN a replica that lags behind the primary
+        WHEN public event and category endpoints are read
+        THEN check that they are answered from the replica
+    """
+    assert titles(test_client.get('/api/events/')) == ['Replica Copy']
+    assert test_client.get('/api/events/1').get_json()['title'] == 'Replica Copy'
+    assert test_client.get('/api/events/slug/shared').get_json()['title'] == 'Replica Copy'
+    assert test_client.get('/api/categories/').status_code == 200
+
+def test_client_reads_its_own_writes(test_client):
+    """ ✅ GIVEN an organizer who just created an event
+        WHEN they read the listing within the sticky window
+        THEN check that the primary answers, and the replica again once the window has passed
+    """
+    res = create_event(test_client, 'Brand New')
+    assert res.status_code == 201
+    assert STICKY_COOKIE in res.headers['Set-Cookie']
+
+    assert titles(test_client.get('/api/events/')) == ['Brand New', 'Primary Copy']
+
+    test_client.set_cookie(STICKY_COOKIE, '0')
+    assert titles(test_client.get('/api/events/')) == ['Replica Copy']
+
+def test_response_cache_is_filled_from_the_primary(test_client):
+    """ ✅ GIVEN a response-cached endpoint and a lagging replica
+        WHEN a client that has not written misses the cache just after another client's write
+        THEN check that the primary answers, so the shared entry is not stale
+    """
+    test_client.application.extensions['response_cache'] = MemoryBackend()
+    assert create_event(test_client, 'Brand New').status_code == 201
+    test_client.set_cookie(STICKY_COOKIE, '0')
+
+    miss = test_client.get('/api/events/featured')
+    hit = test_client.get('/api/events/featured')
+    assert (miss.headers['X-Cache'], hit.headers['X-Cache']) == ('MISS', 'HIT')
+    assert sorted(event['title'] for event in hit.get_json()) == ['Brand New', 'Primary Copy']
+    assert titles(test_client.get('/api/events/')) == ['Replica Copy']
+
+def test_reads_after_a_write_in_the_same_request_use_the_primary(test_client):
+    """ ✅ GIVEN a replica-routed request
+        WHEN it writes and then reads
+        THEN check that the read after the write goes to the primary
+    """
+    app = test_client.application
+    with app.test_request_context('/api/events/', method='GET'):
+        app.preprocess_request()
+        assert g.read_replica
+        assert db.session.get(Event, 1).title == 'Replica Copy'
+
+        db.session.add(Event(title='Same Request', slug='same-request',
+                             date=datetime.utcnow() + timedelta(days=1), location='Nairobi'))
+        db.session.flush()
+        assert not g.read_replica
+        assert Event.query.filter_by(slug='same-request').count() == 1
+        db.session.rollback()
+
+def test_unlisted_blueprints_and_failed_writes_use_the_primary(test_client):
+    """ ❌ GIVEN replica routing
+        WHEN a blueprint outside REPLICA_READ_BLUEPRINTS is read, or a write is rejected before touching the database
+        THEN check that the primary answers and no stickiness is set
+    """
+    test_client.application.config['REPLICA_READ_BLUEPRINTS'] = ('category_bp',)
+    assert titles(test_client.get('/api/events/')) == ['Primary Copy']
+    test_client.application.config['REPLICA_READ_BLUEPRINTS'] = ('events',)
+
+    res = test_client.post('/api/events/', headers=test_client.organizer_headers, data={'title': 'Incomplete'})
+    assert res.status_code == 400
+    assert 'Set-Cookie' not in res.headers
+    assert titles(test_client.get('/api/events/')) == ['Replica Copy']
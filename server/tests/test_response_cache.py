@@ -0,0 +1,168 @@
+import sys
+import os
+import pytest
+from datetime import datetime, timedelta
+from flask_jwt_extended import create_access_token
+
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app import create_app, db
+from app.cache import cache, MemoryBackend
+from app.config import TestConfig
+from app.models.event import Event
+from app.models.category import Category
+from app.models.user import User
+
+class CachedTestConfig(TestConfig):
+    CACHE_TYPE = "memory"
+    CACHE_MAX_ENTRIES = 16
+
+# Pytest fixture
+@pytest.fixture(scope='function')
+def test_client():
+    """Create and configure a new app instance with the in-memory cache enabled."""
+    app = create_app(CachedTestConfig)
+    client = app.test_client()
+
+    with app.app_context():
+        db.create_all()
+        yield client
+        db.session.remove()
+        db.drop_all()
+
+def organizer_headers():
+    organizer = User(
+        first_name='Org', last_name='Anizer', phone_number='123',
+        username='organizer', email='org@example.com', role='organizer'
+    )
+    organizer.password_hash = 'not-used'
+    db.session.add(organizer)
+    db.session.commit()
+    token = create_access_token(identity=str(organizer.id), additional_claims={'role': 'organizer'})
+    return {'Authorization': f'Bearer {token}'}
+
+def add_event(title, days=1, price=100.0):
+    event = Event(
+        title=title,
+        date=datetime.utcnow() + timedelta(days=days),
+        location='Nairobi',
+        price=price,
+        slug=Event.slugify(title),
+    )
+    db.session.add(event)
+    db.session.commit()
+    return event
+
+# --- Test Functions ---
+
+def test_memory_backend_evicts_least_recently_used_and_expired(monkeypatch):
+    """ ✅ GIVEN a bounded in-memory backend
+        WHEN it overflows or entries outlive their TTL
+        THEN check that the oldest and expired entries are dropped
+    """
+    now = [1000.0]
+    monkeypatch.setattr('app.cache.time.monotonic', lambda: now[0])
+    backend = MemoryBackend(max_entries=2)
+    backend.set('a', 1, timeout=10)
+    backend.set('b', 2, timeout=10)
+    assert backend.get('a') == 1
+    backend.set('c', 3, timeout=10)
+    assert backend.get('b') is None
+    assert backend.get('a') == 1
+
+    now[0] += 11
+    assert backend.get('c') is None
+    assert backend.stats() == {'backend': 'MemoryBackend', 'hits': 2, 'misses': 2}
+
+def test_memory_backend_drops_values_computed_before_a_clear():
+    """ ❌ GIVEN a response computed under one generation
+        WHEN the cache is cleared before the response is stored
+        THEN check that it is not stored, while the next generation's responses are
+    """
+    backend = MemoryBackend()
+    generation = backend.generation()
+    backend.clear()
+    backend.set('a', 'stale', timeout=10, generation=generation)
+    assert backend.get('a') is None
+
+    backend.set('a', 'fresh', timeout=10, generation=backend.generation())
+    assert backend.get('a') == 'fresh'
+
+@pytest.mark.parametrize('path', ['/api/events/featured', '/api/events/top-picks', '/api/events/upcoming'])
+def test_homepage_endpoints_are_served_from_cache(test_client, path):
+    """ ✅ GIVEN a homepage endpoint that has been requested once
+        WHEN it is requested again
+        THEN check that the second response is a cache hit with the same body
+    """
+    add_event('Jazz Night')
+    first = test_client.get(path)
+    second = test_client.get(path)
+    assert first.headers['X-Cache'] == 'MISS'
+    assert second.headers['X-Cache'] == 'HIT'
+    assert second.get_json() == first.get_json()
+    assert cache.stats()['hits'] == 1
+
+def test_cache_is_keyed_by_query_args(test_client):
+    """ ✅ GIVEN the upcoming endpoint requested with different limits
+        WHEN each variant is requested
+        THEN check that each is cached separately
+    """
+    for i in range(3):
+        add_event(f'Event {i}', days=i + 1)
+    assert len(test_client.get('/api/events/upcoming?limit=1').get_json()) == 1
+    assert len(test_client.get('/api/events/upcoming?limit=3').get_json()) == 3
+    assert test_client.get('/api/events/upcoming?limit=1').headers['X-Cache'] == 'HIT'
+
+def test_cache_is_keyed_by_host(test_client):
+    """ ✅ GIVEN a cached listing whose bodies embed absolute image URLs
+        WHEN it is requested through another host
+        THEN check that each host gets its own entry and URLs
+    """
+    event = add_event('Gala')
+    event.image_url = '/uploads/gala.jpg'
+    db.session.commit()
+    internal = test_client.get('/api/events/featured', base_url='http://internal:10000')
+    public = test_client.get('/api/events/featured', base_url='https://events.example.com')
+    assert internal.headers['X-Cache'] == public.headers['X-Cache'] == 'MISS'
+    assert public.get_json()[0]['image_url'].startswith('https://events.example.com/')
+
+def test_event_writes_invalidate_cache(test_client):
+    """ ✅ GIVEN a cached featured listing
+        WHEN an organizer creates, updates and deletes an event
+        THEN check that the next read reflects each write
+    """
+    headers = organizer_headers()
+    add_event('Jazz Night', days=2)
+    assert [e['title'] for e in test_client.get('/api/events/featured').get_json()] == ['Jazz Night']
+
+    res = test_client.post('/api/events/', headers=headers, data={
+        'title': 'Food Fair', 'description': 'Street food', 'price': '0', 'max_attendees': '10',
+        'location': 'Nairobi', 'venue': 'Park', 'date': (datetime.utcnow() + timedelta(days=1)).isoformat(),
+    })
+    assert res.status_code == 201
+    event_id = res.get_json()['event']['id']
+    featured = test_client.get('/api/events/featured')
+    assert featured.headers['X-Cache'] == 'MISS'
+    assert [e['title'] for e in featured.get_json()] == ['Food Fair', 'Jazz Night']
+
+    test_client.patch(f'/api/events/{event_id}', headers=headers, json={'title': 'Street Food Fair'})
+    assert test_client.get('/api/events/featured').get_json()[0]['title'] == 'Street Food Fair'
+
+    test_client.delete(f'/api/events/{event_id}', headers=headers)
+    assert [e['title'] for e in test_client.get('/api/events/featured').get_json()] == ['Jazz Night']
+
+def test_category_writes_invalidate_cache(test_client):
+    """ ✅ GIVEN a cached listing that embeds category names
+        WHEN an organizer renames the category
+        THEN check that the next read shows the new name
+    """
+    headers = organizer_headers()
+    category = Category(name='Music', slug='music')
+    event = add_event('Jazz Night')
+    event.categories = [category]
+    db.session.commit()
+    assert test_client.get('/api/events/featured').get_json()[0]['categories'][0]['name'] == 'Music'
+
+    test_client.patch(f'/api/categories/{category.id}', headers=headers, json={'name': 'Live Music'})
+    assert test_client.get('/api/events/featured').get_json()[0]['categories'][0]['name'] == 'Live Music'
@@ -0,0 +1,123 @@
+import sys
+import os
+import pytest
+from datetime import datetime, timedelta
+
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app import create_app, db
+from app.models.event import Event
+from app.models.category import Category
+from app.models.ticket import Ticket
+from app.models.user import User
+from app.serializers import (EVENT_DETAIL, EVENT_OWNER, EVENT_SUMMARY, TICKET_WITH_EVENT, Computed, Nested,
+                             Serializer, UnplannedLoad)
+from benchmarks import serialization
+
+# Pytest fixture
+@pytest.fixture(scope='function')
+def test_client():
+    """Create and configure a new app instance for each test."""
+    app = create_app('testing')
+    client = app.test_client()
+
+    with app.app_context():
+        db.create_all()
+        organizer = User(first_name='Org', last_name='Anizer', phone_number='123', username='organizer',
+                         email='org@example.com', role='organizer', password_hash='not-used')
+        attendee = User(first_name='Att', last_name='Endee', phone_number='456', username='attendee',
+                        email='att@example.com', role='attendee', password_hash='not-used')
+        db.session.add_all([organizer, attendee])
+        db.session.flush()
+        music = Category(name='Music', slug='music')
+        event = Event(title='Gala', slug='gala', location='Nairobi', date=datetime.utcnow() + timedelta(days=3),
+                      price=1500.0, tickets_sold=2, organizer_id=organizer.id, categories=[music])
+        db.session.add(event)
+        db.session.flush()
+        db.session.add(Ticket(user_id=attendee.id, event_id=event.id, quantity=2))
+        db.session.commit()
+        db.session.expunge_all()
+        yield client
+        db.session.remove()
+        db.drop_all()
+
+# --- Test Functions ---
+
+def test_views_dump_their_fields(test_client):
+    """ ✅ GIVEN an event loaded with a view's planned options
+        WHEN it is dumped as a summary, detail and owner view
+        THEN check each view has its own field set and raw datetimes
+    """
+    with test_client.application.test_request_context():
+        event = Event.query.options(*EVENT_DETAIL.options()).one()
+        summary, detail, owner = EVENT_SUMMARY.dump(event), EVENT_DETAIL.dump(event), EVENT_OWNER.dump(event)
+    assert list(summary) == list(EVENT_SUMMARY.field_names)
+    assert summary['categories'] == [{'id': 1, 'name': 'Music', 'slug': 'music'}]
+    assert isinstance(detail['date'], datetime)
+    assert set(detail['categories'][0]) == {'id', 'name', 'description', 'slug', 'created_at', 'updated_at'}
+    assert owner['tickets_sold'] == 2 and 'categories' not in owner
+
+def test_unplanned_lazy_load_raises(test_client, capture_statements):
+    """ ❌ GIVEN an event queried without the view's options
+        WHEN a view that nests its categories dumps it
+        THEN check UnplannedLoad is raised before any lazy load runs
+    """
+    event = Event.query.one()
+    with capture_statements() as statements:
+        pytest.raises(UnplannedLoad, EVENT_SUMMARY.dump, event)
+    assert statements == []
+    assert EVENT_OWNER.dump(event)['title'] == 'Gala'
+
+def test_nested_views_plan_their_loads(test_client, capture_statements):
+    """ ✅ GIVEN tickets loaded through TICKET_WITH_EVENT.query()
+        WHEN they are dumped with the event and its categories
+        THEN check the whole tree costs one query per level
+    """
+    with test_client.application.test_request_context():
+        with capture_statements() as statements:
+            tickets = TICKET_WITH_EVENT.dump_many(TICKET_WITH_EVENT.query().all())
+    assert tickets[0]['event']['categories'][0]['slug'] == 'music'
+    assert len(statements) == 3
+
+def test_account_responses_skip_relationships(test_client, capture_statements):
+    """ ✅ GIVEN an organizer with events
+        WHEN they log in
+        THEN check the user payload has no password hash, tickets or events and loads no relationship
+    """
+    user = db.session.get(User, 1)
+    user.set_password('password123')
+    db.session.commit()
+    with capture_statements() as statements:
+        res = test_client.post('/api/login', json={'username': 'organizer', 'password': 'password123'})
+    assert res.status_code == 200
+    assert set(res.get_json()['user']) == {'id', 'first_name', 'last_name', 'phone_number', 'username', 'email',
+                                           'role', 'created_at'}
+    assert not [s for s in statements if 'FROM events' in s or 'FROM tickets' in s]
+
+def test_compile_rejects_unknown_fields():
+    """ ❌ GIVEN a view naming an attribute or relationship the model lacks
+        WHEN it is declared
+        THEN check it fails at compile time rather than per request
+    """
+    with pytest.raises(ValueError):
+        Serializer(Event, ['id', 'nope'])
+    with pytest.raises(ValueError):
+        Serializer(Event, [Nested('nope', EVENT_SUMMARY)])
+    view = Serializer(Event, ['id', Computed('label', lambda event: f'#{event.id}')])
+    assert view.dump(Event(id=7)) == {'id': 7, 'label': '#7'}
+
+def test_serializer_benchmark_matches_the_handwritten_methods():
+    """ ✅ GIVEN the reference copies of the replaced to_dict methods
+        WHEN the benchmark page is serialized both ways
+        THEN check the outputs agree apart from raw datetimes, and every variant reports a rate
+    """
+    app = create_app('testing')
+    with app.test_request_context():
+        page = serialization.make_page(3)
+        for view, handwritten in ((EVENT_SUMMARY, serialization.handwritten_summary),
+                                  (EVENT_DETAIL, serialization.handwritten_detail)):
+            compiled = app.json.loads(app.json.dumps(view.dump_many(page)))
+            assert compiled == [handwritten(event) for event in page]
+    results = serialization.run(events=3, rounds=2)
+    assert {'summary/compiled', 'summary/handwritten', 'detail/compiled', 'detail/handwritten'} <= set(results)
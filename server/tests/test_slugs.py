@@ -0,0 +1,102 @@
+import sys
+import os
+import pytest
+from datetime import datetime, timedelta
+from flask_jwt_extended import create_access_token
+
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app import create_app, db
+from app.models.event import Event
+from app.models.user import User
+from app.slugs import SlugTaken, insert_with_slug
+
+# Pytest fixture
+@pytest.fixture(scope='function')
+def test_client():
+    """Create and configure a new app instance for each test."""
+    app = create_app('testing')
+    client = app.test_client()
+
+    with app.app_context():
+        db.create_all()
+        organizer = User(first_name='Org', last_name='Anizer', phone_number='123',
+                         username='organizer', email='org@example.com', role='organizer')
+        organizer.password_hash = 'not-used'
+        db.session.add(organizer)
+        db.session.commit()
+        token = create_access_token(identity=str(organizer.id), additional_claims={'role': 'organizer'})
+        client.organizer_headers = {'Authorization': f'Bearer {token}'}
+        yield client
+        db.session.remove()
+        db.drop_all()
+
+def create_event(client, title):
+    return client.post('/api/events/', headers=client.organizer_headers, data={
+        'title': title, 'description': 'Live', 'date': (datetime.utcnow() + timedelta(days=3)).isoformat(),
+        'price': '100', 'max_attendees': '10', 'location': 'Nairobi', 'venue': 'KICC',
+    })
+
+def add_event(slug):
+    event = Event(title=slug, slug=slug, date=datetime.utcnow() + timedelta(days=1), location='Nairobi')
+    db.session.add(event)
+    db.session.commit()
+    return event
+
+# --- Test Functions ---
+
+def test_slugs_are_allocated_by_the_unique_index(test_client, capture_statements):
+    """ ✅ GIVEN two events with the same title
+        WHEN both are created
+        THEN check that the second gets a suffix and neither create looks the slug up first
+    """
+    with capture_statements() as statements:
+        first = create_event(test_client, 'Jazz Night!')
+        second = create_event(test_client, 'Jazz Night!')
+    assert first.status_code == second.status_code == 201
+    assert first.get_json()['event']['slug'] == 'jazz-night'
+    assert second.get_json()['event']['slug'].startswith('jazz-night-')
+    assert not [s for s in statements if s.startswith('SELECT') and 'events.slug =' in s]
+
+def test_allocation_gives_up_after_repeated_collisions(test_client, monkeypatch):
+    """ ❌ GIVEN a slug whose suffixes keep colliding
+        WHEN a new event is inserted
+        THEN check that SlugTaken is raised instead of looping forever
+    """
+    add_event('busy')
+    add_event('busy-aaaaaa')
+    monkeypatch.setattr('app.slugs.uuid.uuid4', lambda: type('U', (), {'hex': 'aaaaaaaaaaaa'})())
+    with pytest.raises(SlugTaken):
+        insert_with_slug(Event(title='Busy', date=datetime.utcnow(), location='Nairobi'), 'busy')
+
+def test_slugs_resolve_in_one_indexed_query(test_client, capture_statements):
+    """ ✅ GIVEN an event with a slug
+        WHEN it is requested by slug
+        THEN check that a single query on the slug finds it
+    """
+    event = add_event('warm-event')
+    with capture_statements() as statements:
+        res = test_client.get('/api/events/slug/warm-event')
+    assert res.get_json()['id'] == event.id
+    lookups = [s for s in statements if 'events.slug = ?' in s]
+    assert len(lookups) == 1 and 'events.id = ?' not in lookups[0]
+
+def test_category_rename_and_delete_free_the_slug(test_client):
+    """ ✅ GIVEN a category requested by slug
+        WHEN the category is renamed, then deleted
+        THEN check that the old slug stops resolving and duplicates still get 409
+    """
+    res = test_client.post('/api/categories/', json={'name': 'Live Music'}, headers=test_client.organizer_headers)
+    category_id = res.get_json()['category']['id']
+    assert test_client.get('/api/categories/slug/live-music').status_code == 200
+
+    duplicate = test_client.post('/api/categories/', json={'name': 'Live Music'}, headers=test_client.organizer_headers)
+    assert duplicate.status_code == 409
+
+    test_client.patch(f'/api/categories/{category_id}', json={'name': 'Concerts'}, headers=test_client.organizer_headers)
+    assert test_client.get('/api/categories/slug/live-music').status_code == 404
+    assert test_client.get('/api/categories/slug/concerts').status_code == 200
+
+    test_client.delete(f'/api/categories/{category_id}', headers=test_client.organizer_headers)
+    assert test_client.get('/api/categories/slug/concerts').status_code == 404
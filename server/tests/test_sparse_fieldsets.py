@@ -0,0 +1,106 @@
+import sys
+import os
+import pytest
+from datetime import datetime, timedelta
+
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app import create_app, db
+from app.models.event import Event
+from app.models.category import Category
+from app.serializers import Serializer
+
+# Pytest fixture
+@pytest.fixture(scope='function')
+def test_client():
+    """Create and configure a new app instance for each test."""
+    app = create_app('testing')
+    client = app.test_client()
+
+    with app.app_context():
+        db.create_all()
+        music = Category(name='Music', slug='music')
+        for i in range(3):
+            db.session.add(Event(title=f'Concert {i}', slug=f'concert-{i}', location='Nairobi',
+                                 description='A long description. ' * 50, price=100.0 * i,
+                                 date=datetime.utcnow() + timedelta(days=i + 1), categories=[music]))
+        db.session.commit()
+        yield client
+        db.session.remove()
+        db.drop_all()
+
+def reads(statements, text):
+    return [s for s in statements if text in s]
+
+# --- Test Functions ---
+
+@pytest.mark.parametrize('mode', ['', '&cursor='])
+def test_listing_projects_requested_fields(test_client, capture_statements, mode):
+    """ ✅ GIVEN events with long descriptions and categories
+        WHEN the listing is requested with fields=title,date in offset and keyset mode
+        THEN check only those fields and the id are returned, and neither other columns nor categories are read
+    """
+    with capture_statements() as statements:
+        res = test_client.get(f'/api/events/?fields=title,date{mode}')
+    assert res.status_code == 200
+    assert res.get_json()['events'][0] == {'id': 1, 'title': 'Concert 0', 'date': res.get_json()['events'][0]['date']}
+    assert not reads(statements, 'events.location')
+    assert not reads(statements, 'event_categories')
+
+def test_listing_loads_categories_only_when_requested(test_client, capture_statements):
+    """ ✅ GIVEN the event listing
+        WHEN fields includes categories
+        THEN check the categories are batch-loaded and returned
+    """
+    with capture_statements() as statements:
+        res = test_client.get('/api/events/?fields=title,categories')
+    assert res.get_json()['events'][0]['categories'] == [{'id': 1, 'name': 'Music', 'slug': 'music'}]
+    assert len(reads(statements, 'event_categories')) == 1
+
+def test_default_listing_skips_the_description(test_client, capture_statements):
+    """ ✅ GIVEN the event listing without fields
+        WHEN a page of summaries is requested
+        THEN check the summary columns are loaded but not the description
+    """
+    with capture_statements() as statements:
+        res = test_client.get('/api/events/')
+    assert 'short_description' in res.get_json()['events'][0]
+    assert not [s for s in statements if 'events.description' in s]
+
+def test_detail_honours_fields(test_client, capture_statements):
+    """ ✅ GIVEN an event
+        WHEN its detail is requested by id and by slug with fields=description
+        THEN check only the description and id are returned, without loading categories
+    """
+    with capture_statements() as statements:
+        res = test_client.get('/api/events/1?fields=description')
+    assert set(res.get_json()) == {'id', 'description'}
+    assert not reads(statements, 'event_categories')
+    assert set(test_client.get('/api/events/slug/concert-1?fields=title,categories').get_json()) == \
+        {'id', 'title', 'categories'}
+    assert res.headers['ETag'] != test_client.get('/api/events/1').headers['ETag']
+
+def test_unknown_fields_are_rejected(test_client):
+    """ ❌ GIVEN the listing and detail endpoints
+        WHEN a field outside the view is requested
+        THEN check a 400 names the available fields
+    """
+    res = test_client.get('/api/events/?fields=title,description')
+    assert res.status_code == 400
+    assert 'description' in res.get_json()['error'] and 'short_description' in res.get_json()['error']
+    assert test_client.get('/api/events/1?fields=password').status_code == 400
+
+def test_compiled_fieldsets_are_bounded(monkeypatch):
+    """ ✅ GIVEN a view that keeps two compiled fieldsets
+        WHEN a third fieldset is requested
+        THEN check that the least recently used one is evicted and the others are reused
+    """
+    monkeypatch.setattr('app.serializers.MAX_SUBSETS', 2)
+    view = Serializer(Event, ['id', 'title', 'price', 'location'])
+    title = view.only(['title'])
+    price = view.only(['price'])
+    assert view.only(['title']) is title
+    view.only(['location'])
+    assert list(view._subsets) == [frozenset(['title']), frozenset(['location'])]
+    assert view.only(['price']) is not price
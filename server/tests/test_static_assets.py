@@ -0,0 +1,109 @@
+import sys
+import os
+import gzip
+import pytest
+
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app import create_app, db
+from app.config import TestConfig
+
+BUNDLE = 'console.log("event horizon");\n' * 200
+
+def build_dist(root):
+    """Lays out a Vite-style build: index.html plus hashed bundles under assets/."""
+    (root / 'assets').mkdir()
+    (root / 'index.html').write_text('<!doctype html><div id="root"></div>')
+    (root / 'assets' / 'index-3f9aB1cD.js').write_text(BUNDLE)
+    (root / 'favicon.svg').write_text('<svg/>')
+    (root / 'apple-touch-icon.png').write_bytes(b'\x89PNG')
+    (root / 'assets' / 'logo-original.svg').write_text('<svg/>')
+
+# Pytest fixture
+@pytest.fixture(scope='function')
+def test_client(tmp_path):
+    """Create and configure a new app instance serving a temporary client build."""
+    build_dist(tmp_path)
+
+    class DistConfig(TestConfig):
+        CLIENT_DIST_FOLDER = str(tmp_path)
+
+    app = create_app(DistConfig)
+    runner = app.test_cli_runner()
+    result = runner.invoke(args=['assets', 'compress'])
+    assert 'Compressed 1 of 5 files.' in result.output
+    client = app.test_client()
+
+    with app.app_context():
+        db.create_all()
+        yield client
+        db.session.remove()
+        db.drop_all()
+
+# --- Test Functions ---
+
+def test_hashed_bundle_is_served_precompressed_and_immutable(test_client):
+    """ ✅ GIVEN a hashed JS bundle with a pre-built gzip variant
+        WHEN it is requested with and without Accept-Encoding: gzip
+        THEN check that the matching variant is sent with immutable caching
+    """
+    res = test_client.get('/assets/index-3f9aB1cD.js', headers={'Accept-Encoding': 'br;q=0, gzip'})
+    assert res.status_code == 200
+    assert res.headers['Content-Encoding'] == 'gzip'
+    assert res.headers['Cache-Control'] == 'public, max-age=31536000, immutable'
+    assert 'Accept-Encoding' in res.headers['Vary']
+    assert gzip.decompress(res.data).decode() == BUNDLE
+
+    plain = test_client.get('/assets/index-3f9aB1cD.js')
+    assert 'Content-Encoding' not in plain.headers
+    assert plain.get_data(as_text=True) == BUNDLE
+    assert plain.mimetype in ('text/javascript', 'application/javascript')
+    assert plain.headers['ETag'] != res.headers['ETag']
+
+def test_client_routes_fall_back_to_index_without_probing(test_client, monkeypatch):
+    """ ✅ GIVEN an indexed client build
+        WHEN client-side routes and the root are requested
+        THEN check that index.html is served for revalidation without filesystem probes
+    """
+    def fail(*args):
+        raise AssertionError('filesystem probed')
+    monkeypatch.setattr(os.path, 'exists', fail)
+    monkeypatch.setattr(os.path, 'isfile', fail)
+
+    for path in ('/', '/events/tech-summit', '/index.html'):
+        res = test_client.get(path)
+        assert res.status_code == 200
+        assert b'id="root"' in res.data
+        assert res.headers['Cache-Control'] == 'no-cache'
+
+    icon = test_client.get('/favicon.svg')
+    assert icon.mimetype == 'image/svg+xml'
+    assert 'Content-Encoding' not in icon.headers
+
+def test_unhashed_names_are_revalidated(test_client):
+    """ ✅ GIVEN hyphenated files that carry no content hash, at the root and under assets/
+        WHEN they are requested
+        THEN check that they are revalidated rather than cached as immutable
+    """
+    for path in ('/apple-touch-icon.png', '/assets/logo-original.svg'):
+        res = test_client.get(path)
+        assert res.status_code == 200
+        assert res.headers['Cache-Control'] == 'no-cache'
+
+def test_index_revalidates_with_etag(test_client):
+    """ ✅ GIVEN index.html fetched once
+        WHEN it is requested again with its ETag
+        THEN check that a 304 is returned
+    """
+    first = test_client.get('/')
+    res = test_client.get('/dashboard', headers={'If-None-Match': first.headers['ETag']})
+    assert res.status_code == 304
+
+def test_missing_bundle_is_not_answered_with_html(test_client):
+    """ ❌ GIVEN a request for a bundle that is not in the build
+        WHEN it is requested
+        THEN check that a 404 is returned instead of index.html
+    """
+    assert test_client.get('/assets/index-00000000.js').status_code == 404
+    assert test_client.get('/api/events/').status_code == 200
@@ -0,0 +1,107 @@
+import sys
+import os
+import json
+import pytest
+from datetime import datetime, timedelta
+from sqlalchemy import insert
+from flask_jwt_extended import create_access_token
+
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app import create_app, db
+from app.models.event import Event
+from app.models.category import Category
+from app.models.ticket import Ticket
+from app.models.user import User
+
+# Pytest fixture
+@pytest.fixture(scope='function')
+def test_client():
+    """Create and configure a new app instance for each test."""
+    app = create_app('testing')
+    client = app.test_client()
+
+    with app.app_context():
+        db.create_all()
+        yield client
+        db.session.remove()
+        db.drop_all()
+
+def create_user(username, role):
+    user = User(
+        first_name='Test', last_name='User', phone_number='123',
+        username=username, email=f'{username}@example.com', role=role
+    )
+    user.password_hash = 'not-used'
+    db.session.add(user)
+    db.session.commit()
+    headers = {'Authorization': f"Bearer {create_access_token(identity=str(user.id), additional_claims={'role': role})}"}
+    return user, headers
+
+def create_events(organizer, count):
+    start = datetime.utcnow() + timedelta(days=1)
+    db.session.execute(insert(Event), [
+        {
+            'title': f'Event {i}', 'date': start + timedelta(hours=i), 'location': 'Nairobi',
+            'slug': f'event-{i}', 'organizer_id': organizer.id,
+        }
+        for i in range(count)
+    ])
+    db.session.commit()
+
+def read_ndjson(res):
+    assert res.status_code == 200
+    assert res.mimetype == 'application/x-ndjson'
+    return [json.loads(line) for line in res.get_data(as_text=True).splitlines()]
+
+# --- Test Functions ---
+
+def test_organizer_events_stream_matches_json_listing(test_client):
+    """ ✅ GIVEN an organizer with more events than one chunk
+        WHEN their events are requested with ?stream=1 or an NDJSON Accept header
+        THEN check that the stream carries the same events in the same order
+    """
+    organizer, headers = create_user('organizer', 'organizer')
+    create_events(organizer, 1200)
+
+    listing = test_client.get('/api/users/organizer/events', headers=headers).get_json()
+    by_param = test_client.get('/api/users/organizer/events?stream=1', headers=headers)
+    assert by_param.is_streamed
+    assert read_ndjson(by_param) == listing
+
+    by_accept = test_client.get('/api/users/organizer/events',
+                                headers={**headers, 'Accept': 'application/x-ndjson'})
+    assert [e['id'] for e in read_ndjson(by_accept)] == [e['id'] for e in listing]
+
+def test_organizer_events_stream_is_flushed_in_chunks(test_client):
+    """ ✅ GIVEN an organizer with 1200 events
+        WHEN their events are streamed
+        THEN check that the body arrives in 500-row chunks
+    """
+    organizer, headers = create_user('organizer', 'organizer')
+    create_events(organizer, 1200)
+
+    res = test_client.get('/api/users/organizer/events?stream=1', headers=headers, buffered=False)
+    chunks = [chunk.decode('utf-8') for chunk in res.response]
+    res.close()
+    assert [chunk.count('\n') for chunk in chunks] == [500, 500, 200]
+
+def test_attendee_tickets_stream_includes_event_and_categories(test_client):
+    """ ✅ GIVEN an attendee holding tickets to categorised events
+        WHEN their tickets are streamed
+        THEN check that each line embeds the event summary
+    """
+    organizer, _ = create_user('organizer', 'organizer')
+    attendee, headers = create_user('attendee', 'attendee')
+    create_events(organizer, 3)
+    category = Category(name='Music', slug='music')
+    for event in Event.query.all():
+        event.categories = [category]
+        db.session.add(Ticket(user_id=attendee.id, event_id=event.id, quantity=2))
+    db.session.commit()
+
+    lines = read_ndjson(test_client.get('/api/users/attendee/tickets?stream=1', headers=headers))
+    listing = test_client.get('/api/users/attendee/tickets', headers=headers).get_json()
+    assert lines == listing
+    assert [t['event']['categories'][0]['slug'] for t in lines] == ['music'] * 3
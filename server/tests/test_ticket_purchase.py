@@ -0,0 +1,174 @@
+import sys
+import os
+import time
+import statistics
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from sqlalchemy import func, insert
+from sqlalchemy.exc import IntegrityError
+from flask_jwt_extended import create_access_token
+
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app import create_app, db
+from app.config import TestConfig
+from app.models.event import Event
+from app.models.ticket import Ticket
+from app.models.user import User
+
+# Pytest fixtures
+@pytest.fixture(scope='function')
+def test_client():
+    """Create and configure a new app instance for each test."""
+    app = create_app('testing')
+    client = app.test_client()
+
+    with app.app_context():
+        db.create_all()
+        yield client
+        db.session.remove()
+        db.drop_all()
+
+@pytest.fixture(scope='function')
+def file_db_client(tmp_path):
+    """An app backed by an on-disk SQLite database, so worker threads get their own connections."""
+    class FileDBConfig(TestConfig):
+        SQLALCHEMY_DATABASE_URI = f"sqlite:///{tmp_path / 'load.db'}"
+        SQLALCHEMY_ENGINE_OPTIONS = {"connect_args": {"timeout": 30}}
+
+    app = create_app(FileDBConfig)
+    client = app.test_client()
+
+    with app.app_context():
+        db.create_all()
+        yield client
+        db.session.remove()
+        db.drop_all()
+
+def create_attendees(count):
+    db.session.execute(insert(User), [
+        {
+            'first_name': 'Load', 'last_name': f'Tester {i}', 'phone_number': '000',
+            'username': f'attendee{i}', 'email': f'attendee{i}@example.com',
+            'password_hash': 'not-used', 'role': 'attendee',
+        }
+        for i in range(count)
+    ])
+    db.session.commit()
+    return [
+        {'Authorization': f"Bearer {create_access_token(identity=str(user_id), additional_claims={'role': 'attendee'})}"}
+        for (user_id,) in db.session.query(User.id).order_by(User.id)
+    ]
+
+def create_event(max_attendees):
+    event = Event(
+        title='Sold Out Show',
+        date=datetime.utcnow() + timedelta(days=7),
+        location='Nairobi',
+        max_attendees=max_attendees,
+        slug='sold-out-show',
+    )
+    db.session.add(event)
+    db.session.commit()
+    return event.id
+
+# --- Test Functions ---
+
+def test_purchase_updates_inventory_counter(test_client):
+    """ ✅ GIVEN an event with capacity
+        WHEN an attendee buys tickets
+        THEN check that the ticket is saved and the counter moves by the quantity
+    """
+    headers = create_attendees(1)[0]
+    event_id = create_event(max_attendees=5)
+
+    res = test_client.post('/api/tickets/', headers=headers, json={'event_id': event_id, 'quantity': 3})
+    assert res.status_code == 201
+    assert res.get_json()['ticket']['quantity'] == 3
+    assert db.session.get(Event, event_id).tickets_sold == 3
+
+def test_purchase_rejects_duplicates_and_oversell(test_client):
+    """ ❌ GIVEN an event that is nearly full
+        WHEN an attendee buys twice, or asks for more than remains
+        THEN check for 409s that leave the counter untouched
+    """
+    first, second = create_attendees(2)
+    event_id = create_event(max_attendees=4)
+    assert test_client.post('/api/tickets/', headers=first, json={'event_id': event_id, 'quantity': 3}).status_code == 201
+
+    res = test_client.post('/api/tickets/', headers=first, json={'event_id': event_id, 'quantity': 1})
+    assert res.status_code == 409
+    assert 'already have tickets' in res.get_json()['error']
+
+    res = test_client.post('/api/tickets/', headers=second, json={'event_id': event_id, 'quantity': 2})
+    assert res.status_code == 409
+    assert 'Only 1 tickets remaining' in res.get_json()['error']
+
+    assert db.session.get(Event, event_id).tickets_sold == 3
+    assert test_client.post('/api/tickets/', headers=second, json={'event_id': 999, 'quantity': 1}).status_code == 404
+
+def test_purchase_only_maps_the_duplicate_constraint_to_409(test_client, monkeypatch):
+    """ ❌ GIVEN a purchase that violates some constraint other than one ticket per attendee and event
+        WHEN it is made
+        THEN check that the error is raised instead of reported as a duplicate, and the reservation is released
+    """
+    headers = create_attendees(1)[0]
+    event_id = create_event(max_attendees=5)
+    error = IntegrityError('INSERT', {}, Exception('NOT NULL constraint failed: organizer_daily_stats.day'))
+    def record_purchase(*args):
+        raise error
+    monkeypatch.setattr('app.routes.ticket_routes.record_purchase', record_purchase)
+
+    with pytest.raises(IntegrityError):
+        test_client.post('/api/tickets/', headers=headers, json={'event_id': event_id})
+    assert db.session.get(Event, event_id).tickets_sold == 0
+
+def test_purchase_does_not_aggregate_existing_tickets(test_client, capture_statements):
+    """ ✅ GIVEN an event with tickets already sold
+        WHEN another purchase is made
+        THEN check that no SUM over the event's tickets is issued
+    """
+    attendees = create_attendees(3)
+    event_id = create_event(max_attendees=10)
+    test_client.post('/api/tickets/', headers=attendees[0], json={'event_id': event_id})
+
+    with capture_statements() as statements:
+        test_client.post('/api/tickets/', headers=attendees[1], json={'event_id': event_id})
+
+    # reserve, insert, then reload the committed ticket for the response
+    assert not any('sum(' in s.lower() for s in statements)
+    assert len(statements) == 3
+
+def test_concurrent_purchases_never_oversell(file_db_client):
+    """ ✅ GIVEN an on-sale with far more buyers than seats
+        WHEN thousands of purchases arrive concurrently
+        THEN check that exactly the capacity is sold and latency stays flat
+    """
+    capacity, buyers = 1000, 2000
+    attendees = create_attendees(buyers)
+    event_id = create_event(max_attendees=capacity)
+
+    def purchase(i):
+        started = time.perf_counter()
+        res = file_db_client.post('/api/tickets/', headers=attendees[i],
+                                  json={'event_id': event_id, 'quantity': 1 + i % 3})
+        return res.status_code, time.perf_counter() - started
+
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        results = list(pool.map(purchase, range(buyers)))
+
+    statuses = [status for status, _ in results]
+    assert set(statuses) <= {201, 409}
+
+    db.session.expire_all()
+    sold = db.session.get(Event, event_id).tickets_sold
+    assert sold == db.session.query(func.sum(Ticket.quantity)).filter_by(event_id=event_id).scalar()
+    assert sold == sum(1 + i % 3 for i, status in enumerate(statuses) if status == 201)
+    assert capacity - 2 <= sold <= capacity
+
+    latencies = [latency for _, latency in results]
+    early = statistics.median(latencies[100:600])
+    late = statistics.median(latencies[-500:])
+    assert late < early * 3
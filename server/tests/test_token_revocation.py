@@ -0,0 +1,142 @@
+import sys
+import os
+import pytest
+from datetime import datetime, timedelta
+from flask_jwt_extended import create_access_token, decode_token
+
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app import create_app, db
+from app.models.user import User
+from app.models.token_blocklist import TokenBlocklist
+from app.revocation import revocations, utcnow
+
+# Pytest fixture
+@pytest.fixture(scope='function')
+def test_client():
+    """Create and configure a new app instance for each test."""
+    app = create_app('testing')
+    client = app.test_client()
+
+    with app.app_context():
+        db.create_all()
+        yield client
+        db.session.remove()
+        db.drop_all()
+
+def create_user():
+    user = User(
+        first_name='Test', last_name='User', phone_number='123',
+        username='testuser', email='test@example.com', role='attendee'
+    )
+    user.password_hash = 'not-used'
+    db.session.add(user)
+    db.session.commit()
+    return user
+
+def auth_headers(token):
+    return {'Authorization': f'Bearer {token}'}
+
+def access_token_for(user):
+    return create_access_token(identity=str(user.id), additional_claims={'role': user.role})
+
+# --- Test Functions ---
+
+def test_logout_revokes_token_and_records_expiry(test_client):
+    """ ✅ GIVEN a logged-in user
+        WHEN they log out
+        THEN check that the token is rejected and its expiry is stored
+    """
+    token = access_token_for(create_user())
+    assert test_client.get('/api/users/dashboard', headers=auth_headers(token)).status_code == 200
+
+    res = test_client.post('/api/logout', headers=auth_headers(token))
+    assert res.status_code == 200
+
+    res = test_client.get('/api/users/dashboard', headers=auth_headers(token))
+    assert res.status_code == 401
+    assert 'Token has been revoked' in res.get_json()['msg']
+
+    row = TokenBlocklist.query.one()
+    assert row.token_type == 'access'
+    assert utcnow() + timedelta(minutes=29) < row.expires_at <= utcnow() + timedelta(minutes=30)
+
+def test_blocklist_check_does_not_query_database_per_request(test_client, capture_statements):
+    """ ✅ GIVEN a warm revocation set
+        WHEN protected endpoints are called repeatedly
+        THEN check that the blocklist table is not queried again
+    """
+    token = access_token_for(create_user())
+    test_client.get('/api/users/dashboard', headers=auth_headers(token))
+
+    with capture_statements() as statements:
+        for _ in range(5):
+            test_client.get('/api/users/dashboard', headers=auth_headers(token))
+
+    assert statements
+    assert not any('token_blocklist' in s for s in statements)
+
+def test_revocations_from_other_workers_are_synced(test_client):
+    """ ✅ GIVEN a token revoked by another process
+        WHEN the sync interval has elapsed
+        THEN check that this process rejects the token too
+    """
+    user = create_user()
+    token = access_token_for(user)
+    test_client.get('/api/users/dashboard', headers=auth_headers(token))
+
+    db.session.add(TokenBlocklist(jti=decode_token(token)['jti'], token_type='access',
+                                  expires_at=utcnow() + timedelta(minutes=30)))
+    db.session.commit()
+    assert test_client.get('/api/users/dashboard', headers=auth_headers(token)).status_code == 200
+
+    revocations.store._last_sync = None
+    assert test_client.get('/api/users/dashboard', headers=auth_headers(token)).status_code == 401
+
+def test_revocations_committed_out_of_order_are_synced(test_client):
+    """ ✅ GIVEN a revocation stamped before the last sync but committed after it, with a lower id
+        WHEN the next sync runs
+        THEN check that the token is rejected and nothing is purged from the request path
+    """
+    user = create_user()
+    token = access_token_for(user)
+    expires_at = utcnow() + timedelta(minutes=30)
+    db.session.add(TokenBlocklist(id=100, jti='committed-first', token_type='access', expires_at=expires_at))
+    db.session.add(TokenBlocklist(id=1, jti='already-expired', token_type='access',
+                                  expires_at=utcnow() - timedelta(minutes=1)))
+    db.session.commit()
+    assert test_client.get('/api/users/dashboard', headers=auth_headers(token)).status_code == 200
+
+    db.session.add(TokenBlocklist(id=50, jti=decode_token(token)['jti'], token_type='access',
+                                  expires_at=expires_at, created_at=utcnow() - timedelta(seconds=2)))
+    db.session.commit()
+    revocations.store._last_sync = None
+    assert test_client.get('/api/users/dashboard', headers=auth_headers(token)).status_code == 401
+    assert TokenBlocklist.query.filter_by(jti='already-expired').count() == 1
+
+def test_expired_entries_are_dropped_and_purged(test_client):
+    """ ✅ GIVEN blocklist rows for tokens that have already expired
+        WHEN the set syncs and the purge command runs
+        THEN check that only live revocations remain
+    """
+    user = create_user()
+    test_client.post('/api/logout', headers=auth_headers(access_token_for(user)))
+    db.session.add_all([
+        TokenBlocklist(jti='expired-access', token_type='access', expires_at=utcnow() - timedelta(minutes=1)),
+        TokenBlocklist(jti='legacy-row', created_at=datetime.utcnow() - timedelta(days=31)),
+        TokenBlocklist(jti='legacy-live', created_at=datetime.utcnow() - timedelta(days=1)),
+    ])
+    db.session.commit()
+
+    # Load them as a newly started worker would, since the rows are backdated
+    revocations.store._synced_at = revocations.store._last_sync = None
+    assert not revocations.is_revoked('expired-access')
+    assert not revocations.is_revoked('legacy-row')
+    assert revocations.is_revoked('legacy-live')
+    assert len(revocations.store) == 2
+
+    result = test_client.application.test_cli_runner().invoke(args=['tokens', 'purge'])
+    assert 'Purged 2 expired blocklist entries.' in result.output
+    remaining = [row.jti for row in TokenBlocklist.query.all()]
+    assert len(remaining) == 2 and 'legacy-live' in remaining